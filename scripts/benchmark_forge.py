@@ -0,0 +1,166 @@
+"""Compare Micheline forge/unforge against the previous recursive implementation on contract test scripts"""
+
+import json
+import timeit
+from glob import glob
+from os.path import dirname
+from os.path import join
+from typing import Dict
+from typing import List
+from typing import Union
+
+from pytezos.michelson.forge import forge_array
+from pytezos.michelson.forge import forge_int
+from pytezos.michelson.forge import forge_micheline
+from pytezos.michelson.forge import get_tag
+from pytezos.michelson.forge import prim_int
+from pytezos.michelson.forge import read_tag
+from pytezos.michelson.forge import unforge_array
+from pytezos.michelson.forge import unforge_int
+from pytezos.michelson.forge import unforge_micheline
+from pytezos.michelson.tags import prim_tags
+
+base_dir = join(dirname(dirname(__file__)), 'tests', 'contract_tests')
+
+
+def recursive_forge_micheline(data: Union[List, Dict]) -> bytes:
+    res = []
+
+    if isinstance(data, list):
+        res.append(b'\x02')
+        res.append(forge_array(b''.join(map(recursive_forge_micheline, data))))
+
+    elif isinstance(data, dict):
+        if data.get('prim'):
+            args_len = len(data.get('args', []))
+            annots_len = len(data.get('annots', []))
+
+            res.append(get_tag(args_len, annots_len))
+            res.append(prim_tags[data['prim']])
+
+            if args_len > 0:
+                args = b''.join(map(recursive_forge_micheline, data['args']))
+                if args_len < 3:
+                    res.append(args)
+                else:
+                    res.append(forge_array(args))
+
+            if annots_len > 0:
+                res.append(forge_array(' '.join(data['annots']).encode()))
+            elif args_len >= 3:
+                res.append(b'\x00' * 4)
+
+        elif data.get('bytes') is not None:
+            res.append(b'\x0a')
+            res.append(forge_array(bytes.fromhex(data['bytes'])))
+
+        elif data.get('int') is not None:
+            res.append(b'\x00')
+            res.append(forge_int(int(data['int'])))
+
+        elif data.get('string') is not None:
+            res.append(b'\x01')
+            res.append(forge_array(data['string'].encode()))
+        else:
+            raise AssertionError(data)
+    else:
+        raise AssertionError(data)
+
+    return b''.join(res)
+
+
+def recursive_unforge_micheline(data: bytes) -> Union[List, Dict]:
+    ptr = 0
+
+    def unforge_sequence():
+        nonlocal ptr
+        _, offset = unforge_array(data[ptr:])
+        end, res = ptr + offset, []
+        ptr += 4
+        while ptr < end:
+            res.append(unforge())
+        assert ptr == end, f'out of sequence boundaries'
+        return res
+
+    def unforge_prim_expr(args_len=0, annots=False):
+        nonlocal ptr
+        prim_tag = data[ptr]
+        ptr += 1
+        expr = {'prim': prim_int[prim_tag]}
+
+        if 0 < args_len < 3:
+            expr['args'] = [unforge() for _ in range(args_len)]
+        elif args_len == 3:
+            expr['args'] = unforge_sequence()
+        else:
+            assert args_len == 0, f'unexpected args len {args_len}'
+
+        if annots or args_len == 3:
+            value, offset = unforge_array(data[ptr:])
+            ptr += offset
+            if len(value) > 0:
+                expr['annots'] = value.decode().split(' ')
+
+        return expr
+
+    def unforge():
+        nonlocal ptr
+        tag = data[ptr]
+        ptr += 1
+        if tag == 0:
+            value, offset = unforge_int(data[ptr:])
+            ptr += offset
+            return {'int': str(value)}
+        elif tag == 1:
+            value, offset = unforge_array(data[ptr:])
+            ptr += offset
+            return {'string': value.decode()}
+        elif tag == 2:
+            return unforge_sequence()
+        elif 2 < tag < 10:
+            args_len, annots = read_tag(tag)
+            return unforge_prim_expr(args_len, annots)
+        elif tag == 10:
+            value, offset = unforge_array(data[ptr:])
+            ptr += offset
+            return {'bytes': value.hex()}
+        else:
+            raise AssertionError(f'unkonwn tag {tag} at position {ptr}')
+
+    result = unforge()
+    assert ptr == len(data), f'have not reach EOS (pos {ptr}/{len(data)})'
+    return result
+
+
+def load_samples() -> Dict[str, List]:
+    scripts = []
+    for filename in sorted(glob(join(base_dir, '*', '__script__.json'))):
+        with open(filename) as f:
+            script = json.load(f)
+        scripts.extend([script['code'], script['storage']])
+
+    blob = {'bytes': '00' * 1024}
+    big_values = [{'prim': 'Elt', 'args': [{'int': str(i)}, blob]} for i in range(1000)]
+    return {'scripts': scripts, 'big values': [big_values]}
+
+
+def measure(func, items, repeat: int) -> float:
+    return min(timeit.repeat(lambda: [func(x) for x in items], number=1, repeat=repeat))
+
+
+def main(repeat: int = 7) -> None:
+    for name, exprs in load_samples().items():
+        data = [recursive_forge_micheline(x) for x in exprs]
+        assert [forge_micheline(x) for x in exprs] == data
+        assert [unforge_micheline(x) for x in data] == [recursive_unforge_micheline(x) for x in data]
+
+        for op, old, new, items in [
+            ('forge', recursive_forge_micheline, forge_micheline, exprs),
+            ('unforge', recursive_unforge_micheline, unforge_micheline, data),
+        ]:
+            old_time, new_time = measure(old, items, repeat), measure(new, items, repeat)
+            print(f'{name:<12}{op:<10}{old_time * 1000:>9.2f} ms{new_time * 1000:>9.2f} ms{old_time / new_time:>7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
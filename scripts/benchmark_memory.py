@@ -0,0 +1,82 @@
+"""Measure memory retained by decoded Michelson values (run on two revisions to compare)"""
+
+import gc
+import json
+import tracemalloc
+from glob import glob
+from os.path import dirname
+from os.path import join
+from typing import Any
+from typing import Callable
+from typing import List
+from typing import Tuple
+
+from pytezos.michelson.micheline import get_script_section
+from pytezos.michelson.types.base import MichelsonType
+
+base_dir = join(dirname(dirname(__file__)), 'tests', 'contract_tests')
+
+
+def load_storages() -> List[Tuple[Any, Any]]:
+    res = []
+    for filename in sorted(glob(join(base_dir, '*', '__script__.json'))):
+        with open(filename) as f:
+            script = json.load(f)
+        res.append((get_script_section(script, name='storage'), script['storage']))
+    return res
+
+
+def make_big_storage(size: int) -> Tuple[Any, Any]:
+    type_expr = {
+        'prim': 'big_map',
+        'args': [
+            {'prim': 'nat'},
+            {'prim': 'pair', 'args': [{'prim': 'address'}, {'prim': 'nat'}, {'prim': 'string'}]},
+        ],
+    }
+    val_expr = [
+        {
+            'prim': 'Elt',
+            'args': [
+                {'int': str(i)},
+                {
+                    'prim': 'Pair',
+                    'args': [{'string': 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'}, {'int': str(i * 7)}, {'string': 'x'}],
+                },
+            ],
+        }
+        for i in range(size)
+    ]
+    return type_expr, val_expr
+
+
+def measure(func: Callable[[], Any]) -> Tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    res = func()
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del res
+    return current, peak
+
+
+def main(size: int = 100000) -> None:
+    storages = load_storages()
+    storage_types = [MichelsonType.match(type_expr) for type_expr, _ in storages]
+    big_type_expr, big_val_expr = make_big_storage(size)
+    big_type = MichelsonType.match(big_type_expr)
+
+    for name, func in [
+        (
+            'contract storages',
+            lambda: [ty.from_micheline_value(val) for ty, (_, val) in zip(storage_types, storages)],
+        ),
+        (f'big_map ({size} items)', lambda: big_type.from_micheline_value(big_val_expr)),
+    ]:
+        current, peak = measure(func)
+        print(f'{name:<24}retained{current / 2**20:>9.2f} MiB    peak{peak / 2**20:>9.2f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -5,6 +5,7 @@ from typing import Optional
 from typing import Union
 
 from pytezos.block.header import BlockHeader
+from pytezos.context.cache import BigMapCache
 from pytezos.context.mixin import ContextMixin
 from pytezos.contract.call import ContractCall
 from pytezos.contract.interface import ContractInterface
@@ -123,12 +124,14 @@ class PyTezosClient(ContextMixin, ContentMixin):
         key: Optional[Union[Key, str, dict]] = None,
         mode: Optional[str] = None,
         ipfs_gateway: Optional[str] = None,
+        big_map_cache: Optional[BigMapCache] = None,
     ):
         """Change current RPC endpoint and account (private key).
 
         :param shell: one of 'mainnet', '***net', or RPC node uri, or instance of :class:`pytezos.rpc.shell.ShellQuery`
         :param key: base58 encoded key, path to the faucet file, faucet file itself, alias from tezos-client, or `Key`
         :param mode: whether to use `readable` or `optimized` encoding for parameters/storage/other
+        :param big_map_cache: cache of big map values shared between contexts, see `BigMapCache`
         :returns: A copy of current object with changes applied
         """
         return PyTezosClient(
@@ -137,6 +140,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
                 key=key,
                 mode=mode,
                 ipfs_gateway=ipfs_gateway,
+                big_map_cache=big_map_cache,
             )
         )
 
@@ -204,6 +208,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
         time_between_blocks: Optional[int] = None,
         prev_hash: Optional[str] = None,
         block_timeout: Optional[int] = None,
+        monitor: bool = False,
     ) -> List[dict]:
         """Wait for multiple injected operations get enough confirmations
 
@@ -212,6 +217,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
         :param time_between_blocks: override the corresponding parameter from constants
         :param prev_hash: Current block hash (optional). If not set, current head is used.
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param monitor: follow the streaming monitor RPCs instead of polling the node every block
         """
         if len(operation_groups) == 0:
             raise ValueError('At least one operation group has to be passed to the args')
@@ -229,6 +235,7 @@ class PyTezosClient(ContextMixin, ContentMixin):
             current_block_hash=prev_hash,
             time_between_blocks=time_between_blocks,
             block_timeout=block_timeout,
+            monitor=monitor,
         )
 
     def sleep(
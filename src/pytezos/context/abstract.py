@@ -1,4 +1,5 @@
 from hashlib import blake2b  # type: ignore
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -159,6 +160,9 @@ class AbstractContext:
     def get_big_map_value(self, ptr: int, key_hash: str):
         raise NotImplementedError
 
+    def prefetch_big_map_values(self, ptr: int, key_hashes: Iterable[str]) -> int:
+        raise NotImplementedError
+
     def register_sapling_state(self, ptr: int):
         raise NotImplementedError
 
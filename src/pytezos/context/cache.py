@@ -0,0 +1,129 @@
+from collections import OrderedDict
+from threading import Lock
+from time import monotonic
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+DEFAULT_BIG_MAP_CACHE_SIZE = 65536
+DEFAULT_HEAD_TTL = 5.0
+
+BigMapCacheKey = Tuple[str, int, str]
+
+
+class BigMapCache:
+    """Read-through cache of big map values fetched from the node, shared between execution contexts.
+
+    Entries are keyed by (block hash, big map ID, key hash), hence never go stale; least recently used ones are
+    evicted. Missing keys are cached as well (unless disabled), so that repeated lookups of absent entries do not hit
+    the node either. Values are Micheline expressions shared between readers, callers must not mutate them.
+    Relative block IDs (e.g. `head`) are resolved to hashes at most once per `head_ttl`, so that contexts created
+    in a row (e.g. by `Interpreter.run_code`) do not ask the node for the head block each time.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_BIG_MAP_CACHE_SIZE,
+        negative: bool = True,
+        head_ttl: float = DEFAULT_HEAD_TTL,
+    ) -> None:
+        """
+        :param maxsize: max number of entries (including missing keys)
+        :param negative: also cache keys that do not exist in the big map
+        :param head_ttl: how long (in seconds) a relative block ID keeps resolving to the same hash, 0 to disable
+        """
+        self.maxsize = maxsize
+        self.negative = negative
+        self.head_ttl = head_ttl
+        self._blocks: Dict[Any, Tuple[str, float]] = {}
+        self.hits = 0
+        self.misses = 0
+        self._items: 'OrderedDict[BigMapCacheKey, Optional[Any]]' = OrderedDict()
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nStats',
+            *(f'{k}\t{v}' for k, v in self.stats().items()),
+        ]
+        return '\n'.join(res)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: BigMapCacheKey) -> bool:
+        return key in self._items
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'size': len(self._items),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters."""
+        with self._lock:
+            self._items.clear()
+            self._blocks.clear()
+            self.hits = self.misses = 0
+
+    def resolve_block(self, key: Any, resolve: Callable[[], str]) -> str:
+        """Get hash of the block a relative ID points to, reusing the result for `head_ttl` seconds.
+
+        :param key: relative block ID along with the node it is resolved on
+        :param resolve: function querying the node for the block hash
+        """
+        now = monotonic()
+        with self._lock:
+            block = self._blocks.get(key)
+        if block is not None and now - block[1] < self.head_ttl:
+            return block[0]
+        block_hash = resolve()
+        with self._lock:
+            self._blocks[key] = (block_hash, now)
+        return block_hash
+
+    def get(self, key: BigMapCacheKey) -> Tuple[bool, Optional[Any]]:
+        """Look up big map value, updates hit/miss counters.
+
+        :param key: tuple(block hash, big map ID, key hash)
+        :returns: tuple(whether the key is cached, value expression or None if the key does not exist)
+        """
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return True, self._items[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key: BigMapCacheKey, value: Optional[Any]) -> None:
+        """Save big map value.
+
+        :param key: tuple(block hash, big map ID, key hash)
+        :param value: value expression, None if the key does not exist
+        """
+        if value is None and not self.negative:
+            return
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
@@ -1,13 +1,17 @@
 from datetime import datetime
 from itertools import chain
 from typing import Any
+from typing import Dict
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
 
 from pytezos.context.abstract import AbstractContext
 from pytezos.context.abstract import get_originated_address
+from pytezos.context.cache import BigMapCache
 from pytezos.crypto.encoding import base58_encode
+from pytezos.crypto.encoding import is_bh
 from pytezos.crypto.key import Key
 from pytezos.logging import logger
 from pytezos.michelson.forge import forge_micheline
@@ -17,11 +21,18 @@ from pytezos.michelson.micheline import get_script_sections
 from pytezos.operation import DEFAULT_OPERATIONS_TTL
 from pytezos.operation import MAX_OPERATIONS_TTL
 from pytezos.rpc.errors import RpcError
+from pytezos.rpc.search import DEFAULT_CONCURRENCY
+from pytezos.rpc.search import prefetch
 from pytezos.rpc.shell import ShellQuery
 
 DEFAULT_IPFS_GATEWAY = 'https://ipfs.io/ipfs'
 
 
+def is_not_found(error: RpcError) -> bool:
+    """Check if node responded with 404 (e.g. big map key does not exist) rather than failed."""
+    return bool(error.args) and str(error.args[0]).startswith('Not found')
+
+
 class ExecutionContext(AbstractContext):
     def __init__(
         self,
@@ -47,6 +58,7 @@ class ExecutionContext(AbstractContext):
         ipfs_gateway=None,
         global_constants=None,
         view_results=None,
+        big_map_cache=None,
     ):
         self.key: Optional[Key] = key
         self.shell: Optional[ShellQuery] = shell
@@ -94,10 +106,27 @@ class ExecutionContext(AbstractContext):
         self._sandboxed: Optional[bool] = None
         self.ipfs_gateway = (ipfs_gateway or DEFAULT_IPFS_GATEWAY).rstrip('/')
         self.storage_value = script.get('storage') if script else None
+        self.big_map_cache: Optional[BigMapCache] = big_map_cache
+        self._block_hash: Optional[str] = None
 
     def __copy__(self):
         raise ValueError("It's not allowed to copy context")
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Save context state so that it can be restored later.
+
+        Only the containers are copied (big map registry, global constants, etc), the rest is shared.
+        """
+        return {k: v.copy() if isinstance(v, (dict, list)) else v for k, v in self.__dict__.items()}
+
+    def restore(self, snapshot: Dict[str, Any]) -> None:
+        """Roll context back to the saved state (in place, so that values keep referencing it).
+
+        :param snapshot: result of `snapshot()`
+        """
+        self.__dict__.clear()
+        self.__dict__.update({k: v.copy() if isinstance(v, (dict, list)) else v for k, v in snapshot.items()})
+
     @property
     def script(self) -> Optional[dict]:
         if self.parameter_expr and self.storage_expr and self.code_expr:
@@ -323,12 +352,87 @@ class ExecutionContext(AbstractContext):
         ptr, _ = self.big_maps[ptr]
         if ptr < 0:
             return None
+        if self.big_map_cache is None:
+            try:
+                return self._query_big_map_value(self.block_id, ptr, key_hash)
+            except RpcError:
+                return None  # TODO: special exception/value | Key does not exist
+
+        block_hash = self.get_block_hash()
+        hit, value = self.big_map_cache.get((block_hash, ptr, key_hash))
+        if hit:
+            return value
+        return self._load_big_map_value(block_hash, ptr, key_hash)
+
+    def prefetch_big_map_values(
+        self, ptr: int, key_hashes: Iterable[str], concurrency: int = DEFAULT_CONCURRENCY
+    ) -> int:
+        """Load big map values into the cache concurrently, e.g. before interpreting many calls.
+
+        :param ptr: big map ID (either on-chain or registered in this context)
+        :param key_hashes: script expression hashes of the keys
+        :param concurrency: max number of requests in flight
+        :returns: number of values requested from the node (the rest were already cached)
+        """
+        if self.big_map_cache is None:
+            raise ValueError('Big map cache is not enabled')
+        if ptr in self.big_maps:
+            ptr, _ = self.big_maps[ptr]
+        if self.tzt or ptr < 0:
+            return 0
+        block_hash = self.get_block_hash()
+        missing = [h for h in dict.fromkeys(key_hashes) if (block_hash, ptr, h) not in self.big_map_cache]
+        for _ in prefetch(lambda h: self._load_big_map_value(block_hash, ptr, h), missing, concurrency=concurrency):
+            pass
+        return len(missing)
+
+    def get_block_hash(self) -> str:
+        """Get hash of the block this context is pinned to (resolve block ID on first call).
+
+        Cached big map values are bound to that block, so that all lookups see the same state.
+        """
+        if self._block_hash is None:
+            return self.pin_block()
+        return self._block_hash
+
+    def pin_block(self) -> str:
+        """Resolve block ID to hash anew (relative IDs like `head` point to different blocks over time) and bind
+        subsequent big map lookups to that block. Fetch contract storage at the returned hash so that it matches.
+        """
+        if is_bh(str(self.block_id)):
+            block_hash = str(self.block_id)
+        elif self.shell is None:
+            raise ValueError(f'Shell is undefined, cannot connect to network')
+        elif self.big_map_cache is None:
+            block_hash = self.shell.blocks[self.block_id].hash()
+        else:
+            block_hash = self.big_map_cache.resolve_block(
+                key=(str(self.shell.node.uri), self.block_id),
+                resolve=self.shell.blocks[self.block_id].hash,
+            )
+        self._block_hash = block_hash
+        return block_hash
+
+    def get_storage_block_id(self):
+        """Get block ID to fetch contract storage at: the pinned block hash if big map cache is enabled."""
+        return self.block_id if self.big_map_cache is None else self.pin_block()
+
+    def _query_big_map_value(self, block_id, ptr: int, key_hash: str):
         if self.shell is None:
             raise ValueError(f'Shell is undefined, cannot connect to network')
+        return self.shell.blocks[block_id].context.big_maps[ptr][key_hash]()
+
+    def _load_big_map_value(self, block_hash: str, ptr: int, key_hash: str):
+        assert self.big_map_cache is not None
         try:
-            return self.shell.blocks[self.block_id].context.big_maps[ptr][key_hash]()
-        except RpcError:
-            return None  # TODO: special exception/value | Key does not exist
+            value = self._query_big_map_value(block_hash, ptr, key_hash)
+        except RpcError as e:
+            # NOTE: only a missing key is cached, other errors (e.g. node unavailable) are retried next time
+            if is_not_found(e):
+                self.big_map_cache.put((block_hash, ptr, key_hash), None)
+            return None
+        self.big_map_cache.put((block_hash, ptr, key_hash), value)
+        return value
 
     def register_sapling_state(self, ptr: int):
         raise NotImplementedError
@@ -5,6 +5,7 @@ from typing import Dict
 from typing import Optional
 from typing import Union
 
+from pytezos.context.cache import BigMapCache
 from pytezos.context.impl import ExecutionContext
 from pytezos.crypto.encoding import is_pkh
 from pytezos.crypto.encoding import is_public_key
@@ -136,6 +137,7 @@ class ContextMixin(metaclass=InlineDocstring):
         ipfs_gateway: Optional[str] = None,
         balance: Optional[int] = None,
         view_results: Optional[Dict[str, Any]] = None,
+        big_map_cache: Optional[BigMapCache] = None,
     ) -> ExecutionContext:
         if isinstance(shell, str):
             if shell.endswith('.pool'):
@@ -181,4 +183,5 @@ class ContextMixin(metaclass=InlineDocstring):
             ipfs_gateway=ipfs_gateway,
             balance=balance or self.context.balance,
             view_results=view_results,
+            big_map_cache=big_map_cache if big_map_cache is not None else self.context.big_map_cache,
         )
@@ -154,6 +154,8 @@ class ContractCall(ContextMixin):
         now=None,
         self_address=None,
         view_results: Optional[Dict[str, Any]] = None,
+        compiled=False,
+        trace=True,
     ) -> ContractCallResult:
         """Run code in the builtin REPL (WARNING! Not recommended for critical tasks).
 
@@ -167,6 +169,8 @@ class ContractCall(ContextMixin):
         :param now: patch NOW
         :param self_address: patch SELF/SELF_ADDRESS
         :param view_results: patch VIEW calls (keys must be string "address%view", values => Python objects)
+        :param compiled: run compiled code (same results, faster on loops)
+        :param trace: collect execution trace (logged on error), turn off to save time on long runs
         :rtype: pytezos.contract.result.ContractCallResult
         """
         storage_ty = StorageSection.match(self.context.storage_expr)
@@ -189,6 +193,8 @@ class ContractCall(ContextMixin):
             now=now,
             address=self_address,
             view_results=view_results,
+            compiled=compiled,
+            trace=trace,
         )
         if error:
             logger.debug('\n'.join(stdout))
@@ -282,7 +288,8 @@ class ContractCall(ContextMixin):
             storage_ty = StorageSection.match(self.context.storage_expr)
             initial_storage = storage_ty.from_python_object(storage).to_micheline_value(lazy_diff=True)
         elif self.address:
-            initial_storage = self.shell.blocks[self.context.block_id].context.contracts[self.address].storage()
+            block_id = self.context.get_storage_block_id()
+            initial_storage = self.shell.blocks[block_id].context.contracts[self.address].storage()
         else:
             storage_ty = StorageSection.match(self.context.storage_expr)
             initial_storage = storage_ty.dummy(self.context).to_micheline_value(lazy_diff=True)
@@ -1,3 +1,5 @@
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Union
 
@@ -6,6 +8,11 @@ from deprecation import deprecated  # type: ignore
 from pytezos.context.impl import ExecutionContext
 from pytezos.context.mixin import ContextMixin
 from pytezos.jupyter import get_class_docstring
+from pytezos.michelson.converter import compile_decoder
+from pytezos.michelson.converter import compile_encoder
+from pytezos.michelson.converter import compile_to_python
+from pytezos.michelson.converter import decode_many
+from pytezos.michelson.converter import encode_many
 from pytezos.michelson.format import micheline_to_michelson
 from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.types.base import MichelsonType
@@ -47,7 +54,7 @@ class ContractData(ContextMixin):
 
         :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
         """
-        return self.data.to_python_object(try_unpack=try_unpack)
+        return compile_to_python(type(self.data), try_unpack=try_unpack)(self.data)
 
     def to_micheline(self, optimized=False):
         """Get as Micheline JSON expression
@@ -71,7 +78,7 @@ class ContractData(ContextMixin):
         """
         if isinstance(value, str):
             value = michelson_to_micheline(value)
-        return type(self.data).from_micheline_value(value).to_python_object(lazy_diff=None)
+        return compile_decoder(type(self.data), lazy_diff=None)(value)
 
     def encode(self, py_obj, mode: Optional[str] = None):
         """Convert from Python to Micheline type system
@@ -80,11 +87,28 @@ class ContractData(ContextMixin):
         :param mode: whether to use `readable` or `optimized` (or `legacy_optimized`) encoding
         :return: Micheline JSON expression
         """
-        return (
-            type(self.data)
-            .from_python_object(py_obj)
-            .to_micheline_value(mode=mode or self.context.mode, lazy_diff=None)
-        )
+        return compile_encoder(type(self.data), mode=mode or self.context.mode, lazy_diff=None)(py_obj)
+
+    def decode_many(self, values: Iterable, processes: Optional[int] = None) -> List:
+        """Convert many values from Michelson or Micheline to Python type system in one pass
+
+        :param values: list or iterator of Micheline JSON expressions or Michelson values
+        :param processes: spread the work across a pool of that many processes (for very large batches)
+        :return: list of Python objects, same as `decode` would return for each value
+        """
+        exprs = (michelson_to_micheline(value) if isinstance(value, str) else value for value in values)
+        return decode_many(type(self.data), exprs, lazy_diff=None, processes=processes)
+
+    def encode_many(self, py_objs: Iterable, mode: Optional[str] = None, processes: Optional[int] = None) -> List:
+        """Convert many values from Python to Micheline type system in one pass
+
+        :param py_objs: list or iterator of Python objects
+        :param mode: whether to use `readable` or `optimized` (or `legacy_optimized`) encoding
+        :param processes: spread the work across a pool of that many processes (for very large batches)
+        :return: list of Micheline JSON expressions, same as `encode` would return for each object
+        """
+        mode = mode or self.context.mode
+        return encode_many(type(self.data), py_objs, mode=mode, lazy_diff=None, processes=processes)
 
     def dummy(self):
         """Try to generate a dummy (empty) value
@@ -1,6 +1,8 @@
 from pprint import pformat
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import List
 from typing import Optional
 from typing import Union
 
@@ -9,6 +11,8 @@ from pytezos.context.mixin import ExecutionContext
 from pytezos.contract.call import ContractCall
 from pytezos.jupyter import get_class_docstring
 from pytezos.logging import logger
+from pytezos.michelson.converter import decode_parameters_many
+from pytezos.michelson.converter import encode_parameters_many
 from pytezos.michelson.micheline import MichelsonRuntimeError
 from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.sections.parameter import ParameterSection
@@ -83,3 +87,38 @@ class ContractEntrypoint(ContextMixin):
         except MichelsonRuntimeError as e:
             logger.info(self.__doc__)
             raise ValueError(f'Unexpected arguments: {pformat(py_obj)}', *e.args) from e
+
+    def decode_many(
+        self,
+        values: Iterable[Union[str, Dict[str, Any]]],
+        entrypoint: Optional[str] = None,
+        processes: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Convert many transaction parameters of the same entrypoint from Michelson to Python type system in one pass
+
+        :param values: list or iterator of Micheline JSON expressions or Michelson values
+        :param entrypoint: overwrite current entrypoint (in case you want to parse tx parameters)
+        :param processes: spread the work across a pool of that many processes (for very large batches)
+        :return: list of Python objects, same as `decode` would return for each value
+        """
+        if entrypoint is None:
+            entrypoint = self.entrypoint
+        param_ty = ParameterSection.match(self.context.parameter_expr)
+        exprs = (michelson_to_micheline(value) if isinstance(value, str) else value for value in values)
+        return decode_parameters_many(param_ty, entrypoint, exprs, processes=processes)
+
+    def encode_many(self, py_objs: Iterable, mode: Optional[str] = None, processes: Optional[int] = None) -> List[dict]:
+        """Encode many transaction parameters of the entrypoint from the given Python objects in one pass
+
+        :param py_objs: list or iterator of Python objects
+        :param mode: whether to use `readable` or `optimized` (or `legacy_optimized`) encoding
+        :param processes: spread the work across a pool of that many processes (for very large batches)
+        :return: list of {entrypoint, value}, same as `encode` would return for each object
+        """
+        try:
+            param_ty = ParameterSection.match(self.context.parameter_expr)
+            mode = mode or self.context.mode
+            return encode_parameters_many(param_ty, self.entrypoint, py_objs, mode=mode, processes=processes)
+        except MichelsonRuntimeError as e:
+            logger.info(self.__doc__)
+            raise ValueError('Unexpected arguments', *e.args) from e
@@ -10,6 +10,7 @@ from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 from typing import cast
@@ -18,6 +19,7 @@ from urllib.parse import urlparse
 import requests
 from deprecation import deprecated  # type: ignore
 
+from pytezos.context.cache import BigMapCache
 from pytezos.context.mixin import ContextMixin
 from pytezos.context.mixin import ExecutionContext
 from pytezos.contract.data import ContractData
@@ -36,10 +38,13 @@ from pytezos.michelson.program import MichelsonProgram
 from pytezos.michelson.sections import ViewSection
 from pytezos.michelson.types import BigMapType
 from pytezos.michelson.types import BytesType
+from pytezos.michelson.types import MichelsonType
 from pytezos.michelson.types.base import generate_pydoc
 from pytezos.operation.group import OperationGroup
 from pytezos.rpc import ShellQuery
 
+DEFAULT_INTERFACE_CACHE_SIZE = 1024
+
 
 class ContractTokenMetadataProxy:
     """Get TZIP-21 contract token metadata by token_id"""
@@ -51,6 +56,35 @@ class ContractTokenMetadataProxy:
         return self._fn(item)
 
 
+@lru_cache(maxsize=DEFAULT_INTERFACE_CACHE_SIZE)
+def get_entrypoint_table(program: Type[MichelsonProgram]) -> Dict[str, Tuple[Type[MichelsonType], str]]:
+    """Get entrypoint types and docstrings, cached per program type."""
+    return {name: (ty, generate_pydoc(ty, name)) for name, ty in program.parameter.list_entrypoints().items()}
+
+
+@lru_cache(maxsize=DEFAULT_INTERFACE_CACHE_SIZE)
+def get_view_table(program: Type[MichelsonProgram]) -> Dict[str, Tuple[Type[ViewSection], Dict[str, Any], str]]:
+    """Get view types, ContractView arguments and docstrings, cached per program type."""
+    return {
+        view.name: (
+            view,
+            {
+                'parameter': view.args[1].as_micheline_expr(),
+                'return_type': view.args[2].as_micheline_expr(),
+                'code': view.args[3].as_micheline_expr(),  # type: ignore
+            },
+            view.generate_pydoc(),  # type: ignore
+        )
+        for view in program.views
+    }
+
+
+@lru_cache(maxsize=DEFAULT_INTERFACE_CACHE_SIZE)
+def get_interface_type(program: Type[MichelsonProgram]) -> Type['ContractInterface']:
+    """Get ContractInterface class bound to the program type."""
+    return type(ContractInterface.__name__, (ContractInterface,), {'program': program})
+
+
 class ContractInterface(ContextMixin):
     """Proxy class for interacting with a contract."""
 
@@ -60,26 +94,22 @@ class ContractInterface(ContextMixin):
         super().__init__(context=context)
         self._logger = logging.getLogger(__name__)
         self._storage: Optional[ContractData] = None
-        self.entrypoints = self.program.parameter.list_entrypoints()
-        self.views = {view.name: view for view in self.program.views}  # type: Dict[str, Type[ViewSection]]
+        entrypoint_table = get_entrypoint_table(self.program)
+        view_table = get_view_table(self.program)
+        self.entrypoints = {name: ty for name, (ty, _) in entrypoint_table.items()}
+        self.views: Dict[str, Type[ViewSection]] = {name: view_ty for name, (view_ty, _, _) in view_table.items()}
 
-        for entrypoint, ty in self.entrypoints.items():
+        for entrypoint, (_, docstring) in entrypoint_table.items():
             if entrypoint == 'token_metadata':
                 continue
             attr = ContractEntrypoint(context=context, entrypoint=entrypoint)
-            attr.__doc__ = generate_pydoc(ty, entrypoint)
+            attr.__doc__ = docstring
             assert not hasattr(self, entrypoint), f'Entrypoint name collision {entrypoint}'
             setattr(self, entrypoint, attr)
 
-        for view_name, view_ty in self.views.items():
-            view_attr = ContractView(
-                context=context,
-                name=view_name,
-                parameter=view_ty.args[1].as_micheline_expr(),
-                return_type=view_ty.args[2].as_micheline_expr(),
-                code=view_ty.args[3].as_micheline_expr(),  # type: ignore
-            )
-            view_attr.__doc__ = view_ty.generate_pydoc()  # type: ignore
+        for view_name, (_, view_kwargs, docstring) in view_table.items():
+            view_attr = ContractView(context=context, name=view_name, **view_kwargs)
+            view_attr.__doc__ = docstring
             assert not hasattr(self, view_name), f'View name collision {view_name}'
             setattr(self, view_name, view_attr)
 
@@ -150,12 +180,13 @@ class ContractInterface(ContextMixin):
         else:
             code_expr = expression
         program = MichelsonProgram.match(code_expr)
-        cls = type(ContractInterface.__name__, (ContractInterface,), {'program': program})
+        cls = get_interface_type(program)
         context = ExecutionContext(
             shell=context.shell if context else None,
             key=context.key if context else None,
             script={'code': code_expr},
             global_constants=context.global_constants if context else None,
+            big_map_cache=context.big_map_cache if context else None,
         )
         return cls(context)
 
@@ -167,8 +198,7 @@ class ContractInterface(ContextMixin):
         :return: ContractInterface
         """
         program = MichelsonProgram.load(context, with_code=True)
-        cls = type(ContractInterface.__name__, (ContractInterface,), {'program': program})
-        return cls(context)
+        return get_interface_type(program)(context)
 
     @classmethod
     @deprecated(
@@ -236,6 +266,7 @@ class ContractInterface(ContextMixin):
         block_id: Optional[Union[str, int]] = None,
         mode: Optional[str] = None,
         ipfs_gateway: Optional[str] = None,
+        big_map_cache: Optional[BigMapCache] = None,
     ) -> 'ContractInterface':
         """Change the block at which the current contract is inspected.
 
@@ -246,6 +277,7 @@ class ContractInterface(ContextMixin):
         :param block_id: block height / hash / offset to use, default is `head`
         :param mode: whether to use `readable` or `optimized` encoding for parameters/storage/other
         :param ipfs_gateway: override IPFS gateway URI
+        :param big_map_cache: cache of big map values shared between contexts, see `BigMapCache`
         :rtype: ContractInterface
         """
         has_address = self.context.address is not None
@@ -257,6 +289,7 @@ class ContractInterface(ContextMixin):
                 block_id=block_id,
                 mode=mode,
                 ipfs_gateway=ipfs_gateway,
+                big_map_cache=big_map_cache,
             )
         )
 
@@ -265,7 +298,7 @@ class ContractInterface(ContextMixin):
         if self._storage:
             return self._storage
         elif self.address:
-            expr = self.shell.blocks[self.context.block_id].context.contracts[self.address].storage()
+            expr = self.shell.blocks[self.context.get_storage_block_id()].context.contracts[self.address].storage()
             storage = self.program.storage.from_micheline_value(expr)
             storage.attach_context(self.context)
         else:
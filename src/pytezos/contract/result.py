@@ -1,14 +1,38 @@
+from functools import cached_property
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Optional
 
 from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.lazy_diff import LazyDiffIndex
 from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.types.base import MichelsonType
 from pytezos.operation.result import OperationResult
 
 
 class ContractCallResult(OperationResult):
-    """Encapsulates the result of a contract invocation."""
+    """Encapsulates the result of a contract invocation.
+
+    `storage_value` is the resulting storage with big map updates merged in, they are decoded only when accessed
+    (e.g. `ContractData(context, res.storage_value)['ledger'][key]()`); `storage` is converted to Python on first use.
+    """
+
+    def __init__(
+        self,
+        storage_value: Optional[MichelsonType] = None,
+        storage_lazy_diff: Optional[bool] = False,
+        **props,
+    ) -> None:
+        super().__init__(**props)
+        if storage_value is not None:
+            self.storage_value = storage_value
+            self.storage_lazy_diff = storage_lazy_diff
+            self.props.update(storage=storage_value, storage_value=storage_value)
+
+    @cached_property
+    def storage(self) -> Any:
+        return self.storage_value.to_python_object(lazy_diff=self.storage_lazy_diff)
 
     @classmethod
     def from_run_operation(
@@ -40,8 +64,8 @@ class ContractCallResult(OperationResult):
                 storage = program.storage.from_micheline_value(res.storage)  # type: ignore
                 if hasattr(res, 'lazy_diff'):
                     kwargs.update(lazy_diff=res.lazy_diff)  # type: ignore
-                    storage = storage.merge_lazy_diff(res.lazy_diff)  # type: ignore
-                kwargs.update(storage=storage.to_python_object())
+                    storage = storage.merge_lazy_diff(LazyDiffIndex(res.lazy_diff))  # type: ignore
+                kwargs.update(storage_value=storage.item)
             if hasattr(res, 'parameters'):
                 parameters = program.parameter.from_parameters(res.parameters)  # type: ignore
                 kwargs.update(parameters=parameters)
@@ -63,10 +87,11 @@ class ContractCallResult(OperationResult):
         program = MichelsonProgram.load(context)
         parameters = program.parameter.from_parameters(parameters)
         storage = program.storage.from_micheline_value(response['storage'])
-        extended_storage = storage.merge_lazy_diff(response.get('lazy_storage_diff', []))
+        extended_storage = storage.merge_lazy_diff(LazyDiffIndex(response.get('lazy_storage_diff', [])))
         return cls(
             parameters=parameters.to_python_object(),
-            storage=extended_storage.to_python_object(lazy_diff=True),
+            storage_value=extended_storage.item,
+            storage_lazy_diff=True,
             lazy_diff=response.get('lazy_storage_diff', []),
             operations=response.get('operations', []),
         )
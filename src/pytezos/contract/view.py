@@ -294,12 +294,19 @@ class ContractViewCall(ContextMixin):
             raise error
         return storage  # type: ignore
 
-    def onchain_view(self, storage=None, balance=None, view_results: Optional[Dict[str, Any]] = None):
+    def onchain_view(
+        self,
+        storage=None,
+        balance=None,
+        view_results: Optional[Dict[str, Any]] = None,
+        trace=True,
+    ):
         """Get return value of an on-chain view (not supporting external view calls).
 
         :param storage: override current contract storage (as Python object)
         :param balance: patch BALANCE
         :param view_results: patch VIEW calls (keys must be string "address%view", values => Python objects)
+        :param trace: collect execution trace (logged on error)
         :returns: Decoded return value
         """
         ret, stdout, error = Interpreter.run_view(
@@ -314,6 +321,7 @@ class ContractViewCall(ContextMixin):
                 },
                 view_results=view_results,
             ),
+            trace=trace,
         )
         if error:
             logger.debug('\n'.join(stdout))
@@ -0,0 +1,340 @@
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Type
+from typing import cast
+
+from pytezos.context.abstract import AbstractContext
+from pytezos.michelson.instructions.base import MichelsonInstruction
+from pytezos.michelson.instructions.base import Wildcard
+from pytezos.michelson.instructions.base import format_stdout
+from pytezos.michelson.instructions.control import DipInstruction
+from pytezos.michelson.instructions.control import DipnInstruction
+from pytezos.michelson.instructions.control import IfConsInstruction
+from pytezos.michelson.instructions.control import IfInstruction
+from pytezos.michelson.instructions.control import IfLeftInstruction
+from pytezos.michelson.instructions.control import IfNoneInstruction
+from pytezos.michelson.instructions.control import IterInstruction
+from pytezos.michelson.instructions.control import LoopInstruction
+from pytezos.michelson.instructions.control import LoopLeftInstruction
+from pytezos.michelson.instructions.control import MapInstruction
+from pytezos.michelson.instructions.stack import DigInstruction
+from pytezos.michelson.instructions.stack import DropInstruction
+from pytezos.michelson.instructions.stack import DropnInstruction
+from pytezos.michelson.instructions.stack import DugInstruction
+from pytezos.michelson.instructions.stack import DupInstruction
+from pytezos.michelson.instructions.stack import DupnInstruction
+from pytezos.michelson.instructions.stack import PushInstruction
+from pytezos.michelson.instructions.stack import SwapInstruction
+from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.micheline import MichelineSequence
+from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.micheline import catch
+from pytezos.michelson.stack import MichelsonStack
+from pytezos.michelson.types import BoolType
+from pytezos.michelson.types import ListType
+from pytezos.michelson.types import MapType
+from pytezos.michelson.types import OptionType
+from pytezos.michelson.types import OrType
+from pytezos.michelson.types import PairType
+
+Executor = Callable[[MichelsonStack, List[str], AbstractContext], None]
+
+compilers: Dict[Type[Micheline], Callable[[Type[Micheline]], Executor]] = {}
+
+
+def compiler(*instructions: Type[Micheline]):
+    def register(func: Callable[[Type[Micheline]], Executor]):
+        for instruction in instructions:
+            compilers[instruction] = func
+        return func
+
+    return register
+
+
+def compile_code(code: Type[Micheline]) -> Executor:
+    """Turn instruction tree into a tree of closures with operands and branches bound in advance.
+
+    Compiled code has the same effect on stack, stdout, and context as `code.execute`, and raises the same errors,
+    but does not build the execution tree (instruction instances). Instructions without a dedicated compiler
+    (or with invalid operands) are executed as is.
+
+    :param code: instruction or sequence type
+    """
+    for base in code.__mro__:
+        compile_instruction = compilers.get(base)
+        if compile_instruction is not None:
+            try:
+                return compile_instruction(code)
+            except (AssertionError, MichelsonRuntimeError):
+                break  # NOTE: invalid operands (e.g. non-pushable PUSH), error is raised at runtime as usual
+    return cast(Executor, code.execute)
+
+
+@compiler(MichelineSequence)
+def compile_sequence(cls: Type[Micheline]) -> Executor:
+    ops = tuple(compile_code(arg) for arg in cls.args)
+    if len(ops) == 1:
+        return ops[0]
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        for op in ops:
+            op(stack, stdout, context)
+
+    return run
+
+
+@compiler(PushInstruction)
+def compile_push(cls: Type[Micheline]) -> Executor:
+    res_type, literal = cls.args
+    assert res_type.is_pushable(), f'{res_type.prim} contains non-pushable arguments'
+    res = res_type.from_literal(literal)  # NOTE: values are immutable, so the same one can be pushed every time
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        stack.push(res)
+        stdout.append(format_stdout(prim, [], [res]))  # type: ignore
+
+    return run
+
+
+@compiler(DropInstruction, DupInstruction, SwapInstruction)
+def compile_stack_op(cls: Type[Micheline]) -> Executor:
+    prim = cls.prim
+    if issubclass(cls, DropInstruction):
+
+        def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+            dropped = stack.pop1()
+            stdout.append(format_stdout(prim, [dropped], []))  # type: ignore
+
+    elif issubclass(cls, DupInstruction):
+
+        def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+            res = stack.peek().duplicate()
+            stack.push(res)
+            stdout.append(format_stdout(prim, [res], [res, res]))  # type: ignore
+
+    else:
+
+        def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+            a, b = stack.pop2()
+            stack.push(a)
+            stack.push(b)
+            stdout.append(format_stdout(prim, [a, b], [b, a]))  # type: ignore
+
+    return catch(prim, run)
+
+
+@compiler(DropnInstruction, DupnInstruction, DigInstruction, DugInstruction)
+def compile_stack_op_n(cls: Type[Micheline]) -> Executor:
+    count = cls.args[0].get_int()  # type: ignore
+    prim = cls.prim
+    if issubclass(cls, DropnInstruction):
+
+        def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+            dropped = stack.pop(count=count)
+            stdout.append(format_stdout(prim, dropped, [], count))  # type: ignore
+
+    elif issubclass(cls, DupnInstruction):
+        depth = count - 1
+
+        def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+            stack.protect(count=depth)
+            res = stack.peek().duplicate()
+            stack.restore(count=depth)
+            stack.push(res)
+            stdout.append(format_stdout(prim, [*Wildcard.n(depth), res], [res, *Wildcard.n(depth), res], depth))  # type: ignore
+
+    elif issubclass(cls, DigInstruction):
+
+        def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+            stack.protect(count=count)
+            res = stack.pop1()
+            stack.restore(count=count)
+            stack.push(res)
+            stdout.append(format_stdout(prim, [*Wildcard.n(count), res], [res, *Wildcard.n(count)], count))  # type: ignore
+
+    else:
+
+        def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+            res = stack.pop1()
+            stack.protect(count=count)
+            stack.push(res)
+            stack.restore(count=count)
+            stdout.append(format_stdout(prim, [res, *Wildcard.n(count)], [*Wildcard.n(count), res], count))  # type: ignore
+
+    return catch(prim, run)
+
+
+@compiler(DipInstruction, DipnInstruction)
+def compile_dip(cls: Type[Micheline]) -> Executor:
+    if issubclass(cls, DipnInstruction):
+        count, body = cls.args[0].get_int(), compile_code(cls.args[1])  # type: ignore
+    else:
+        count, body = 1, compile_code(cls.args[0])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        stdout.append(format_stdout(prim, [*Wildcard.n(count)], []))  # type: ignore
+        stack.protect(count=count)
+        body(stack, stdout, context)
+        stack.restore(count=count)
+        stdout.append(format_stdout(prim, [], [*Wildcard.n(count)], count))  # type: ignore
+
+    return catch(prim, run)
+
+
+@compiler(IfInstruction)
+def compile_if(cls: Type[Micheline]) -> Executor:
+    then_branch, else_branch = compile_code(cls.args[0]), compile_code(cls.args[1])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        cond = stack.pop1()
+        cond.assert_type_equal(BoolType)
+        stdout.append(format_stdout(prim, [cond], []))  # type: ignore
+        branch = then_branch if bool(cond) else else_branch
+        branch(stack, stdout, context)
+
+    return catch(prim, run)
+
+
+@compiler(IfConsInstruction)
+def compile_if_cons(cls: Type[Micheline]) -> Executor:
+    cons_branch, nil_branch = compile_code(cls.args[0]), compile_code(cls.args[1])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        lst = cast(ListType, stack.pop1())
+        lst.assert_type_in(ListType)
+        if len(lst) > 0:
+            head, tail = lst.split_head()
+            stack.push(tail)
+            stack.push(head)
+            stdout.append(format_stdout(prim, [lst], [head, tail]))  # type: ignore
+            cons_branch(stack, stdout, context)
+        else:
+            stdout.append(format_stdout(prim, [lst], []))  # type: ignore
+            nil_branch(stack, stdout, context)
+
+    return catch(prim, run)
+
+
+@compiler(IfLeftInstruction)
+def compile_if_left(cls: Type[Micheline]) -> Executor:
+    left_branch, right_branch = compile_code(cls.args[0]), compile_code(cls.args[1])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        or_ = cast(OrType, stack.pop1())
+        or_.assert_type_in(OrType)
+        branch = left_branch if or_.is_left() else right_branch
+        res = or_.resolve()
+        stack.push(res)
+        stdout.append(format_stdout(prim, [or_], [res]))  # type: ignore
+        branch(stack, stdout, context)
+
+    return catch(prim, run)
+
+
+@compiler(IfNoneInstruction)
+def compile_if_none(cls: Type[Micheline]) -> Executor:
+    none_branch, some_branch = compile_code(cls.args[0]), compile_code(cls.args[1])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        opt = cast(OptionType, stack.pop1())
+        opt.assert_type_in(OptionType)
+        if opt.is_none():
+            stdout.append(format_stdout(prim, [opt], []))  # type: ignore
+            none_branch(stack, stdout, context)
+        else:
+            some = opt.get_some()
+            stack.push(some)
+            stdout.append(format_stdout(prim, [opt], [some]))  # type: ignore
+            some_branch(stack, stdout, context)
+
+    return catch(prim, run)
+
+
+@compiler(LoopInstruction)
+def compile_loop(cls: Type[Micheline]) -> Executor:
+    body = compile_code(cls.args[0])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        while True:
+            cond = stack.pop1()
+            cond.assert_type_equal(BoolType)
+            stdout.append(format_stdout(prim, [cond], []))  # type: ignore
+            if not bool(cond):
+                break
+            body(stack, stdout, context)
+
+    return catch(prim, run)
+
+
+@compiler(LoopLeftInstruction)
+def compile_loop_left(cls: Type[Micheline]) -> Executor:
+    body = compile_code(cls.args[0])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        while True:
+            or_ = cast(OrType, stack.pop1())
+            or_.assert_type_in(OrType)
+            var = or_.resolve()
+            stack.push(var)
+            stdout.append(format_stdout(prim, [or_], [var]))  # type: ignore
+            if not or_.is_left():
+                break
+            body(stack, stdout, context)
+
+    return catch(prim, run)
+
+
+@compiler(MapInstruction)
+def compile_map(cls: Type[Micheline]) -> Executor:
+    body = compile_code(cls.args[0])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        src = stack.pop1()
+        is_map = isinstance(src, MapType)
+        items = []
+        popped = [src]
+        for elt in src:  # type: ignore
+            if is_map:
+                elt = PairType.from_comb(list(elt))
+            stack.push(elt)
+            stdout.append(format_stdout(prim, popped, [elt]))  # type: ignore
+            body(stack, stdout, context)
+            new_elt = stack.pop1()
+            items.append((elt[0], new_elt) if is_map else new_elt)
+            popped = [new_elt]
+
+        res = type(src).from_items(items) if items else src  # type: ignore
+        stack.push(res)
+        stdout.append(format_stdout(prim, popped, [res]))  # type: ignore
+
+    return catch(prim, run)
+
+
+@compiler(IterInstruction)
+def compile_iter(cls: Type[Micheline]) -> Executor:
+    body = compile_code(cls.args[0])
+    prim = cls.prim
+
+    def run(stack: MichelsonStack, stdout: List[str], context: AbstractContext) -> None:
+        src = stack.pop1()
+        is_map = isinstance(src, MapType)
+        popped = [src]
+        for elt in src:  # type: ignore
+            if is_map:
+                elt = PairType.from_comb(list(elt))
+            stack.push(elt)
+            stdout.append(format_stdout(prim, popped, [elt]))  # type: ignore
+            body(stack, stdout, context)
+            popped = []
+
+    return catch(prim, run)
@@ -0,0 +1,722 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from inspect import getattr_static
+from itertools import islice
+from operator import attrgetter
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+
+from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.sections.parameter import ParameterSection
+from pytezos.michelson.types import AddressType
+from pytezos.michelson.types import BoolType
+from pytezos.michelson.types import BytesType
+from pytezos.michelson.types import ChainIdType
+from pytezos.michelson.types import IntType
+from pytezos.michelson.types import KeyHashType
+from pytezos.michelson.types import KeyType
+from pytezos.michelson.types import ListType
+from pytezos.michelson.types import MapType
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types import OptionType
+from pytezos.michelson.types import OrType
+from pytezos.michelson.types import PairType
+from pytezos.michelson.types import SetType
+from pytezos.michelson.types import SignatureType
+from pytezos.michelson.types import StringType
+from pytezos.michelson.types import TimestampType
+from pytezos.michelson.types import TXRAddress
+from pytezos.michelson.types.base import Undefined
+from pytezos.michelson.types.core import Unit
+
+ToPython = Callable[[MichelsonType], Any]
+FromPython = Callable[[Any], MichelsonType]
+ToPythonFlags = Tuple[bool, Optional[bool], bool]
+
+DEFAULT_CHUNK_SIZE = 1000
+
+to_python_compilers: Dict[
+    Type[MichelsonType], Callable[[Type[MichelsonType], bool, Optional[bool], bool], ToPython]
+] = {}
+from_python_compilers: Dict[Type[MichelsonType], Callable[[Type[MichelsonType]], FromPython]] = {}
+
+# Converters are stored in the type class itself: they refer to the class, so an external (weak key) mapping would
+# keep it alive forever, while a reference cycle is collected once the class is evicted from the type cache.
+TO_PYTHON_ATTR = '_to_python_converters'
+FROM_PYTHON_ATTR = '_from_python_converter'
+
+
+class TypeMismatch(Exception):
+    """Value does not match the type the converter was compiled for."""
+
+
+# NOTE: compiled converters fail with these on values they do not support (or invalid ones: missing field, unknown
+# entrypoint, bad leaf value), such values are handed over to the regular methods; anything else is a bug
+CONVERSION_ERRORS = (TypeMismatch, MichelsonRuntimeError, KeyError)
+# NOTE: type layout validation, such types are converted with the regular methods
+COMPILATION_ERRORS = (AssertionError, MichelsonRuntimeError)
+
+
+def to_python_compiler(*types: Type[MichelsonType]):
+    def register(func):
+        for ty in types:
+            to_python_compilers[ty] = func
+        return func
+
+    return register
+
+
+def from_python_compiler(*types: Type[MichelsonType]):
+    def register(func):
+        for ty in types:
+            from_python_compilers[ty] = func
+        return func
+
+    return register
+
+
+def find_compiler(registry: Dict[Type[MichelsonType], Any], ty: Type[MichelsonType], method: str):
+    """Get compiler registered for the closest base class, unless the conversion method is overridden in between."""
+    for base in ty.__mro__:
+        func = registry.get(base)
+        if func is not None:
+            if getattr_static(ty, method) is getattr_static(base, method):
+                return func
+            break
+    return None
+
+
+def is_unnamed_pair(ty: Type[MichelsonType]) -> bool:
+    return issubclass(ty, PairType) and not (ty.field_name or ty.type_name)
+
+
+def get_to_python(
+    ty: Type[MichelsonType],
+    try_unpack: bool = False,
+    lazy_diff: Optional[bool] = False,
+    comparable: bool = False,
+) -> ToPython:
+    """Get (compile if necessary) converter doing the same as `to_python_object` for values of exactly this type.
+
+    Composite types are unrolled in advance, so that no type layout is computed per call. Converters raise
+    `TypeMismatch` if they encounter a value of another type, use `compile_to_python` to get a safe entry point.
+
+    :param ty: interned type class
+    :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+    :param lazy_diff: big map mode (see `BigMapType.to_python_object`)
+    :param comparable: return tuples instead of dicts (used for keys and set elements)
+    """
+    flags = (try_unpack, lazy_diff, comparable)
+    converters = vars(ty).get(TO_PYTHON_ATTR)
+    if converters is None:
+        converters = {}
+        setattr(ty, TO_PYTHON_ATTR, converters)
+    converter = converters.get(flags)
+    if converter is None:
+        func = find_compiler(to_python_compilers, ty, 'to_python_object')
+        try:
+            converter = func(ty, *flags) if func else None
+        except COMPILATION_ERRORS:
+            converter = None
+        if converter is None:
+            converter = make_generic_to_python(*flags)
+        converters[flags] = converter
+    return converter
+
+
+def get_from_python(ty: Type[MichelsonType]) -> FromPython:
+    """Get (compile if necessary) converter doing the same as `from_python_object` for this type.
+
+    Compiled converters support the common input forms only and raise on anything unexpected, use
+    `compile_from_python` to get a safe entry point.
+
+    :param ty: interned type class
+    """
+    converter = vars(ty).get(FROM_PYTHON_ATTR)
+    if converter is None:
+        func = find_compiler(from_python_compilers, ty, 'from_python_object')
+        try:
+            converter = func(ty) if func else None
+        except COMPILATION_ERRORS:
+            converter = None
+        if converter is None:
+            converter = ty.from_python_object
+        setattr(ty, FROM_PYTHON_ATTR, converter)
+    return converter
+
+
+def make_generic_to_python(try_unpack: bool, lazy_diff: Optional[bool], comparable: bool) -> ToPython:
+    kwargs = {'try_unpack': try_unpack, 'lazy_diff': lazy_diff}
+    if comparable:
+        kwargs['comparable'] = True
+
+    def to_python(value: MichelsonType) -> Any:
+        return value.to_python_object(**kwargs)
+
+    return to_python
+
+
+@to_python_compiler(
+    StringType,
+    IntType,
+    BoolType,
+    TimestampType,
+    AddressType,
+    TXRAddress,
+    KeyType,
+    KeyHashType,
+    SignatureType,
+    ChainIdType,
+)
+def compile_scalar_to_python(ty, try_unpack, lazy_diff, comparable) -> ToPython:
+    return attrgetter('value')
+
+
+@to_python_compiler(BytesType)
+def compile_bytes_to_python(ty, try_unpack, lazy_diff, comparable) -> Optional[ToPython]:
+    return None if try_unpack else attrgetter('value')
+
+
+@to_python_compiler(PairType)
+def compile_pair_to_python(ty, try_unpack, lazy_diff, comparable) -> ToPython:
+    path_to_key, _, _ = ty.get_type_layout()
+    if comparable or path_to_key is None:
+        collect = compile_pair_collector(ty, try_unpack, lazy_diff, comparable)
+
+        def to_tuple(value: MichelsonType) -> tuple:
+            res: List[Any] = []
+            collect(value, res)
+            return tuple(res)
+
+        return to_tuple
+
+    names = tuple(path_to_key.values())
+    collect = compile_pair_collector(ty, try_unpack, lazy_diff, False)
+
+    def to_dict(value: MichelsonType) -> dict:
+        res: List[Any] = []
+        collect(value, res)
+        return dict(zip(names, res))
+
+    return to_dict
+
+
+def compile_pair_collector(ty, try_unpack, lazy_diff, comparable) -> Callable[[MichelsonType, List[Any]], None]:
+    """Unroll nested unnamed pairs: converted leaves are appended in the `iter_values` order."""
+    args = []
+    for arg in ty.args:
+        if is_unnamed_pair(arg):
+            args.append((arg, compile_pair_collector(arg, try_unpack, lazy_diff, comparable), True))
+        else:
+            args.append((arg, get_to_python(arg, try_unpack, lazy_diff, comparable), False))
+    (left_ty, left, left_nested), (right_ty, right, right_nested) = args
+
+    def collect(value: MichelsonType, res: List[Any]) -> None:
+        left_item, right_item = value.items
+        if type(left_item) is not left_ty or type(right_item) is not right_ty:
+            raise TypeMismatch
+        if left_nested:
+            left(left_item, res)
+        else:
+            res.append(left(left_item))
+        if right_nested:
+            right(right_item, res)
+        else:
+            res.append(right(right_item))
+
+    return collect
+
+
+@to_python_compiler(OrType)
+def compile_or_to_python(ty, try_unpack, lazy_diff, comparable) -> ToPython:
+    path_to_key, _, _ = ty.get_type_layout(infer_names=True)
+    is_enum = ty.is_enum
+
+    def compile_branch(arg, path):
+        if issubclass(arg, OrType):
+            return arg, compile_node(arg, path)
+        name = path_to_key[path]
+        if is_enum:
+            return arg, lambda _: name
+        convert = get_to_python(arg, try_unpack, lazy_diff, comparable)
+        if comparable:
+            return arg, lambda item: (name, convert(item))
+        return arg, lambda item: {name: convert(item)}
+
+    def compile_node(node_ty, path):
+        (left_ty, left), (right_ty, right) = (compile_branch(arg, path + str(i)) for i, arg in enumerate(node_ty.args))
+
+        def resolve(value: MichelsonType) -> Any:
+            left_item, right_item = value.items
+            if type(left_item) is left_ty and right_item is Undefined:
+                return left(left_item)
+            if type(right_item) is right_ty and left_item is Undefined:
+                return right(right_item)
+            raise TypeMismatch
+
+        return resolve
+
+    return compile_node(ty, '')
+
+
+@to_python_compiler(OptionType)
+def compile_option_to_python(ty, try_unpack, lazy_diff, comparable) -> ToPython:
+    item_ty = ty.args[0]
+    convert = get_to_python(item_ty, try_unpack, lazy_diff, comparable)
+
+    def to_python(value: MichelsonType) -> Any:
+        item = value.item
+        if item is None:
+            return None
+        if type(item) is not item_ty:
+            raise TypeMismatch
+        return convert(item)
+
+    return to_python
+
+
+@to_python_compiler(ListType)
+def compile_list_to_python(ty, try_unpack, lazy_diff, comparable) -> Optional[ToPython]:
+    if comparable:
+        return None
+    item_ty = ty.args[0]
+    convert = get_to_python(item_ty, try_unpack, lazy_diff)
+
+    def to_python(value: MichelsonType) -> list:
+        res = []
+        for item in value:
+            if type(item) is not item_ty:
+                raise TypeMismatch
+            res.append(convert(item))
+        return res
+
+    return to_python
+
+
+@to_python_compiler(SetType)
+def compile_set_to_python(ty, try_unpack, lazy_diff, comparable) -> Optional[ToPython]:
+    if comparable:
+        return None
+    item_ty = ty.args[0]
+    convert = get_to_python(item_ty, try_unpack, lazy_diff, comparable=True)
+
+    def to_python(value: MichelsonType) -> list:
+        res = []
+        for item in value.items:
+            if type(item) is not item_ty:
+                raise TypeMismatch
+            res.append(convert(item))
+        return res
+
+    return to_python
+
+
+@to_python_compiler(MapType)
+def compile_map_to_python(ty, try_unpack, lazy_diff, comparable) -> Optional[ToPython]:
+    if comparable:
+        return None
+    key_ty, val_ty = ty.args
+    convert_key = get_to_python(key_ty, try_unpack, comparable=True)
+    convert_val = get_to_python(val_ty, try_unpack, lazy_diff)
+
+    def to_python(value: MichelsonType) -> dict:
+        res = {}
+        for key, val in value.items:
+            if type(key) is not key_ty or type(val) is not val_ty:
+                raise TypeMismatch
+            py_key, py_val = convert_key(key), convert_val(val)
+            try:
+                res[py_key] = py_val
+            except TypeError:  # NOTE: unhashable key object (e.g. unit), `to_python_object` reports the error
+                raise TypeMismatch from None
+        return res
+
+    return to_python
+
+
+@to_python_compiler(ParameterSection)
+def compile_parameter_to_python(ty, try_unpack, lazy_diff, comparable) -> Optional[ToPython]:
+    if comparable:
+        return None
+    root_ty, root_name = ty.args[0], ty.root_name
+    convert = get_to_python(root_ty, try_unpack, lazy_diff=None)
+    is_or = issubclass(root_ty, OrType)
+
+    def to_python(value: ParameterSection) -> dict:
+        item = value.item
+        if type(item) is not root_ty:
+            raise TypeMismatch
+        py_obj = convert(item)
+        return py_obj if is_or else {root_name: py_obj}
+
+    return to_python
+
+
+@from_python_compiler(PairType)
+def compile_pair_from_python(ty) -> FromPython:
+    path_to_key, _, _ = ty.get_type_layout()
+    names = tuple(path_to_key.values()) if path_to_key else None
+    build, size = compile_pair_builder(ty, 0)
+
+    def from_python(py_obj) -> MichelsonType:
+        if isinstance(py_obj, (list, tuple)):
+            if len(py_obj) != size:
+                raise TypeMismatch
+            return build(py_obj)
+        if isinstance(py_obj, dict) and names and len(py_obj) == size:
+            return build([py_obj[name] for name in names])
+        raise TypeMismatch
+
+    return from_python
+
+
+def compile_pair_builder(ty, offset: int) -> Tuple[Callable[[Any], MichelsonType], int]:
+    """Fold flat list of leaves (in the `iter_type_args` order) into nested pairs."""
+    args = []
+    size = 0
+    for arg in ty.args:
+        if is_unnamed_pair(arg):
+            build, arg_size = compile_pair_builder(arg, offset + size)
+            args.append((build, True, offset + size))
+            size += arg_size
+        else:
+            args.append((get_from_python(arg), False, offset + size))
+            size += 1
+    (left, left_nested, left_idx), (right, right_nested, right_idx) = args
+
+    def build_pair(values) -> MichelsonType:
+        return ty(
+            (
+                left(values) if left_nested else left(values[left_idx]),
+                right(values) if right_nested else right(values[right_idx]),
+            )
+        )
+
+    return build_pair, size
+
+
+@from_python_compiler(OrType)
+def compile_or_from_python(ty) -> FromPython:
+    _, key_to_path, _ = ty.get_type_layout(infer_names=True)
+    builders = {name: compile_or_builder(ty, path) for name, path in key_to_path.items()}
+    is_enum = ty.is_enum
+
+    def from_python(py_obj) -> MichelsonType:
+        if isinstance(py_obj, str):
+            if not is_enum:
+                raise TypeMismatch
+            return builders[py_obj](Unit)
+        if isinstance(py_obj, (list, tuple)) and len(py_obj) == 2:
+            entrypoint, value = py_obj
+        elif isinstance(py_obj, dict) and len(py_obj) == 1:
+            ((entrypoint, value),) = py_obj.items()
+        else:
+            raise TypeMismatch
+        if not isinstance(entrypoint, str):
+            raise TypeMismatch
+        return builders[entrypoint](value)
+
+    return from_python
+
+
+def compile_or_builder(ty, path: str) -> FromPython:
+    """Wrap leaf value into Left/Right nodes along the path."""
+    nodes = []
+    for side in path:
+        nodes.append((ty, side == '0'))
+        ty = ty.args[int(side)]
+    nodes.reverse()
+    parse = get_from_python(ty)
+
+    def build_or(py_obj) -> MichelsonType:
+        value = parse(py_obj)
+        for node_ty, is_left in nodes:
+            value = node_ty((value, Undefined) if is_left else (Undefined, value))
+        return value
+
+    return build_or
+
+
+@from_python_compiler(OptionType)
+def compile_option_from_python(ty) -> FromPython:
+    parse = get_from_python(ty.args[0])
+
+    def from_python(py_obj) -> MichelsonType:
+        return ty(None if py_obj is None else parse(py_obj))
+
+    return from_python
+
+
+@from_python_compiler(ListType)
+def compile_list_from_python(ty) -> FromPython:
+    parse = get_from_python(ty.args[0])
+
+    def from_python(py_obj) -> MichelsonType:
+        if not isinstance(py_obj, list):
+            raise TypeMismatch
+        return ty(list(map(parse, py_obj)))
+
+    return from_python
+
+
+@from_python_compiler(SetType)
+def compile_set_from_python(ty) -> FromPython:
+    parse = get_from_python(ty.args[0])
+
+    def from_python(py_obj) -> MichelsonType:
+        if isinstance(py_obj, list):
+            try:
+                py_set = set(py_obj)
+            except TypeError:  # NOTE: unhashable items
+                raise TypeMismatch from None
+            if len(py_set) != len(py_obj):
+                raise TypeMismatch
+        elif isinstance(py_obj, set):
+            py_set = py_obj
+        else:
+            raise TypeMismatch
+        return ty(sorted(map(parse, py_set)))
+
+    return from_python
+
+
+@from_python_compiler(MapType)
+def compile_map_from_python(ty) -> FromPython:
+    key_ty, val_ty = ty.args
+    parse_key, parse_val = get_from_python(key_ty), get_from_python(val_ty)
+
+    def from_python(py_obj) -> MichelsonType:
+        if not isinstance(py_obj, dict):
+            raise TypeMismatch
+        items = [(parse_key(k), parse_val(v)) for k, v in py_obj.items()]
+        return ty(sorted(items, key=lambda x: x[0]))
+
+    return from_python
+
+
+def compile_to_python(ty: Type[MichelsonType], try_unpack=False, lazy_diff: Optional[bool] = False) -> ToPython:
+    """Get converter from Michelson value to Python object, equivalent to `value.to_python_object(...)`.
+
+    Values the compiled converter cannot handle (as well as invalid ones) are passed to `to_python_object`,
+    so that the result and errors are always the same.
+
+    :param ty: interned type class
+    :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+    :param lazy_diff: big map mode (see `BigMapType.to_python_object`)
+    """
+    convert = get_to_python(ty, try_unpack, lazy_diff)
+
+    def to_python(value: MichelsonType) -> Any:
+        if type(value) is ty:
+            try:
+                return convert(value)
+            except CONVERSION_ERRORS:
+                pass
+        return value.to_python_object(try_unpack=try_unpack, lazy_diff=lazy_diff)
+
+    return to_python
+
+
+def compile_from_python(ty: Type[MichelsonType]) -> FromPython:
+    """Get converter from Python object to Michelson value, equivalent to `ty.from_python_object(py_obj)`.
+
+    Objects the compiled converter cannot handle (as well as invalid ones) are passed to `from_python_object`,
+    so that the result and errors are always the same.
+
+    :param ty: interned type class
+    """
+    parse = get_from_python(ty)
+
+    def from_python(py_obj) -> MichelsonType:
+        try:
+            return parse(py_obj)
+        except CONVERSION_ERRORS:
+            return ty.from_python_object(py_obj)
+
+    return from_python
+
+
+def compile_decoder(
+    ty: Type[MichelsonType], try_unpack=False, lazy_diff: Optional[bool] = False
+) -> Callable[[Any], Any]:
+    """Get converter from Micheline expression to Python object.
+
+    :param ty: interned type class
+    :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+    :param lazy_diff: big map mode (see `BigMapType.to_python_object`)
+    """
+    to_python = compile_to_python(ty, try_unpack=try_unpack, lazy_diff=lazy_diff)
+
+    def decode(val_expr) -> Any:
+        return to_python(ty.from_micheline_value(val_expr))
+
+    return decode
+
+
+def compile_encoder(
+    ty: Type[MichelsonType], mode='readable', lazy_diff: Optional[bool] = False
+) -> Callable[[Any], Any]:
+    """Get converter from Python object to Micheline expression.
+
+    :param ty: interned type class
+    :param mode: whether to use `readable` or `optimized` (or `legacy_optimized`) encoding
+    :param lazy_diff: big map mode (see `BigMapType.to_micheline_value`)
+    """
+    from_python = compile_from_python(ty)
+
+    def encode(py_obj) -> Any:
+        return from_python(py_obj).to_micheline_value(mode=mode, lazy_diff=lazy_diff)
+
+    return encode
+
+
+def iter_chunks(items: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def map_chunks(
+    func: Callable[[List[Any]], List[Any]], items: Iterable[Any], processes: int, chunk_size: int
+) -> List[Any]:
+    """Convert items chunk by chunk in a process pool, preserving the order.
+
+    :param func: picklable converter of a list of items (type classes are not picklable, pass type expressions)
+    :param items: list or iterator of items
+    :param processes: number of worker processes
+    :param chunk_size: number of items sent to a worker at once
+    """
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        return [res for chunk in executor.map(func, iter_chunks(items, chunk_size)) for res in chunk]
+
+
+def decode_many(
+    ty: Type[MichelsonType],
+    val_exprs: Iterable[Any],
+    try_unpack=False,
+    lazy_diff: Optional[bool] = False,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Any]:
+    """Convert Micheline expressions of the same type to Python objects in one pass.
+
+    The result is the same as of `ty.from_micheline_value(val_expr).to_python_object(...)` for each expression.
+
+    :param ty: type class
+    :param val_exprs: list or iterator of Micheline expressions
+    :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+    :param lazy_diff: big map mode (see `BigMapType.to_python_object`)
+    :param processes: spread the work across a pool of that many processes (worth it for very large batches only)
+    :param chunk_size: number of items sent to a worker process at once
+    """
+    if processes:
+        func = partial(decode_chunk, ty.as_micheline_expr(), try_unpack, lazy_diff)
+        return map_chunks(func, val_exprs, processes, chunk_size)
+    decode = compile_decoder(ty, try_unpack=try_unpack, lazy_diff=lazy_diff)
+    return [decode(val_expr) for val_expr in val_exprs]
+
+
+def encode_many(
+    ty: Type[MichelsonType],
+    py_objs: Iterable[Any],
+    mode='readable',
+    lazy_diff: Optional[bool] = False,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[Any]:
+    """Convert Python objects of the same type to Micheline expressions in one pass.
+
+    The result is the same as of `ty.from_python_object(py_obj).to_micheline_value(...)` for each object.
+
+    :param ty: type class
+    :param py_objs: list or iterator of Python objects
+    :param mode: whether to use `readable` or `optimized` (or `legacy_optimized`) encoding
+    :param lazy_diff: big map mode (see `BigMapType.to_micheline_value`)
+    :param processes: spread the work across a pool of that many processes (worth it for very large batches only)
+    :param chunk_size: number of items sent to a worker process at once
+    """
+    if processes:
+        func = partial(encode_chunk, ty.as_micheline_expr(), mode, lazy_diff)
+        return map_chunks(func, py_objs, processes, chunk_size)
+    encode = compile_encoder(ty, mode=mode, lazy_diff=lazy_diff)
+    return [encode(py_obj) for py_obj in py_objs]
+
+
+def decode_parameters_many(
+    ty: Type[ParameterSection],
+    entrypoint: str,
+    val_exprs: Iterable[Any],
+    try_unpack=False,
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[dict]:
+    """Convert transaction parameters of the same entrypoint to Python objects in one pass.
+
+    The result is the same as of `ty.from_parameters({'entrypoint': entrypoint, 'value': val_expr}).to_python_object()`
+    for each expression.
+
+    :param ty: parameter section type
+    :param entrypoint: entrypoint name
+    :param val_exprs: list or iterator of Micheline expressions
+    :param try_unpack: try to unpack utf8-encoded strings or PACKed Michelson expressions
+    :param processes: spread the work across a pool of that many processes (worth it for very large batches only)
+    :param chunk_size: number of items sent to a worker process at once
+    """
+    if processes:
+        func = partial(decode_parameters_chunk, ty.as_micheline_expr(), entrypoint, try_unpack)
+        return map_chunks(func, val_exprs, processes, chunk_size)
+    to_python = compile_to_python(ty, try_unpack=try_unpack, lazy_diff=None)
+    return [to_python(ty.from_parameters({'entrypoint': entrypoint, 'value': val_expr})) for val_expr in val_exprs]
+
+
+def encode_parameters_many(
+    ty: Type[ParameterSection],
+    entrypoint: str,
+    py_objs: Iterable[Any],
+    mode='readable',
+    processes: Optional[int] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> List[dict]:
+    """Convert Python objects to transaction parameters of the same entrypoint in one pass.
+
+    The result is the same as of `ty.from_python_object({entrypoint: py_obj}).to_parameters(mode)` for each object.
+
+    :param ty: parameter section type
+    :param entrypoint: entrypoint name
+    :param py_objs: list or iterator of Python objects
+    :param mode: whether to use `readable` or `optimized` (or `legacy_optimized`) encoding
+    :param processes: spread the work across a pool of that many processes (worth it for very large batches only)
+    :param chunk_size: number of items sent to a worker process at once
+    """
+    if processes:
+        func = partial(encode_parameters_chunk, ty.as_micheline_expr(), entrypoint, mode)
+        return map_chunks(func, py_objs, processes, chunk_size)
+    return [ty.from_python_object({entrypoint: py_obj}).to_parameters(mode=mode) for py_obj in py_objs]
+
+
+def decode_chunk(type_expr, try_unpack: bool, lazy_diff: Optional[bool], val_exprs: List[Any]) -> List[Any]:
+    return decode_many(Micheline.match(type_expr), val_exprs, try_unpack=try_unpack, lazy_diff=lazy_diff)
+
+
+def encode_chunk(type_expr, mode: str, lazy_diff: Optional[bool], py_objs: List[Any]) -> List[Any]:
+    return encode_many(Micheline.match(type_expr), py_objs, mode=mode, lazy_diff=lazy_diff)
+
+
+def decode_parameters_chunk(type_expr, entrypoint: str, try_unpack: bool, val_exprs: List[Any]) -> List[dict]:
+    ty = ParameterSection.match(type_expr)
+    return decode_parameters_many(ty, entrypoint, val_exprs, try_unpack=try_unpack)
+
+
+def encode_parameters_chunk(type_expr, entrypoint: str, mode: str, py_objs: List[Any]) -> List[dict]:
+    return encode_parameters_many(ParameterSection.match(type_expr), entrypoint, py_objs, mode=mode)
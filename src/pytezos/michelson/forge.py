@@ -1,6 +1,9 @@
 from contextlib import suppress
+from hashlib import blake2b
 from typing import Any
 from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Tuple
 from typing import Union
@@ -10,10 +13,12 @@ import strict_rfc3339  # type: ignore
 
 from pytezos.crypto.encoding import base58_decode
 from pytezos.crypto.encoding import base58_encode
+from pytezos.crypto.encoding import base58_encodings
 from pytezos.crypto.key import blake2b_32
 from pytezos.michelson.tags import prim_tags
 
 prim_int = {v[0]: k for k, v in prim_tags.items()}
+script_expr_prefix = next(encoding[2] for encoding in base58_encodings if encoding[0] == b'expr')
 
 
 def get_tag(args_len: int, annots_len: int) -> bytes:
@@ -283,122 +288,195 @@ def unforge_array(data: bytes, len_bytes=4) -> tuple:
     return data[len_bytes : len_bytes + length], len_bytes + length
 
 
-def forge_micheline(data: Union[List, Dict]) -> bytes:
-    """Encode a Micheline expression into the byte form.
+def read_array(data: memoryview, ptr: int, len_bytes=4) -> Tuple[memoryview, int]:
+    """Read length-prefixed array in place.
 
-    :param data: Micheline expression
+    :param data: buffer
+    :param ptr: array offset
+    :param len_bytes: number of bytes to store array length
+    :returns: Tuple[array contents, offset right after the array]
     """
-    res = []
+    assert len(data) - ptr >= len_bytes, f'not enough bytes to parse array length, wanted {len_bytes}'
+    length = int.from_bytes(data[ptr : ptr + len_bytes], 'big')
+    end = ptr + len_bytes + length
+    assert len(data) >= end, f'not enough bytes to parse array body, wanted {length}'
+    return data[ptr + len_bytes : end], end
 
-    if isinstance(data, list):
-        res.append(b'\x02')
-        res.append(forge_array(b''.join(map(forge_micheline, data))))
 
-    elif isinstance(data, dict):
-        if data.get('prim'):
-            args_len = len(data.get('args', []))
-            annots_len = len(data.get('annots', []))
+def forge_micheline(data: Union[List, Dict]) -> bytes:
+    """Encode a Micheline expression into the byte form.
 
-            res.append(get_tag(args_len, annots_len))
-            res.append(prim_tags[data['prim']])
+    Traverses the expression with an explicit stack writing into a single buffer, length prefixes are patched
+    once the corresponding sequence is complete.
 
-            if args_len > 0:
-                args = b''.join(map(forge_micheline, data['args']))
-                if args_len < 3:
-                    res.append(args)
+    :param data: Micheline expression
+    """
+    res = bytearray()
+    # Each frame is (iterator over the nodes to emit, position of the length prefix to patch or -1, trailing bytes)
+    stack: List[Tuple[Iterator, int, bytes]] = [(iter((data,)), -1, b'')]
+
+    while stack:
+        nodes, length_pos, suffix = stack[-1]
+        for node in nodes:
+            if isinstance(node, dict):
+                if node.get('prim'):
+                    args = node.get('args', [])
+                    annots = node.get('annots', [])
+                    res.append(min(len(args) * 2 + 3 + (1 if annots else 0), 9))
+                    res += prim_tags[node['prim']]
+
+                    annots_bytes = forge_array(' '.join(annots).encode()) if annots else b''
+                    if len(args) >= 3:
+                        stack.append((iter(args), len(res), annots_bytes or b'\x00' * 4))
+                        res += b'\x00' * 4
+                        break
+                    if args:
+                        stack.append((iter(args), -1, annots_bytes))
+                        break
+                    res += annots_bytes
+
+                elif node.get('bytes') is not None:
+                    value = bytes.fromhex(node['bytes'])
+                    res.append(10)
+                    res += len(value).to_bytes(4, 'big')
+                    res += value
+
+                elif node.get('int') is not None:
+                    res.append(0)
+                    res += forge_int(int(node['int']))
+
+                elif node.get('string') is not None:
+                    value = node['string'].encode()
+                    res.append(1)
+                    res += len(value).to_bytes(4, 'big')
+                    res += value
                 else:
-                    res.append(forge_array(args))
-
-            if annots_len > 0:
-                res.append(forge_array(' '.join(data['annots']).encode()))
-            elif args_len >= 3:
-                res.append(b'\x00' * 4)
-
-        elif data.get('bytes') is not None:
-            res.append(b'\x0A')
-            res.append(forge_array(bytes.fromhex(data['bytes'])))
-
-        elif data.get('int') is not None:
-            res.append(b'\x00')
-            res.append(forge_int(int(data['int'])))
-
-        elif data.get('string') is not None:
-            res.append(b'\x01')
-            res.append(forge_array(data['string'].encode()))
+                    raise AssertionError(node)
+
+            elif isinstance(node, list):
+                res.append(2)
+                stack.append((iter(node), len(res), b''))
+                res += b'\x00' * 4
+                break
+            else:
+                raise AssertionError(node)
         else:
-            raise AssertionError(data)
-    else:
-        raise AssertionError(data)
+            stack.pop()
+            if length_pos >= 0:
+                res[length_pos : length_pos + 4] = (len(res) - length_pos - 4).to_bytes(4, 'big')
+            res += suffix
 
-    return b''.join(res)
+    return bytes(res)
 
 
 def unforge_micheline(data: bytes) -> Union[List, Dict]:
     """Parse Micheline JSON from bytes.
 
+    Reads the input in place with an explicit stack, so that neither slicing nor nesting depth is an issue.
+
     :param data: Forged Micheline expression
     :returns: Micheline JSON
     """
+    view = memoryview(data)
+    if not isinstance(data, bytes):
+        data = bytes(data)
+    size = len(data)
     ptr = 0
 
-    def unforge_sequence():
-        nonlocal ptr
-        _, offset = unforge_array(data[ptr:])
-        end, res = ptr + offset, []
-        ptr += 4
-        while ptr < end:
-            res.append(unforge())
-        assert ptr == end, f'out of sequence boundaries'
-        return res
-
-    def unforge_prim_expr(args_len=0, annots=False):
-        nonlocal ptr
-        prim_tag = data[ptr]
-        ptr += 1
-        expr = {'prim': prim_int[prim_tag]}
-
-        if 0 < args_len < 3:
-            expr['args'] = [unforge() for _ in range(args_len)]
-        elif args_len == 3:
-            expr['args'] = unforge_sequence()
-        else:
-            assert args_len == 0, f'unexpected args len {args_len}'
-
-        if annots or args_len == 3:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            if len(value) > 0:
-                expr['annots'] = value.decode().split(' ')
+    # Current frame: items being collected, end of the sequence (-1 for prim args), number of args left to read,
+    # prim expression (None for sequences), whether annotations follow; enclosing frames are kept on the stack
+    items: List[Any] = []
+    end, args_left, expr, has_annots = -1, 1, None, False
+    stack: List[Tuple[List[Any], int, int, Any, bool]] = []
+    res: Any
 
-        return expr
-
-    def unforge():
-        nonlocal ptr
+    while True:
         tag = data[ptr]
         ptr += 1
-        if tag == 0:
-            value, offset = unforge_int(data[ptr:])
-            ptr += offset
-            return {'int': str(value)}
+
+        if 2 < tag < 9:
+            res = {'prim': prim_int[data[ptr]]}
+            ptr += 1
+            if tag > 4:
+                stack.append((items, end, args_left, expr, has_annots))
+                items = res['args'] = []
+                end, args_left, expr, has_annots = -1, (tag - 3) >> 1, res, tag & 1 == 0
+                continue
+            if tag == 4:
+                annots, ptr = read_array(view, ptr)
+                if len(annots) > 0:
+                    res['annots'] = str(annots, 'utf-8').split(' ')
+
+        elif tag == 0:
+            value = 0
+            length = 1
+            while data[ptr + length - 1] & 0b10000000 != 0:
+                length += 1
+            for i in range(ptr + length - 1, ptr, -1):
+                value = (value << 7) | (data[i] & 0b01111111)
+            value = (value << 6) | (data[ptr] & 0b00111111)
+            if data[ptr] & 0b01000000 != 0:
+                value = -value
+            ptr += length
+            res = {'int': str(value)}
+
         elif tag == 1:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'string': value.decode()}
-        elif tag == 2:
-            return unforge_sequence()
-        elif 2 < tag < 10:
-            args_len, annots = read_tag(tag)
-            return unforge_prim_expr(args_len, annots)
+            value, ptr = read_array(view, ptr)
+            res = {'string': str(value, 'utf-8')}
+
+        elif tag == 2 or tag == 9:
+            if tag == 9:
+                res = {'prim': prim_int[data[ptr]], 'args': []}
+                ptr += 1
+            else:
+                res = []
+            assert size - ptr >= 4, 'not enough bytes to parse array length, wanted 4'
+            seq_end = ptr + 4 + int.from_bytes(view[ptr : ptr + 4], 'big')
+            assert seq_end <= size, f'not enough bytes to parse array body, wanted {seq_end - ptr - 4}'
+            ptr += 4
+            if ptr < seq_end:
+                stack.append((items, end, args_left, expr, has_annots))
+                if tag == 9:
+                    items, end, expr, has_annots = res['args'], seq_end, res, True
+                else:
+                    items, end, expr, has_annots = res, seq_end, None, False
+                continue
+            if tag == 9:
+                annots, ptr = read_array(view, ptr)
+                if len(annots) > 0:
+                    res['annots'] = str(annots, 'utf-8').split(' ')
+
         elif tag == 10:
-            value, offset = unforge_array(data[ptr:])
-            ptr += offset
-            return {'bytes': value.hex()}
+            value, ptr = read_array(view, ptr)
+            res = {'bytes': value.hex()}
+
         else:
             raise AssertionError(f'unkonwn tag {tag} at position {ptr}')
 
-    result = unforge()
-    assert ptr == len(data), f'have not reach EOS (pos {ptr}/{len(data)})'
-    return result
+        while True:
+            items.append(res)
+            if end >= 0:
+                if ptr < end:
+                    break
+                assert ptr == end, f'out of sequence boundaries'
+            else:
+                args_left -= 1
+                if args_left:
+                    break
+
+            if not stack:
+                assert ptr == size, f'have not reach EOS (pos {ptr}/{size})'
+                return items[0]
+
+            if expr is None:
+                res = items
+            else:
+                res = expr
+                if has_annots:
+                    annots, ptr = read_array(view, ptr)
+                    if len(annots) > 0:
+                        res['annots'] = str(annots, 'utf-8').split(' ')
+            items, end, args_left, expr, has_annots = stack.pop()
 
 
 def forge_script(script: Dict[str, Any]) -> bytes:
@@ -414,3 +492,17 @@ def forge_script(script: Dict[str, Any]) -> bytes:
 def forge_script_expr(packed_key: bytes) -> str:
     data = blake2b_32(packed_key).digest()
     return base58_encode(data, b'expr').decode()
+
+
+def forge_script_exprs(forged_keys: Iterable[bytes]) -> Iterator[str]:
+    """Get script expression hashes of many keys, same as `forge_script_expr` of the packed keys.
+
+    Hasher state for the PACK prefix and Base58 version bytes are set up once for the whole batch.
+
+    :param forged_keys: keys forged in legacy optimized mode (without 0x05 prefix)
+    """
+    prefix_hasher = blake2b(b'\x05', digest_size=32)
+    for data in forged_keys:
+        hasher = prefix_hasher.copy()
+        hasher.update(data)
+        yield base58.b58encode_check(script_expr_prefix + hasher.digest()).decode()
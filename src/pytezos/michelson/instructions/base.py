@@ -1,5 +1,8 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -21,21 +24,53 @@ class Wildcard:
         return '*'
 
 
+tracing_enabled: ContextVar[bool] = ContextVar('tracing_enabled', default=True)
+
+
+@contextmanager
+def tracing(enabled: bool = True) -> Iterator[None]:
+    """Turn formatting of the execution trace on or off within the block.
+
+    :param enabled: when False `format_stdout` returns an empty string without rendering stack items
+    """
+    token = tracing_enabled.set(enabled)
+    try:
+        yield
+    finally:
+        tracing_enabled.reset(token)
+
+
+class NullStdout(list):
+    """Execution trace sink discarding all lines (for use with tracing turned off)."""
+
+    def append(self, line: str) -> None:
+        pass
+
+
 def format_stdout(prim: str, inputs: list, outputs: list, arg=None):
+    if not tracing_enabled.get():
+        return ''
     arg = f' {arg}' if arg else ''
     pop = " : ".join(map(repr, inputs)) if inputs else '_'
     push = " : ".join(map(repr, outputs)) if outputs else '_'
     return f'{prim}{arg} / {pop} => {push}'
 
 
+# NOTE: prim signature -> mapping key, built once per distinct mapping (call site)
+dispatch_tables: Dict[Tuple[Tuple[Type[Micheline], ...], ...], Dict[Tuple[Optional[str], ...], Tuple[Any, ...]]] = {}
+
+
 def dispatch_types(
     *args: Type[Micheline],
     mapping: Dict[Tuple[Type[Micheline], ...], Tuple[Any, ...]],
 ):
+    keys = tuple(mapping)
+    table = dispatch_tables.get(keys)
+    if table is None:
+        table = dispatch_tables[keys] = {tuple(arg.prim for arg in k): k for k in keys}
     key = tuple(arg.prim for arg in args)
-    mapping = {tuple(arg.prim for arg in k): v for k, v in mapping.items()}  # type: ignore
-    assert key in mapping, f'unexpected types `{" * ".join(key)}`'  # type: ignore
-    return mapping[key]  # type: ignore
+    assert key in table, f'unexpected types `{" * ".join(key)}`'  # type: ignore
+    return mapping[table[key]]  # type: ignore
 
 
 class MichelsonInstruction(Micheline):
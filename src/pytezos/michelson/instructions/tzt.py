@@ -56,8 +56,8 @@ class StackEltInstruction(MichelsonInstruction, prim='Stack_elt', args_len=2):
             raise Exception(f'`{res_type.prim}` is neither pushable nor big_map')
 
         if res != expected_res:
-            logger.debug('expected: %s(%s)', expected_res.__class__.__name__, expected_res.__dict__)
-            logger.debug('actual: %s(%s)', res.__class__.__name__, res.__dict__)
+            logger.debug('expected: %s(%s)', expected_res.__class__.__name__, expected_res)
+            logger.debug('actual: %s(%s)', res.__class__.__name__, res)
             raise Exception('Stack content is not equal to expected')
 
         stdout.append(format_stdout(cls.prim, [], [res]))  # type: ignore
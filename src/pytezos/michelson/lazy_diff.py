@@ -0,0 +1,48 @@
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+
+class LazyDiffIndex(list):
+    """Lazy storage diff (list of `{"kind", "id", "diff"}` items) indexed by (kind, id) in a single pass.
+
+    Can be passed wherever a plain `lazy_storage_diff` list is expected, e.g. to `merge_lazy_diff`, so that every big
+    map finds its entry in constant time. The index is built on creation, later changes of the list are not tracked.
+    """
+
+    def __init__(self, lazy_diff: Iterable[dict] = ()) -> None:
+        """
+        :param lazy_diff: `lazy_storage_diff` from the operation result
+        """
+        super().__init__(lazy_diff)
+        self.index: Dict[Tuple[str, str], dict] = {}
+        for item in self:
+            self.index.setdefault((item['kind'], str(item['id'])), item)
+
+    @classmethod
+    def wrap(cls, lazy_diff: Iterable[dict]) -> 'LazyDiffIndex':
+        """Index lazy diff unless it is already indexed."""
+        return lazy_diff if isinstance(lazy_diff, cls) else cls(lazy_diff)
+
+    def find(self, kind: str, ptr: Union[int, str]) -> Optional[dict]:
+        """Get diff item by kind and ID.
+
+        :param kind: one of big_map/sapling_state
+        :param ptr: big map or sapling state ID
+        """
+        return self.index.get((kind, str(ptr)))
+
+
+def find_lazy_diff(lazy_diff: List[dict], kind: str, ptr: Union[int, str]) -> Optional[dict]:
+    """Get diff item by kind and ID, using the index if available (otherwise a linear scan).
+
+    :param lazy_diff: `lazy_storage_diff` list or `LazyDiffIndex`
+    :param kind: one of big_map/sapling_state
+    :param ptr: big map or sapling state ID
+    """
+    if isinstance(lazy_diff, LazyDiffIndex):
+        return lazy_diff.find(kind, ptr)
+    return next((item for item in lazy_diff if item['kind'] == kind and item['id'] == str(ptr)), None)
@@ -1,6 +1,9 @@
+from collections import OrderedDict
 from contextlib import suppress
 from functools import wraps
 from pprint import pformat
+from threading import Lock
+from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
@@ -21,6 +24,8 @@ from pytezos.michelson.forge import unforge_public_key
 from pytezos.michelson.forge import unforge_signature
 from pytezos.michelson.format import micheline_to_michelson
 
+DEFAULT_TYPE_CACHE_SIZE = 65536
+
 
 class MichelsonRuntimeError(Exception):
     def format_stdout(self):
@@ -146,7 +151,79 @@ def blind_unpack(data: bytes):
     return data
 
 
+class TypeCache:
+    """Structural interning of classes produced by :meth:`Micheline.match`.
+
+    Keys are built from the primitive, the (already interned) argument classes, and annotations, so identical
+    expressions resolve to the very same class object.
+    """
+
+    def __init__(self, maxsize: Optional[int] = DEFAULT_TYPE_CACHE_SIZE) -> None:
+        """
+        :param maxsize: max number of interned classes (least recently used are evicted), `None` for unbounded,
+            `0` to disable interning
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items: 'OrderedDict[Tuple[Any, ...], Type[Micheline]]' = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'size': len(self._items),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop interned classes and reset counters."""
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = 0
+
+    def resize(self, maxsize: Optional[int]) -> None:
+        """Change size limit, evicting least recently used classes if necessary."""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def intern(self, key: Tuple[Any, ...], factory: Callable[[], Type['Micheline']]) -> Type['Micheline']:
+        """Get class by structural key, create it with `factory` on miss."""
+        if self.maxsize == 0:
+            return factory()
+        with self._lock:
+            res = self._items.get(key)
+            if res is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return res
+            self.misses += 1
+        res = factory()
+        with self._lock:
+            res = self._items.setdefault(key, res)
+            self._evict()
+        return res
+
+    def _evict(self) -> None:
+        if self.maxsize is not None:
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+
+type_cache = TypeCache()
+
+
 class Micheline(metaclass=ErrorTrace):
+    __slots__ = ()
+
     prim: Optional[str] = None
     args: List[Type['Micheline']] = []
     literal: Optional[Union[int, str, bytes]] = None
@@ -170,7 +247,10 @@ class Micheline(metaclass=ErrorTrace):
     def match(expr) -> Type['Micheline']:
         if isinstance(expr, list):
             args = [Micheline.match(arg) for arg in expr]
-            return MichelineSequence.create_type(args=args)
+            return type_cache.intern(
+                key=(MichelineSequence, *args),
+                factory=lambda: MichelineSequence.create_type(args=args),
+            )
         elif isinstance(expr, dict):
             if expr.get('prim'):
                 prim, args, annots = parse_micheline_prim(expr)
@@ -189,7 +269,11 @@ class Micheline(metaclass=ErrorTrace):
                 assert (prim, args_len) in Micheline.classes, f'unregistered primitive {prim} ({args_len} args)'
                 cls = Micheline.classes[prim, args_len]
                 try:
-                    return cls.create_type(args=list(map(Micheline.match, args)), annots=annots)
+                    arg_types = list(map(Micheline.match, args))
+                    return type_cache.intern(
+                        key=(cls, tuple(arg_types), *annots),
+                        factory=lambda: cls.create_type(args=arg_types, annots=annots),
+                    )
                 except Exception as e:
                     raise MichelsonRuntimeError(cls.prim, *e.args) from e
             else:
@@ -201,7 +285,10 @@ class Micheline(metaclass=ErrorTrace):
                         'bytes': bytes.fromhex,
                     },
                 )
-                return MichelineLiteral.create(literal=literal)
+                return type_cache.intern(
+                    key=(MichelineLiteral, type(literal), literal),
+                    factory=lambda: MichelineLiteral.create(literal=literal),
+                )
         else:
             raise MichelsonRuntimeError(f'malformed expression `{expr}`')
 
@@ -217,6 +304,8 @@ class Micheline(metaclass=ErrorTrace):
 
     @classmethod
     def assert_type_equal(cls, other: Type['Micheline'], path='', message=''):
+        if cls is other:
+            return  # interned types
         comment = f' [{message}]' if message else ''
         assert cls.prim == other.prim, f'expected {other.prim}, got {cls.prim} at `{path}`{comment}'
         assert len(cls.args) == len(
@@ -1,6 +1,9 @@
 # Inspired by https://github.com/jansorg/tezos-intellij/blob/master/grammar/michelson.bnf
 import json
 import re
+from itertools import chain
+from typing import Any
+from typing import Dict
 from typing import List
 from typing import Optional
 
@@ -72,10 +75,8 @@ class MichelsonParser:
 
     tokens = SimpleMichelsonLexer.tokens
 
-    @doc(
-        '''instr : expr 
-                  | empty'''
-    )
+    @doc('''instr : expr 
+                  | empty''')
     def p_instr(self, p):
         p[0] = p[1]
 
@@ -128,10 +129,8 @@ class MichelsonParser:
                 raise MichelsonParserError(p.slice[1], str(e)) from e
         p[0] = Sequence(expr) if isinstance(expr, list) else expr
 
-    @doc(
-        '''annots : annot 
-                   | empty'''
-    )
+    @doc('''annots : annot 
+                   | empty''')
     def p_annots(self, p):
         if p[1] is not None:
             p[0] = [p[1]]
@@ -148,10 +147,8 @@ class MichelsonParser:
     def p_annot(self, p):
         p[0] = p[1]
 
-    @doc(
-        '''args : arg 
-                 | empty'''
-    )
+    @doc('''args : arg 
+                 | empty''')
     def p_args(self, p):
         p[0] = []
         if p[1] is not None:
@@ -226,13 +223,191 @@ class MichelsonParser:
         return self.parser.parse(code)
 
 
-def michelson_to_micheline(data, parser=None):
+token_re = re.compile(
+    r'(?P<IGNORE>[ \t\r\n\f]+)'
+    r'|(?P<ANNOT>[:@%]+(?:[_0-9a-zA-Z\.]*)?)'
+    r'|(?P<PRIM>[A-Za-z][A-Za-z0-9_]+)'
+    r'|(?P<STR>"(?:\\.|[^"])*")'
+    r'|(?P<BYTE>0x[A-Fa-f0-9]*)'
+    r'|(?P<MULTI_COMMENT>/\*[^*]*\*/)'
+    r'|(?P<INT>-?[0-9]+)'
+    r'|(?P<COMMENT>#[^\n]*)'
+    r'|(?P<LEFT_CURLY>\{)'
+    r'|(?P<LEFT_PAREN>\()'
+    r'|(?P<RIGHT_CURLY>\})'
+    r'|(?P<RIGHT_PAREN>\))'
+    r'|(?P<SEMI>;)'
+    r'|(?P<ERROR>.)',
+    re.DOTALL,
+)
+ignored_tokens = {'IGNORE', 'MULTI_COMMENT', 'COMMENT'}
+literal_tokens = {'INT', 'BYTE', 'STR'}
+expr_end_tokens = {'SEMI', 'RIGHT_CURLY', 'RIGHT_PAREN', 'EOF'}
+
+
+class FastMichelsonParser:
+    """Hand-written single-pass Michelson parser, a drop-in replacement for :class:`MichelsonParser`.
+
+    Produces the same Micheline expressions (including macro expansion) without generating parsing tables,
+    nesting depth is limited by memory only. Unlike the PLY parser it reports actual line numbers
+    and unexpected end of input.
+    """
+
+    def __init__(self, extra_primitives: Optional[List[str]] = None):
+        """
+        :param extra_primitives: List of words to be ignored
+        """
+        self.extra_primitives = set(extra_primitives or [])
+
+    @staticmethod
+    def make_token(code: str, kind: str, value: str, pos: int) -> LexToken:
+        token = LexToken()
+        token.type = value if kind == 'ERROR' else kind
+        token.value = value
+        token.lineno = code.count('\n', 0, pos) + 1
+        token.lexpos = pos
+        return token
+
+    def fail(self, code: str, kind: str, value: str, pos: int):
+        if kind == 'EOF':
+            raise MichelsonParserError(self.make_token(code, kind, value, pos), 'unexpected end of input')
+        raise MichelsonParserError(self.make_token(code, kind, value, pos))
+
+    def make_expr(self, code: str, prim: str, pos: int, annots: List[str], args: list):
+        if prim in prim_tags or prim in self.extra_primitives:
+            expr: Dict[str, Any] = {'prim': prim}
+            if annots:
+                expr['annots'] = annots
+            if args:
+                expr['args'] = args
+            return expr
+        try:
+            res = expand_macro(prim=prim, annots=annots, args=args)
+        except AssertionError as e:
+            raise MichelsonParserError(self.make_token(code, 'PRIM', prim, pos), str(e)) from e
+        return Sequence(res) if isinstance(res, list) else res
+
+    def parse(self, code):
+        """Parse Michelson source.
+
+        :param code: Michelson source
+        :returns: Micheline expression
+        """
+        if len(code) > 0 and code[0] == '(' and code[-1] == ')':
+            code = code[1:-1]
+
+        # Sequence frames: [False, closing token, items, is argument]
+        # Expression frames: [True, prim, position, annots, args, is parenthesized]
+        stack: list = [[False, 'EOF', [], False]]
+        expect_item = True
+        expect_prim = False
+
+        for match in chain(token_re.finditer(code), (None,)):
+            if match is None:
+                kind, value, pos = 'EOF', '', len(code)
+            else:
+                kind = match.lastgroup
+                if kind in ignored_tokens:
+                    continue
+                value = match.group()
+                pos = match.start()
+
+            while True:
+                frame = stack[-1]
+
+                if expect_prim:
+                    if kind != 'PRIM':
+                        self.fail(code, kind, value, pos)
+                    stack.append([True, value, pos, [], [], True])
+                    expect_prim = False
+                    break
+
+                if frame[0]:  # collecting annotations and arguments
+                    if kind == 'PRIM':
+                        frame[4].append({'prim': value})
+                    elif kind == 'INT':
+                        frame[4].append({'int': value})
+                    elif kind == 'STR':
+                        frame[4].append({'string': json.loads(value)})
+                    elif kind == 'BYTE':
+                        frame[4].append({'bytes': value[2:]})  # strip 0x prefix
+                    elif kind == 'ANNOT' and not frame[4]:
+                        frame[3].append(value)
+                    elif kind == 'LEFT_CURLY':
+                        stack.append([False, 'RIGHT_CURLY', [], True])
+                        expect_item = True
+                    elif kind == 'LEFT_PAREN':
+                        expect_prim = True
+                    elif kind in expr_end_tokens:
+                        if frame[5] and kind != 'RIGHT_PAREN':
+                            self.fail(code, kind, value, pos)
+                        stack.pop()
+                        expr = self.make_expr(code, frame[1], frame[2], frame[3], frame[4])
+                        if not frame[5]:
+                            stack[-1][2].append(expr)
+                            expect_item = False
+                            continue  # separator or closing bracket belongs to the enclosing sequence
+                        stack[-1][4].append(expr)
+                    else:
+                        self.fail(code, kind, value, pos)
+                    break
+
+                if expect_item:
+                    if kind == 'PRIM':
+                        stack.append([True, value, pos, [], [], False])
+                        break
+                    if kind == 'LEFT_CURLY':
+                        stack.append([False, 'RIGHT_CURLY', [], False])
+                        break
+                    expect_item = False
+                    if kind == 'INT':
+                        frame[2].append({'int': value})
+                        break
+                    if kind == 'STR':
+                        frame[2].append({'string': json.loads(value)})
+                        break
+                    if kind == 'BYTE':
+                        frame[2].append({'bytes': value[2:]})  # strip 0x prefix
+                        break
+                    if kind != 'SEMI' and kind != frame[1]:
+                        self.fail(code, kind, value, pos)
+                    frame[2].append(None)  # empty instruction
+
+                if kind == 'SEMI':
+                    expect_item = True
+                    break
+                if kind != frame[1]:
+                    self.fail(code, kind, value, pos)
+
+                items = frame[2]
+                res = items[0] if len(items) == 1 else [item for item in items if item is not None]
+                if len(stack) == 1:
+                    return res
+
+                stack.pop()
+                if frame[3]:
+                    if type(res) is not list:
+                        res = [] if res is None else [res]
+                    stack[-1][4].append(res)
+                else:
+                    if type(res) is list:
+                        res = Sequence(res)
+                    else:
+                        res = Sequence() if res is None else Sequence([res])
+                    stack[-1][2].append(res)
+                break
+
+        raise AssertionError('unreachable')
+
+
+def michelson_to_micheline(data, parser=None, fast=False):
     """Converts Michelson source text into a Micheline expression.
 
     :param data: Michelson string
     :param parser: custom Michelson parser (optional)
+    :param fast: use single-pass :class:`FastMichelsonParser` instead of the PLY one (when no parser is given)
     :returns: Micheline expression
     """
     if parser is None:
-        parser = MichelsonParser()
+        parser = FastMichelsonParser() if fast else MichelsonParser()
     return parser.parse(data)
@@ -8,11 +8,16 @@ from typing import cast
 
 from pytezos.context.impl import ExecutionContext
 from pytezos.crypto.encoding import base58_encode
+from pytezos.crypto.key import blake2b_32
+from pytezos.michelson.compiler import Executor
+from pytezos.michelson.compiler import compile_code
+from pytezos.michelson.forge import forge_micheline
 from pytezos.michelson.instructions.base import MichelsonInstruction
 from pytezos.michelson.instructions.base import format_stdout
 from pytezos.michelson.instructions.tzt import BigMapInstruction
 from pytezos.michelson.instructions.tzt import StackEltInstruction
 from pytezos.michelson.micheline import MichelineSequence
+from pytezos.michelson.micheline import TypeCache
 from pytezos.michelson.micheline import get_script_section
 from pytezos.michelson.micheline import get_script_sections
 from pytezos.michelson.micheline import try_catch
@@ -37,6 +42,15 @@ from pytezos.michelson.types import MichelsonType
 from pytezos.michelson.types import OperationType
 from pytezos.michelson.types import PairType
 
+DEFAULT_PROGRAM_CACHE_SIZE = 1024
+
+program_cache = TypeCache(maxsize=DEFAULT_PROGRAM_CACHE_SIZE)
+
+
+def get_script_hash(code: List[Dict[str, Any]]) -> bytes:
+    """Get blake2b digest of the forged script code (list of sections)."""
+    return blake2b_32(forge_micheline(code)).digest()
+
 
 class MichelsonProgram:
     """Michelson .tz contract interpreter interface"""
@@ -53,18 +67,32 @@ class MichelsonProgram:
 
     @staticmethod
     def load(context: ExecutionContext, with_code=False) -> Type['MichelsonProgram']:
-        """Create MichelsonProgram type from filled context"""
-        cls = type(
-            MichelsonProgram.__name__,
-            (MichelsonProgram,),
-            {
-                'parameter': ParameterSection.match(context.get_parameter_expr()),
-                'storage': StorageSection.match(context.get_storage_expr()),
-                'code': CodeSection.match(context.get_code_expr() if with_code else []),
-                'views': [ViewSection.match(expr) for expr in context.get_views_expr()] if with_code else [],
-            },
-        )
-        return cast(Type['MichelsonProgram'], cls)
+        """Create MichelsonProgram type from filled context.
+
+        Types are cached by script hash, so contracts sharing the same code share the same program type.
+        """
+        parameter_expr = context.get_parameter_expr()
+        storage_expr = context.get_storage_expr()
+        code_expr = context.get_code_expr() if with_code else []
+        views_expr = context.get_views_expr() if with_code else []
+
+        def factory() -> Type['MichelsonProgram']:
+            cls = type(
+                MichelsonProgram.__name__,
+                (MichelsonProgram,),
+                {
+                    'parameter': ParameterSection.match(parameter_expr),
+                    'storage': StorageSection.match(storage_expr),
+                    'code': CodeSection.match(code_expr),
+                    'views': [ViewSection.match(expr) for expr in views_expr],
+                },
+            )
+            return cast(Type['MichelsonProgram'], cls)
+
+        if parameter_expr is None or storage_expr is None or (with_code and code_expr is None):
+            return factory()
+        script_hash = get_script_hash([parameter_expr, storage_expr, code_expr, *views_expr])
+        return cast(Type['MichelsonProgram'], program_cache.intern(key=(script_hash, with_code), factory=factory))
 
     @staticmethod
     def create(sequence: Type[MichelineSequence]) -> Type['MichelsonProgram']:
@@ -132,12 +160,44 @@ class MichelsonProgram:
         stack.push(res)
         stdout.append(format_stdout(f'BEGIN %{self.name}', [], [res]))
 
-    def execute(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext) -> MichelsonInstruction:
-        """Execute contract in interpreter"""
+    @classmethod
+    def compile(cls, view_name: Optional[str] = None) -> Executor:
+        """Compile contract (or view) code, result is cached on the program type, i.e. per script hash.
+
+        :param view_name: compile view code instead of the contract code
+        """
+        if '_compiled' not in cls.__dict__:
+            cls._compiled = {}
+        compiled = cast(Dict[Optional[str], Executor], cls._compiled)  # type: ignore
+        if view_name not in compiled:
+            code = cls.get_view(view_name).args[3] if view_name else cls.code.args[0]
+            compiled[view_name] = compile_code(code)
+        return compiled[view_name]
+
+    def execute(
+        self,
+        stack: MichelsonStack,
+        stdout: List[str],
+        context: ExecutionContext,
+        compiled=False,
+    ) -> Optional[MichelsonInstruction]:
+        """Execute contract in interpreter
+
+        :param compiled: run compiled code, does not return the execution tree
+        """
+        if compiled:
+            self.compile()(stack, stdout, context)
+            return None
         return cast(MichelsonInstruction, self.code.args[0].execute(stack, stdout, context))
 
-    def execute_view(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext):
-        """Execute view in interpreter"""
+    def execute_view(self, stack: MichelsonStack, stdout: List[str], context: ExecutionContext, compiled=False):
+        """Execute view in interpreter
+
+        :param compiled: run compiled code, does not return the execution tree
+        """
+        if compiled:
+            self.compile(view_name=self.name)(stack, stdout, context)
+            return None
         view = self.get_view(self.name)
         return cast(MichelsonInstruction, view.args[3].execute(stack, stdout, context))
 
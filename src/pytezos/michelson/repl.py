@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Any
 from typing import List
 from typing import Optional
@@ -8,6 +7,8 @@ from typing import cast
 from attr import dataclass
 
 from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.instructions.base import NullStdout
+from pytezos.michelson.instructions.base import tracing
 from pytezos.michelson.micheline import MichelineSequence
 from pytezos.michelson.micheline import MichelsonRuntimeError
 from pytezos.michelson.parse import MichelsonParser
@@ -54,8 +55,8 @@ class Interpreter:
         :param code: Michelson code
         """
         result = InterpreterResult(stdout=[])
-        stack_backup = deepcopy(self.stack)
-        context_backup = deepcopy(self.context)
+        stack_backup = self.stack.snapshot()
+        context_backup = self.context.snapshot()
 
         try:
             code_section = CodeSection.match(michelson_to_micheline(code))
@@ -67,7 +68,7 @@ class Interpreter:
                 raise
 
             self.stack = stack_backup
-            self.context = context_backup
+            self.context.restore(context_backup)
             result.stdout.append(e.format_stdout())
             result.error = e
 
@@ -91,6 +92,8 @@ class Interpreter:
         sender=None,
         balance=None,
         block_id=None,
+        compiled=False,
+        trace=True,
         **kwargs,
     ) -> Tuple[List[dict], Any, List[dict], List[str], Optional[Exception]]:
         """Execute contract in interpreter
@@ -106,6 +109,8 @@ class Interpreter:
         :param sender: patch SENDER
         :param balance: patch BALANCE
         :param block_id: set block ID
+        :param compiled: run compiled code (same results, no execution tree)
+        :param trace: collect execution trace, otherwise stdout contains only the error message (if any)
         """
         context = ExecutionContext(
             amount=amount,
@@ -118,21 +123,22 @@ class Interpreter:
             **kwargs,
         )
         stack = MichelsonStack()
-        stdout = []  # type: ignore
-        try:
-            program = MichelsonProgram.load(context, with_code=True)
-            res = program.instantiate(
-                entrypoint=entrypoint,
-                parameter=parameter,
-                storage=storage,
-            )
-            res.begin(stack, stdout, context)
-            res.execute(stack, stdout, context)
-            operations, storage, lazy_diff, _ = res.end(stack, stdout, output_mode=output_mode)
-            return operations, storage, lazy_diff, stdout, None
-        except MichelsonRuntimeError as e:
-            stdout.append(e.format_stdout())
-            return [], None, [], stdout, e
+        stdout = [] if trace else NullStdout()  # type: ignore
+        with tracing(trace):
+            try:
+                program = MichelsonProgram.load(context, with_code=True)
+                res = program.instantiate(
+                    entrypoint=entrypoint,
+                    parameter=parameter,
+                    storage=storage,
+                )
+                res.begin(stack, stdout, context)
+                res.execute(stack, stdout, context, compiled=compiled)
+                operations, storage, lazy_diff, _ = res.end(stack, stdout, output_mode=output_mode)
+                return operations, storage, lazy_diff, stdout, None
+            except MichelsonRuntimeError as e:
+                stdout = [*stdout, e.format_stdout()]  # NOTE: the error is reported even if tracing is off
+                return [], None, [], stdout, e
 
     @staticmethod
     def run_callback(
@@ -140,6 +146,7 @@ class Interpreter:
         parameter,
         storage,
         context: ExecutionContext,
+        trace=True,
     ) -> Tuple[Any, Any, List[str], Optional[Exception]]:
         """Execute view entrypoint of the contract loaded into the context
 
@@ -147,6 +154,7 @@ class Interpreter:
         :param parameter: parameter section
         :param storage: storage section
         :param context: execution context
+        :param trace: collect execution trace
         :returns: [operations, storage, stdout, error]
         """
         ctx = ExecutionContext(
@@ -157,29 +165,37 @@ class Interpreter:
             address=context.address,
         )
         stack = MichelsonStack()
-        stdout = []  # type: ignore
-        try:
-            program = MichelsonProgram.load(ctx, with_code=True)
-            res = program.instantiate(entrypoint=entrypoint, parameter=parameter, storage=storage)
-            res.begin(stack, stdout, context)
-            res.execute(stack, stdout, context)
-            _, _, _, pair = res.end(stack, stdout)
-            operations = cast(List[OperationType], list(pair.items[0]))
-            storage = pair.items[1]
-            # Note: the `storage` returned by the Michelson interpreter above is not
-            # required to include the full annotations specified in the contract's storage.
-            # The lack of annotations affects calls to `to_python_object()`, causing the storage
-            # you get back from the view to not always be converted to the same object
-            # as if you called ContractInterface.storage() directly.
-            # Re-parsing using the contract's storage section here to recover the annotations.
-            storage = program.storage.from_micheline_value(storage.to_micheline_value())
-            return [op.to_python_object() for op in operations], storage.to_python_object(), stdout, None
-        except MichelsonRuntimeError as e:
-            stdout.append(e.format_stdout())
-            return None, None, stdout, e
+        stdout = [] if trace else NullStdout()  # type: ignore
+        with tracing(trace):
+            try:
+                program = MichelsonProgram.load(ctx, with_code=True)
+                res = program.instantiate(entrypoint=entrypoint, parameter=parameter, storage=storage)
+                res.begin(stack, stdout, context)
+                res.execute(stack, stdout, context)
+                _, _, _, pair = res.end(stack, stdout)
+                operations = cast(List[OperationType], list(pair.items[0]))
+                storage = pair.items[1]
+                # Note: the `storage` returned by the Michelson interpreter above is not
+                # required to include the full annotations specified in the contract's storage.
+                # The lack of annotations affects calls to `to_python_object()`, causing the storage
+                # you get back from the view to not always be converted to the same object
+                # as if you called ContractInterface.storage() directly.
+                # Re-parsing using the contract's storage section here to recover the annotations.
+                storage = program.storage.from_micheline_value(storage.to_micheline_value())
+                return [op.to_python_object() for op in operations], storage.to_python_object(), stdout, None
+            except MichelsonRuntimeError as e:
+                stdout = [*stdout, e.format_stdout()]
+                return None, None, stdout, e
 
     @staticmethod
-    def run_view(name: str, parameter, storage, context: ExecutionContext) -> Tuple[Any, Any, Optional[Exception]]:
+    def run_view(
+        name: str,
+        parameter,
+        storage,
+        context: ExecutionContext,
+        compiled=False,
+        trace=True,
+    ) -> Tuple[Any, Any, Optional[Exception]]:
         ctx = ExecutionContext(
             shell=context.shell,
             key=context.key,
@@ -189,17 +205,18 @@ class Interpreter:
             view_results=context.view_results,
         )
         stack = MichelsonStack()
-        stdout = []  # type: ignore
-        try:
-            program = MichelsonProgram.load(ctx, with_code=True)
-            res = program.instantiate_view(name=name, parameter=parameter, storage=storage)
-            res.begin(stack, stdout, context)
-            res.execute_view(stack, stdout, context)
-            ret_value = res.ret(stack, stdout)
-            return ret_value.to_python_object(), stdout, None
-        except MichelsonRuntimeError as e:
-            stdout.append(e.format_stdout())
-            return None, stdout, e
+        stdout = [] if trace else NullStdout()  # type: ignore
+        with tracing(trace):
+            try:
+                program = MichelsonProgram.load(ctx, with_code=True)
+                res = program.instantiate_view(name=name, parameter=parameter, storage=storage)
+                res.begin(stack, stdout, context)
+                res.execute_view(stack, stdout, context, compiled=compiled)
+                ret_value = res.ret(stack, stdout)
+                return ret_value.to_python_object(), stdout, None
+            except MichelsonRuntimeError as e:
+                stdout = [*stdout, e.format_stdout()]
+                return None, stdout, e
 
     @staticmethod
     def run_tzt(
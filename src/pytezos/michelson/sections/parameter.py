@@ -7,6 +7,7 @@ from typing import Union
 from typing import cast
 
 from pytezos.context.abstract import AbstractContext
+from pytezos.michelson.lazy_diff import LazyDiffIndex
 from pytezos.michelson.micheline import Micheline
 from pytezos.michelson.micheline import MichelsonRuntimeError
 from pytezos.michelson.types import OrType
@@ -157,7 +158,7 @@ class ParameterSection(Micheline, prim='parameter', args_len=1):
             return {self.root_name: py_obj}
 
     def merge_lazy_diff(self, lazy_diff: List[dict]) -> 'ParameterSection':
-        item = self.item.merge_lazy_diff(lazy_diff)
+        item = self.item.merge_lazy_diff(LazyDiffIndex.wrap(lazy_diff))
         return type(self)(item)
 
     def attach_context(self, context: AbstractContext):
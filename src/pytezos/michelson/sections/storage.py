@@ -2,6 +2,7 @@ from typing import List
 from typing import Type
 
 from pytezos.context.abstract import AbstractContext
+from pytezos.michelson.lazy_diff import LazyDiffIndex
 from pytezos.michelson.micheline import Micheline
 from pytezos.michelson.micheline import MichelsonRuntimeError
 from pytezos.michelson.types import *
@@ -68,7 +69,7 @@ class StorageSection(Micheline, prim='storage', args_len=1):
         self.item.attach_context(context)
 
     def merge_lazy_diff(self, lazy_diff: List[dict]) -> 'StorageSection':
-        item = self.item.merge_lazy_diff(lazy_diff)
+        item = self.item.merge_lazy_diff(LazyDiffIndex.wrap(lazy_diff))
         return type(self)(item)
 
     def aggregate_lazy_diff(self, mode='readable') -> List[dict]:
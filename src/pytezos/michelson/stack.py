@@ -7,6 +7,8 @@ from pytezos.michelson.types.base import MichelsonType
 
 
 class MichelsonStack:
+    __slots__ = ('items', 'protected')
+
     def __init__(self, items: Optional[List[MichelsonType]] = None) -> None:
         self.items = items or []
         self.protected = 0
@@ -50,6 +52,12 @@ class MichelsonStack:
         a, b, c = self.pop(count=3)
         return a, b, c
 
+    def snapshot(self) -> 'MichelsonStack':
+        """Get a copy of the stack sharing the (immutable) items with the original one."""
+        res = MichelsonStack(self.items.copy())
+        res.protected = self.protected
+        return res
+
     def clear(self) -> None:
         self.items.clear()
         self.protected = 0
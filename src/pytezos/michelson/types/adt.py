@@ -76,6 +76,8 @@ def wrap_parameters(expr, path):
 
 
 class ADTMixin:
+    __slots__ = ()
+
     @classmethod
     def iter_type_args(
         cls,
@@ -1,6 +1,5 @@
 from collections.abc import Iterable
 from copy import copy
-from copy import deepcopy
 from typing import Any
 from typing import Callable
 from typing import List
@@ -61,6 +60,9 @@ def parse_name(annots: Optional[List[str]], prefix: str) -> Optional[str]:
 
 
 class MichelsonType(Micheline):
+    # NOTE: values are slotted, subclasses have to declare their own `__slots__` (types produced by `create_type` do)
+    __slots__ = ()
+
     field_name: Optional[str] = None
     type_name: Optional[str] = None
     args: List[Union[Type['MichelsonType'], Any]] = []
@@ -102,6 +104,7 @@ class MichelsonType(Micheline):
                 field_name=parse_name(annots, '%'),  # type: ignore
                 type_name=parse_name(annots, ':'),  # type: ignore
                 args=args,
+                __slots__=(),
                 **kwargs,
             ),
         )
@@ -230,6 +233,20 @@ class MichelsonType(Micheline):
     def from_python_object(cls, py_obj) -> 'MichelsonType':
         raise NotImplementedError
 
+    @classmethod
+    def decode_many(cls, val_exprs, try_unpack=False, lazy_diff: Optional[bool] = False, processes=None) -> list:
+        """Convert Micheline expressions of this type to Python objects in one pass (see `converter.decode_many`)."""
+        from pytezos.michelson.converter import decode_many
+
+        return decode_many(cls, val_exprs, try_unpack=try_unpack, lazy_diff=lazy_diff, processes=processes)
+
+    @classmethod
+    def encode_many(cls, py_objs, mode='readable', lazy_diff: Optional[bool] = False, processes=None) -> list:
+        """Convert Python objects to Micheline expressions of this type in one pass (see `converter.encode_many`)."""
+        from pytezos.michelson.converter import encode_many
+
+        return encode_many(cls, py_objs, mode=mode, lazy_diff=lazy_diff, processes=processes)
+
     def to_micheline_value(self, mode='readable', lazy_diff: Optional[bool] = False):
         raise NotImplementedError
 
@@ -271,8 +288,13 @@ class MichelsonType(Micheline):
         return b'\x05' + data
 
     def duplicate(self):
+        """Get a copy of the value for DUP-like instructions.
+
+        Values are never mutated once they are on the stack (instructions build new values sharing unchanged
+        parts with the original), so a shallow copy is enough.
+        """
         assert self.is_duplicable(), f'{self.prim} is not duplicable'
-        return deepcopy(self)
+        return copy(self)
 
 
 def generate_pydoc(ty: Type[MichelsonType], title=None):
@@ -1,37 +1,166 @@
+from bisect import bisect_left
 from copy import copy
 from copy import deepcopy
 from typing import Callable
+from typing import Dict
 from typing import Generator
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
 from typing import Type
 from typing import Union
+from weakref import WeakKeyDictionary
 
 from pytezos.context.abstract import AbstractContext
-from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.forge import forge_array
+from pytezos.michelson.forge import forge_contract
+from pytezos.michelson.forge import forge_int
+from pytezos.michelson.forge import forge_script_exprs
+from pytezos.michelson.lazy_diff import find_lazy_diff
 from pytezos.michelson.micheline import Micheline
 from pytezos.michelson.micheline import MichelineLiteral
 from pytezos.michelson.micheline import MichelineSequence
 from pytezos.michelson.micheline import parse_micheline_literal
+from pytezos.michelson.tags import prim_tags
 from pytezos.michelson.types.base import MichelsonType
-from pytezos.michelson.types.base import Undefined
 from pytezos.michelson.types.map import EltLiteral
 from pytezos.michelson.types.map import MapType
 
+KeyForger = Callable[[MichelsonType], bytes]
+
+key_forgers: 'WeakKeyDictionary[Type[MichelsonType], KeyForger]' = WeakKeyDictionary()
+
+
+def forge_key(key: MichelsonType) -> bytes:
+    return key.forge(mode='legacy_optimized')
+
+
+def forge_int_key(key: MichelsonType) -> bytes:
+    return b'\x00' + forge_int(key.value)  # type: ignore
+
+
+def forge_string_key(key: MichelsonType) -> bytes:
+    return b'\x01' + forge_array(key.value.encode())  # type: ignore
+
+
+def forge_bytes_key(key: MichelsonType) -> bytes:
+    return b'\x0a' + forge_array(key.value)  # type: ignore
+
+
+def forge_address_key(key: MichelsonType) -> bytes:
+    return b'\x0a' + forge_array(forge_contract(key.value))  # type: ignore
+
+
+simple_key_forgers: Dict[str, KeyForger] = {
+    'int': forge_int_key,
+    'nat': forge_int_key,
+    'mutez': forge_int_key,
+    'timestamp': forge_int_key,
+    'string': forge_string_key,
+    'bytes': forge_bytes_key,
+    'address': forge_address_key,
+}
+
+
+def make_pair_key_forger(forgers: List[KeyForger]) -> KeyForger:
+    pair_tag = prim_tags['Pair']
+    if len(forgers) == 2:
+        forge_left, forge_right = forgers
+        prefix = b'\x07' + pair_tag
+
+        def forge_pair_key(key: MichelsonType) -> bytes:
+            left, right = key.items  # type: ignore
+            return prefix + forge_left(left) + forge_right(right)
+
+    else:
+        prefix = b'\x09' + pair_tag
+
+        def forge_pair_key(key: MichelsonType) -> bytes:
+            args = b''.join(forge(item) for forge, item in zip(forgers, key.items))  # type: ignore
+            return prefix + forge_array(args) + b'\x00' * 4  # no annotations
+
+    return forge_pair_key
+
+
+def get_key_forger(key_type: Type[MichelsonType]) -> KeyForger:
+    """Get function forging keys of the given type the way PACK does (legacy optimized mode, without 0x05 prefix).
+
+    Common key shapes (numbers, strings, bytes, addresses and pairs of them) are forged straight from the values,
+    other types go through Micheline.
+    """
+    forger = key_forgers.get(key_type)
+    if forger is None:
+        forger = simple_key_forgers.get(key_type.prim, forge_key)  # type: ignore
+        if key_type.prim == 'pair':
+            arg_forgers = [get_key_forger(arg) for arg in key_type.args]
+            if forge_key not in arg_forgers:
+                forger = make_pair_key_forger(arg_forgers)
+        key_forgers[key_type] = forger
+    return forger
+
+
+map_items = MapType.items  # slot descriptor, wrapped by a property in BigMapType
+
 
 class BigMapType(MapType, prim='big_map', args_len=2):
+    __slots__ = ('ptr', '_removed_keys', 'context', 'lazy_updates', 'lazy_values')
+
     def __init__(
         self,
         items: List[Tuple[MichelsonType, MichelsonType]],
         ptr: Optional[int] = None,
         removed_keys: Optional[List[MichelsonType]] = None,
     ):
+        self.lazy_updates: Optional[Dict[str, dict]] = None
+        self.lazy_values: Dict[str, Optional[MichelsonType]] = {}  # NOTE: updates decoded by `get`, by key hash
         super(BigMapType, self).__init__(items=items)
         self.ptr = ptr
         self.removed_keys = removed_keys or []
         self.context: Optional[AbstractContext] = None
 
+    @property
+    def items(self) -> List[Tuple[MichelsonType, MichelsonType]]:  # type: ignore
+        if self.lazy_updates is not None:
+            self.decode_lazy_updates()
+        return map_items.__get__(self)
+
+    @items.setter
+    def items(self, items: List[Tuple[MichelsonType, MichelsonType]]) -> None:
+        map_items.__set__(self, items)
+
+    @property
+    def removed_keys(self) -> List[MichelsonType]:
+        if self.lazy_updates is not None:
+            self.decode_lazy_updates()
+        return self._removed_keys
+
+    @removed_keys.setter
+    def removed_keys(self, removed_keys: List[MichelsonType]) -> None:
+        self._removed_keys = removed_keys
+
+    def decode_lazy_updates(self) -> None:
+        """Decode updates of the merged lazy diff into items and removed keys."""
+        assert self.lazy_updates is not None
+        items: List[Tuple[MichelsonType, MichelsonType]] = []
+        removed_keys: List[MichelsonType] = []
+        for key_hash, update in self.lazy_updates.items():
+            key = self.args[0].from_micheline_value(update['key'])
+            if update.get('value'):
+                value = self.lazy_values.get(key_hash)
+                if value is None:
+                    value = self.args[1].from_micheline_value(update['value'])
+                items.append((key, value))
+            else:
+                removed_keys.append(key)
+        items.sort(key=lambda x: x[0])
+        removed_keys.sort()
+        self.lazy_updates = None
+        self.lazy_values = {}
+        self.items = items
+        self._keys = None
+        self.removed_keys = removed_keys
+
     def __len__(self):
         return len(self.items) + len(self.removed_keys)
 
@@ -47,8 +176,22 @@ class BigMapType(MapType, prim='big_map', args_len=2):
             elements = [f'{repr(k)}: {repr(v)}' for k, v in self]
             return f'{{{", ".join(elements)}}}'
 
+    def __copy__(self):
+        res = type(self)(items=map_items.__get__(self), ptr=self.ptr, removed_keys=self._removed_keys)
+        res._keys = self._keys
+        res.lazy_updates = self.lazy_updates  # never mutated, can be shared
+        res.lazy_values = self.lazy_values  # decoded values are immutable, can be shared as well
+        res.context = self.context
+        return res
+
     def __deepcopy__(self, memodict):
-        return self.duplicate()
+        res = type(self)(
+            items=deepcopy(self.items, memodict),
+            ptr=self.ptr,
+            removed_keys=deepcopy(self.removed_keys, memodict),
+        )
+        res.context = self.context
+        return res
 
     def __getitem__(self, key_obj) -> Optional[MichelsonType]:  # type: ignore
         key = self.args[0].from_python_object(key_obj)
@@ -129,20 +272,21 @@ class BigMapType(MapType, prim='big_map', args_len=2):
             return self.ptr
 
     def merge_lazy_diff(self, lazy_diff: List[dict]) -> 'BigMapType':
+        """Attach updates from the lazy storage diff, they are decoded only when accessed.
+
+        :param lazy_diff: `lazy_storage_diff`, preferably wrapped in `LazyDiffIndex` when merging many values
+        """
         assert self.ptr is not None, f'Big_map id is not defined'
         assert isinstance(lazy_diff, list), f'expected list, got {type(lazy_diff).__name__}'
-        diff = next((item for item in lazy_diff if item['kind'] == 'big_map' and item['id'] == str(self.ptr)), None)
+        diff = find_lazy_diff(lazy_diff, 'big_map', self.ptr)
         if diff:
-            items: List[Tuple[MichelsonType, MichelsonType]] = []
-            removed_keys: List[MichelsonType] = []
-            for update in diff['diff'].get('updates', []):
-                key = self.args[0].from_micheline_value(update['key'])
-                if update.get('value'):
-                    value = self.args[1].from_micheline_value(update['value'])
-                    items.append((key, value))
-                else:
-                    removed_keys.append(key)
-            res = type(self)(ptr=self.ptr, items=items, removed_keys=removed_keys)
+            res = type(self)(ptr=self.ptr, items=[])
+            updates = diff['diff'].get('updates', [])
+            res.lazy_updates = {update.get('key_hash'): update for update in updates}  # type: ignore
+            if None in res.lazy_updates or len(res.lazy_updates) != len(updates):
+                # NOTE: updates cannot be looked up by key hash, decode right away
+                res.lazy_updates = dict(enumerate(updates))  # type: ignore
+                res.decode_lazy_updates()
             res.context = self.context
             return res
         else:
@@ -155,18 +299,20 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         else:
             src_ptr, dst_ptr, action = self.ptr, self.ptr, 'update'
 
-        def make_update(key: MichelsonType, val: Optional[MichelsonType]) -> dict:
+        def make_update(key: MichelsonType, val: Optional[MichelsonType], key_hash: str) -> dict:
             update = {
                 'key': key.to_micheline_value(mode=mode),
-                'key_hash': forge_script_expr(key.pack(legacy=True)),
+                'key_hash': key_hash,
             }
             if val is not None:
                 update['value'] = val.to_micheline_value(mode=mode)
             return update
 
+        updates = list(self)
+        key_hashes = self.hash_keys([key for key, _ in updates])
         diff = {
             'action': action,
-            'updates': [make_update(key, val) for key, val in self],
+            'updates': [make_update(key, val, key_hash) for (key, val), key_hash in zip(updates, key_hashes)],
         }
         if action == 'alloc':
             key_type, val_type = [arg.as_micheline_expr() for arg in self.args]
@@ -201,49 +347,107 @@ class BigMapType(MapType, prim='big_map', args_len=2):
         if context.tzt:  # type: ignore
             context.tzt_big_maps[self.ptr] = self  # type: ignore
 
+    def bisect_removed(self, key: MichelsonType) -> Tuple[int, bool]:
+        """Binary search over the sorted removed keys.
+
+        :returns: tuple(insertion index, whether the key is removed)
+        """
+        idx = bisect_left(self.removed_keys, key)
+        return idx, idx < len(self.removed_keys) and self.removed_keys[idx] == key
+
     def get(self, key: MichelsonType, dup=True) -> Optional[MichelsonType]:
         self.args[0].assert_type_equal(type(key))
-        val = next((v for k, v in self if k == key), Undefined)  # search in diff
-        if val is Undefined:
-            assert self.context, f'context is not attached'
-            key_hash = forge_script_expr(key.pack(legacy=True))
-            val_expr = self.context.get_big_map_value(self.ptr, key_hash)  # type: ignore
-            if val_expr is None:
+        if self.lazy_updates is not None:
+            key_hash = self.hash_key(key)
+            if key_hash in self.lazy_values:
+                return self.lazy_values[key_hash]
+            update = self.lazy_updates.get(key_hash)
+            if update is not None:
+                value = self.args[1].from_micheline_value(update['value']) if update.get('value') else None
+                self.lazy_values[key_hash] = value
+                return value
+        else:
+            idx, found = self.bisect(key)  # search in diff
+            if found:
+                return self.items[idx][1]
+            if self.bisect_removed(key)[1]:
                 return None
-            else:
-                return self.args[1].from_micheline_value(val_expr)
+            key_hash = self.hash_key(key)
+        assert self.context, f'context is not attached'
+        val_expr = self.context.get_big_map_value(self.ptr, key_hash)  # type: ignore
+        if val_expr is None:
+            return None
+        else:
+            return self.args[1].from_micheline_value(val_expr)
+
+    def prefetch(self, keys: Iterable) -> int:
+        """Load values of several keys from the node concurrently (requires big map cache attached to the context).
+
+        :param keys: Python objects or Michelson values
+        :returns: number of values requested from the node
+        """
+        assert self.context, f'context is not attached'
+        keys = list(map(self.make_key, keys))
+        if self.lazy_updates is not None:
+            key_hashes = [key_hash for key_hash in self.hash_keys(keys) if key_hash not in self.lazy_updates]
         else:
-            return val  # type: ignore
+            keys = [key for key in keys if not (self.bisect(key)[1] or self.bisect_removed(key)[1])]
+            key_hashes = self.hash_keys(keys)
+        if self.ptr is None or not key_hashes:
+            return 0
+        return self.context.prefetch_big_map_values(self.ptr, key_hashes)
 
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
-        removed_keys = set(self.removed_keys)
         prev_val = self.get(key, dup=False)
-        if prev_val is not None:
-            if val is not None:
-                items = [(k, v if k != key else val) for k, v in self]
-            else:  # remove
-                items = [(k, v) for k, v in self if k != key]
-                removed_keys.add(key)
-        else:
-            if val is not None:
-                items = sorted(self.items + [(key, val)], key=lambda x: x[0])
-                if key in removed_keys:
-                    removed_keys.remove(key)
-            else:  # do nothing
-                items = self.items  # type: ignore
-        res = type(self)(items=items, ptr=self.ptr, removed_keys=list(removed_keys))  # type: ignore
+        idx, found = self.bisect(key)
+        removed_idx, removed = self.bisect_removed(key)
+        items, keys, removed_keys = self.items, self.get_keys(), self.removed_keys
+        if val is not None:
+            items = items.copy()
+            if found:
+                items[idx] = (items[idx][0], val)
+            else:
+                items.insert(idx, (key, val))
+                keys = keys.copy()
+                keys.insert(idx, key)
+            if removed:
+                removed_keys = removed_keys[:removed_idx] + removed_keys[removed_idx + 1 :]
+        elif prev_val is not None:  # remove
+            if found:
+                items = items[:idx] + items[idx + 1 :]
+                keys = keys[:idx] + keys[idx + 1 :]
+            removed_keys = removed_keys.copy()
+            removed_keys.insert(removed_idx, key)
+        res = type(self)(items=items, ptr=self.ptr, removed_keys=removed_keys)
+        res._keys = keys
         res.context = self.context
         return prev_val, res
 
-    def get_key_hash(self, key_obj):
-        key = self.args[0].from_python_object(key_obj)
-        return forge_script_expr(key.pack(legacy=True))
+    @classmethod
+    def make_key(cls, key_obj) -> MichelsonType:
+        return key_obj if isinstance(key_obj, MichelsonType) else cls.args[0].from_python_object(key_obj)
 
-    def duplicate(self):
-        res = type(self)(
-            items=deepcopy(self.items),
-            ptr=self.ptr,
-            removed_keys=deepcopy(self.removed_keys),
-        )
-        res.context = self.context
-        return res
+    @staticmethod
+    def hash_key(key: MichelsonType) -> str:
+        """Get script expression hash of a key, same as `forge_script_expr(key.pack(legacy=True))`."""
+        return next(forge_script_exprs([get_key_forger(type(key))(key)]))
+
+    @classmethod
+    def hash_keys(cls, keys: Iterable) -> List[str]:
+        """Get script expression hashes of many keys at once.
+
+        Keys are forged by a packer specialized for the key type, and each key object is packed only once.
+
+        :param keys: Python objects or Michelson values
+        :returns: list of key hashes in the same order
+        """
+        forged: Dict[int, bytes] = {}
+        keys = [cls.make_key(key_obj) for key_obj in keys]
+        forge = get_key_forger(cls.args[0])
+        for key in keys:
+            if id(key) not in forged:
+                forged[id(key)] = forge(key)
+        return list(forge_script_exprs(forged[id(key)] for key in keys))
+
+    def get_key_hash(self, key_obj):
+        return self.hash_key(self.make_key(key_obj))
@@ -36,6 +36,8 @@ class UnitLiteral(Micheline, prim='Unit'):
 
 
 class StringType(MichelsonType, prim='string'):
+    __slots__ = ('value',)
+
     def __init__(self, value: str = ''):
         super(StringType, self).__init__()
         self.value = value
@@ -96,6 +98,8 @@ class StringType(MichelsonType, prim='string'):
 
 
 class IntType(MichelsonType, prim='int'):
+    __slots__ = ('value',)
+
     def __init__(self, value: int = 0):
         super(IntType, self).__init__()
         self.value = value
@@ -146,6 +150,8 @@ class IntType(MichelsonType, prim='int'):
 
 
 class NatType(IntType, prim='nat'):
+    __slots__ = ()
+
     @classmethod
     def from_value(cls, value: int) -> 'NatType':
         assert value >= 0, f'expected natural number, got {value}'
@@ -163,6 +169,8 @@ class NatType(IntType, prim='nat'):
 
 
 class BytesType(MichelsonType, prim='bytes'):
+    __slots__ = ('value',)
+
     def __init__(self, value: bytes = b''):
         super(BytesType, self).__init__()
         self.value = value
@@ -230,6 +238,8 @@ class BytesType(MichelsonType, prim='bytes'):
 
 
 class BoolType(MichelsonType, prim='bool'):
+    __slots__ = ('value',)
+
     def __init__(self, value: bool):
         super(BoolType, self).__init__()
         self.value = value
@@ -286,6 +296,8 @@ class BoolType(MichelsonType, prim='bool'):
 
 
 class UnitType(MichelsonType, prim='unit'):
+    __slots__ = ()
+
     def __init__(self):
         super(UnitType, self).__init__()
 
@@ -326,6 +338,8 @@ class UnitType(MichelsonType, prim='unit'):
 
 
 class NeverType(MichelsonType, prim='never'):
+    __slots__ = ()
+
     def __lt__(self, other: 'NeverType'):  # type: ignore
         return False
 
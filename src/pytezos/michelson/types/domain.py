@@ -35,6 +35,8 @@ from pytezos.michelson.types.core import StringType
 
 
 class TimestampType(IntType, prim='timestamp'):  # type: ignore
+    __slots__ = ()
+
     @classmethod
     def from_value(cls, value: int) -> 'TimestampType':
         return cls(value)
@@ -67,6 +69,8 @@ class TimestampType(IntType, prim='timestamp'):  # type: ignore
 
 
 class MutezType(NatType, prim='mutez'):
+    __slots__ = ()
+
     def __repr__(self):
         return str(Decimal(self.value) / 10**6)
 
@@ -91,6 +95,8 @@ class MutezType(NatType, prim='mutez'):
 
 
 class AddressType(StringType, prim='address'):
+    __slots__ = ()
+
     def __repr__(self):
         return f'{self.value[:6]}…{self.value[-3:]}'
 
@@ -141,6 +147,8 @@ class AddressType(StringType, prim='address'):
 
 
 class TXRAddress(StringType, prim='tx_rollup_l2_address'):
+    __slots__ = ()
+
     def __repr__(self):
         return f'{self.value[:6]}…{self.value[-3:]}'
 
@@ -191,6 +199,8 @@ class TXRAddress(StringType, prim='tx_rollup_l2_address'):
 
 
 class KeyType(StringType, prim='key'):
+    __slots__ = ()
+
     @property
     def raw(self) -> bytes:
         return base58_decode(self.value.encode())
@@ -257,6 +267,8 @@ class KeyType(StringType, prim='key'):
 
 
 class KeyHashType(StringType, prim='key_hash'):
+    __slots__ = ()
+
     @classmethod
     def dummy(cls, context: AbstractContext) -> 'KeyHashType':
         return cls.from_value(context.get_dummy_key_hash())
@@ -290,6 +302,8 @@ class KeyHashType(StringType, prim='key_hash'):
 
 
 class SignatureType(StringType, prim='signature'):
+    __slots__ = ()
+
     @classmethod
     def dummy(cls, context: AbstractContext) -> 'SignatureType':
         return cls.from_value(context.get_dummy_signature())
@@ -327,6 +341,8 @@ class SignatureType(StringType, prim='signature'):
 
 
 class ChainIdType(StringType, prim='chain_id'):
+    __slots__ = ()
+
     @classmethod
     def dummy(cls, context: AbstractContext) -> 'ChainIdType':
         return cls.from_value(context.get_dummy_chain_id())
@@ -360,6 +376,8 @@ class ChainIdType(StringType, prim='chain_id'):
 
 
 class ContractType(AddressType, prim='contract', args_len=1):
+    __slots__ = ()
+
     def __repr__(self):
         address, entrypoint = self.get_address(), self.get_entrypoint()
         return f'{address[:6]}…{address[-3:]}%{entrypoint}'
@@ -396,6 +414,8 @@ class ContractType(AddressType, prim='contract', args_len=1):
 
 
 class LambdaType(MichelsonType, prim='lambda', args_len=2):  # type: ignore
+    __slots__ = ('value',)
+
     def __init__(self, value: Type[Micheline]):
         super(LambdaType, self).__init__()
         self.value = value
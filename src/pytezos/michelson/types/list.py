@@ -1,5 +1,8 @@
+from copy import deepcopy
+from itertools import islice
 from typing import Generator
 from typing import List
+from typing import Optional
 from typing import Tuple
 from typing import Type
 
@@ -10,23 +13,47 @@ from pytezos.michelson.types.base import MichelsonType
 
 
 class ListType(MichelsonType, prim='list', args_len=1):
+    # NOTE: persistent representation, cons cells `(item, next)` in front of the immutable `base[offset:]` slice,
+    # so that CONS and IF_CONS are O(1) and versions share their tails
+    __slots__ = ('prefix', 'prefix_len', 'base', 'offset')
+
     def __init__(self, items: List[MichelsonType]):
         super(ListType, self).__init__()
-        self.items = items
+        self.prefix: Optional[tuple] = None
+        self.prefix_len = 0
+        self.base = items
+        self.offset = 0
 
     def __repr__(self):
-        return f'[{", ".join(map(repr, self.items))}]'
+        return f'[{", ".join(map(repr, self))}]'
 
     def __len__(self):
-        return len(self.items)
+        return self.prefix_len + len(self.base) - self.offset
 
     def __iter__(self) -> Generator[MichelsonType, None, None]:
-        yield from self.items
+        cell = self.prefix
+        while cell is not None:
+            item, cell = cell
+            yield item
+        yield from islice(self.base, self.offset, None)
 
     def __eq__(self, other) -> bool:
         if not isinstance(other, ListType):
             return False
-        return self.items == other.items
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __deepcopy__(self, memodict):
+        # cons cells are nested tuples, default deepcopy would recurse as deep as the list is long
+        return type(self)(deepcopy(self.items, memodict))
+
+    @property
+    def items(self) -> List[MichelsonType]:
+        return list(self)
+
+    def derive(self, prefix: Optional[tuple], prefix_len: int, offset: int) -> 'ListType':
+        res = type(self)(self.base)
+        res.prefix, res.prefix_len, res.offset = prefix, prefix_len, offset
+        return res
 
     @staticmethod
     def empty(item_type: Type[MichelsonType]):
@@ -65,7 +92,7 @@ class ListType(MichelsonType, prim='list', args_len=1):
         return cls(items)
 
     def to_literal(self) -> Type[Micheline]:
-        return MichelineSequence.create_type(args=[item.to_literal() for item in self.items])
+        return MichelineSequence.create_type(args=[item.to_literal() for item in self])
 
     def to_micheline_value(self, mode='readable', lazy_diff=False):
         return list(map(lambda x: x.to_micheline_value(mode=mode, lazy_diff=lazy_diff), self))
@@ -96,15 +123,24 @@ class ListType(MichelsonType, prim='list', args_len=1):
 
     def split_head(self) -> Tuple[MichelsonType, 'ListType']:
         assert len(self) > 0, f'cannot split empty list'
-        head = self.items[0]
-        tail = type(self)(self.items[1:])
-        return head, tail
+        if self.prefix is not None:
+            head, prefix = self.prefix
+            return head, self.derive(prefix, self.prefix_len - 1, self.offset)
+        return self.base[self.offset], self.derive(None, 0, self.offset + 1)
 
     def prepend(self, item: MichelsonType) -> 'ListType':
         self.args[0].assert_type_equal(type(item))
-        return type(self)([item] + self.items)
+        return self.derive((item, self.prefix), self.prefix_len + 1, self.offset)
 
     def __getitem__(self, idx: int) -> MichelsonType:
         assert isinstance(idx, int), f'expected int, got {type(idx).__name__}'
         assert idx < len(self), f'index out of bounds: {idx} >= {len(self)}'
-        return self.items[idx]
+        if idx < 0:
+            idx += len(self)
+            assert idx >= 0, f'index out of bounds: {idx - len(self)}'
+        if idx >= self.prefix_len:
+            return self.base[self.offset + idx - self.prefix_len]
+        cell = self.prefix
+        for _ in range(idx):
+            cell = cell[1]  # type: ignore
+        return cell[0]  # type: ignore
@@ -1,3 +1,4 @@
+from bisect import bisect_left
 from typing import Callable
 from typing import Generator
 from typing import List
@@ -17,9 +18,13 @@ class EltLiteral(Micheline, prim='Elt', args_len=2):
 
 
 class MapType(MichelsonType, prim='map', args_len=2):
+    # NOTE: items are sorted by key and never mutated in place, so that lists can be shared between versions
+    __slots__ = ('items', '_keys')
+
     def __init__(self, items: List[Tuple[MichelsonType, MichelsonType]]):
         super(MapType, self).__init__()
         self.items = items
+        self._keys: Optional[List[MichelsonType]] = None
 
     def __repr__(self):
         elements = [f'{repr(k)}: {repr(v)}' for k, v in self.items]
@@ -54,9 +59,10 @@ class MapType(MichelsonType, prim='map', args_len=2):
 
     @classmethod
     def check_constraints(cls, items: List[Tuple[MichelsonType, MichelsonType]]):
-        keys = list(map(lambda x: x[0], items))
-        assert len(set(keys)) == len(keys), f'duplicate keys found'
-        assert keys == sorted(keys), f'keys are unsorted'
+        for (prev_key, _), (key, _) in zip(items, items[1:]):
+            if not prev_key < key:
+                assert prev_key != key, f'duplicate keys found'
+                raise AssertionError('keys are unsorted')
 
     @classmethod
     def generate_pydoc(cls, definitions: List[Tuple[str, str]], inferred_name=None, comparable=False):
@@ -157,28 +163,53 @@ class MapType(MichelsonType, prim='map', args_len=2):
         for _, val in self.items:
             val.attach_context(context, big_map_copy=big_map_copy)
 
+    def get_keys(self) -> List[MichelsonType]:
+        if self._keys is None:
+            self._keys = [k for k, _ in self.items]
+        return self._keys
+
+    def bisect(self, key: MichelsonType) -> Tuple[int, bool]:
+        """Binary search over the sorted keys.
+
+        :returns: tuple(insertion index, whether the key is present)
+        """
+        keys = self.get_keys()
+        idx = bisect_left(keys, key)
+        return idx, idx < len(keys) and keys[idx] == key
+
     def get(self, key: MichelsonType, dup=True) -> Optional[MichelsonType]:
         self.args[0].assert_type_equal(type(key))
         if dup:
             assert self.args[1].is_duplicable(), f'use GET_AND_UPDATE instead'
-        return next((v for k, v in self.items if k == key), None)
+        idx, found = self.bisect(key)
+        return self.items[idx][1] if found else None
 
     def contains(self, key: MichelsonType):
         return self.get(key, dup=False) is not None
 
     def update(self, key: MichelsonType, val: Optional[MichelsonType]) -> Tuple[Optional[MichelsonType], MichelsonType]:
-        prev_val = self.get(key, dup=False)
-        if prev_val is not None:
+        self.args[0].assert_type_equal(type(key))
+        idx, found = self.bisect(key)
+        keys = self.get_keys()
+        prev_val = self.items[idx][1] if found else None
+        if found:
             if val is not None:
-                items = [(k, v if k != key else val) for k, v in self.items]
+                items = self.items.copy()
+                items[idx] = (items[idx][0], val)
             else:  # remove
-                items = [(k, v) for k, v in self.items if k != key]
+                items = self.items[:idx] + self.items[idx + 1 :]
+                keys = keys[:idx] + keys[idx + 1 :]
         else:
             if val is not None:
-                items = sorted(self.items + [(key, val)], key=lambda x: x[0])
+                items = self.items.copy()
+                items.insert(idx, (key, val))
+                keys = keys.copy()
+                keys.insert(idx, key)
             else:  # do nothing
                 items = self.items
-        return prev_val, type(self)(items)
+        res = type(self)(items)
+        res._keys = keys
+        return prev_val, res
 
     def __contains__(self, key_obj):
         key = self.args[0].from_python_object(key_obj)
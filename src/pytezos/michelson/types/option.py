@@ -18,6 +18,8 @@ class SomeLiteral(Micheline, prim='Some', args_len=1):
 
 
 class OptionType(MichelsonType, prim='option', args_len=1):
+    __slots__ = ('item',)
+
     def __init__(self, item: Optional[MichelsonType]):
         super(OptionType, self).__init__()
         self.item = item
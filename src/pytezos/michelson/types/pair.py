@@ -19,6 +19,8 @@ class PairLiteral(Micheline, prim='Pair', args_len=None):
 
 
 class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
+    __slots__ = ('items',)
+
     def __init__(self, items: Tuple[MichelsonType, ...]):
         super(PairType, self).__init__()
         self.items = items
@@ -29,10 +31,12 @@ class PairType(MichelsonType, ADTMixin, prim='pair', args_len=None):
         return all(item == other.items[i] for i, item in enumerate(self.items))
 
     def __lt__(self, other: 'PairType'):  # type: ignore
-        for i, item in enumerate(self.items):  # noqa: SIM111
-            if item > other.items[i]:
+        for i, item in enumerate(self.items):
+            if item < other.items[i]:
+                return True
+            if other.items[i] < item:
                 return False
-        return True
+        return False
 
     def __hash__(self):
         return hash(self.items)
@@ -1,6 +1,8 @@
+from bisect import bisect_left
 from copy import copy
 from typing import Generator
 from typing import List
+from typing import Tuple
 from typing import Type
 
 from pytezos.context.abstract import AbstractContext
@@ -10,6 +12,9 @@ from pytezos.michelson.types.base import MichelsonType
 
 
 class SetType(MichelsonType, prim='set', args_len=1):
+    # NOTE: items are sorted and never mutated in place, so that lists can be shared between versions
+    __slots__ = ('items',)
+
     def __init__(self, items: List[MichelsonType]):
         super(SetType, self).__init__()
         self.items = items
@@ -45,8 +50,10 @@ class SetType(MichelsonType, prim='set', args_len=1):
 
     @classmethod
     def check_constraints(cls, items: List[MichelsonType]):
-        assert len(set(items)) == len(items), f'duplicate elements found'
-        assert items == sorted(items), f'set elements are not sorted'
+        for prev_item, item in zip(items, items[1:]):
+            if not prev_item < item:
+                assert prev_item != item, f'duplicate elements found'
+                raise AssertionError('set elements are not sorted')
 
     @classmethod
     def dummy(cls, context: AbstractContext):
@@ -98,21 +105,31 @@ class SetType(MichelsonType, prim='set', args_len=1):
         )
         return f'{{ {arg_doc}, … }}'
 
-    def contains(self, item: MichelsonType) -> bool:
+    def bisect(self, item: MichelsonType) -> Tuple[int, bool]:
+        """Binary search over the sorted elements.
+
+        :returns: tuple(insertion index, whether the element is present)
+        """
         self.args[0].assert_type_equal(type(item))
-        return item in self.items
+        idx = bisect_left(self.items, item)
+        return idx, idx < len(self.items) and self.items[idx] == item
+
+    def contains(self, item: MichelsonType) -> bool:
+        return self.bisect(item)[1]
 
     def add(self, item: MichelsonType) -> 'SetType':
-        if self.contains(item):
+        idx, found = self.bisect(item)
+        if found:
             return copy(self)
         else:
-            items = [item] + self.items
-            return type(self)(sorted(items))
+            items = self.items.copy()
+            items.insert(idx, item)
+            return type(self)(items)
 
     def remove(self, item: MichelsonType) -> 'SetType':
-        if self.contains(item):
-            items = list(filter(lambda x: x != item, self.items))
-            return type(self)(items)
+        idx, found = self.bisect(item)
+        if found:
+            return type(self)(self.items[:idx] + self.items[idx + 1 :])
         else:
             return copy(self)
 
@@ -28,6 +28,8 @@ class RightLiteral(Micheline, prim='Right', args_len=1):
 
 
 class OrType(MichelsonType, ADTMixin, prim='or', args_len=2):
+    __slots__ = ('items',)
+
     is_enum: bool
 
     def __init__(self, items: Tuple[Union[undefined, MichelsonType], ...]):
@@ -1,3 +1,5 @@
+import asyncio
+from functools import partial
 from pprint import pformat
 from typing import Any
 from typing import Dict
@@ -26,6 +28,8 @@ from pytezos.operation.fees import default_gas_limit
 from pytezos.operation.fees import default_storage_limit
 from pytezos.operation.forge import forge_operation_group
 from pytezos.operation.result import OperationResult
+from pytezos.rpc.aio import AsyncRpcNode
+from pytezos.rpc.aio import AsyncShellQuery
 from pytezos.rpc.errors import RpcError
 from pytezos.rpc.kind import validation_passes
 
@@ -415,6 +419,7 @@ class OperationGroup(ContextMixin, ContentMixin):
         block_timeout: Optional[int] = None,
         min_confirmations: int = 0,
         prevalidate: bool = True,
+        monitor: bool = False,
         **kwargs,
     ):
         """Inject the signed operation group.
@@ -425,6 +430,7 @@ class OperationGroup(ContextMixin, ContentMixin):
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
         :param min_confirmations: number of block injections to wait for before returning
         :param prevalidate: ask node to pre-validate the operation before the injection (True by default)
+        :param monitor: wait for confirmations using the streaming monitor RPCs instead of polling
         :returns: operation group with metadata (raw RPC response)
         """
         self.context.reset()  # reset counter
@@ -447,6 +453,96 @@ class OperationGroup(ContextMixin, ContentMixin):
             min_confirmations=min_confirmations,
             time_between_blocks=time_between_blocks,
             block_timeout=block_timeout,
+            monitor=monitor,
+        )
+
+        assert len(operations) == 1
+        if check_result:
+            if not OperationResult.is_applied(operations[0]):
+                raise RpcError.from_errors(OperationResult.errors(operations[0]))
+
+        return operations[0]
+
+    async def asend(
+        self,
+        gas_reserve: int = DEFAULT_GAS_RESERVE,
+        burn_reserve: int = DEFAULT_BURN_RESERVE,
+        min_confirmations: int = 0,
+        ttl: Optional[int] = None,
+        shell: Optional[AsyncShellQuery] = None,
+    ) -> 'OperationGroup':
+        """Coroutine version of :meth:`send`, autofill and signing are run in the default executor.
+
+        :param gas_reserve: Add a safe reserve for dynamically calculated gas limit (default is 100).
+        :param burn_reserve: Add a safe reserve for dynamically calculated storage limit (default is 100).
+        :param min_confirmations: number of block injections to wait for before returning (default is 0, i.e. async mode)
+        :param ttl: Number of blocks to wait in the mempool before removal (default is 5 for public network, 60 for sandbox)
+        :param shell: async shell to use for injection (by default a temporary one is created for the context node)
+        :return: OperationGroup with hash filled
+        """
+        loop = asyncio.get_running_loop()
+        if ttl is None:
+            ttl = await loop.run_in_executor(None, self.context.get_operations_ttl)
+
+        autofill = partial(self.autofill, gas_reserve=gas_reserve, burn_reserve=burn_reserve, ttl=ttl)
+        opg = (await loop.run_in_executor(None, autofill)).sign()
+        res = await opg.ainject(min_confirmations=min_confirmations, num_blocks_wait=ttl, shell=shell)
+        return opg._spawn(opg_hash=res['hash'], opg_result=res)
+
+    async def ainject(
+        self,
+        check_result: bool = True,
+        num_blocks_wait: int = 5,
+        time_between_blocks: Optional[int] = None,
+        block_timeout: Optional[int] = None,
+        min_confirmations: int = 0,
+        prevalidate: bool = True,
+        shell: Optional[AsyncShellQuery] = None,
+    ):
+        """Coroutine version of :meth:`inject`.
+
+        :param check_result: raise RpcError in case operation is applied but has runtime errors
+        :param num_blocks_wait: number of blocks to wait for injection
+        :param time_between_blocks: override the corresponding parameter from constants
+        :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param min_confirmations: number of block injections to wait for before returning
+        :param prevalidate: ask node to pre-validate the operation before the injection (True by default)
+        :param shell: async shell to use (by default a temporary one is created for the context node,
+            which must be a single `RpcNode`)
+        :returns: operation group with metadata (raw RPC response)
+        """
+        if shell is None:
+            async with AsyncRpcNode.from_node(self.shell.node) as node:
+                return await self.ainject(
+                    check_result=check_result,
+                    num_blocks_wait=num_blocks_wait,
+                    time_between_blocks=time_between_blocks,
+                    block_timeout=block_timeout,
+                    min_confirmations=min_confirmations,
+                    prevalidate=prevalidate,
+                    shell=AsyncShellQuery(node),
+                )
+
+        self.context.reset()  # reset counter
+
+        opg_hash = await shell.injection.operation.post(
+            operation=self.binary_payload(),
+            _async=not prevalidate,
+        )
+
+        if min_confirmations == 0:
+            return {
+                'chain_id': self.chain_id,
+                'hash': opg_hash,
+                **self.json_payload(),
+            }
+
+        operations = await shell.wait_operations(
+            opg_hashes=[opg_hash],
+            ttl=num_blocks_wait,
+            min_confirmations=min_confirmations,
+            time_between_blocks=time_between_blocks,
+            block_timeout=block_timeout,
         )
 
         assert len(operations) == 1
@@ -1,6 +1,11 @@
+from pytezos.rpc.aio import AsyncRpcNode
+from pytezos.rpc.aio import AsyncRpcQuery
+from pytezos.rpc.aio import AsyncShellQuery
+from pytezos.rpc.cache import RpcCache
 from pytezos.rpc.helpers import *
 from pytezos.rpc.node import RpcMultiNode
 from pytezos.rpc.node import RpcNode
 from pytezos.rpc.protocol import *
 from pytezos.rpc.search import *
 from pytezos.rpc.shell import *
+from pytezos.rpc.tracing import RpcTracer
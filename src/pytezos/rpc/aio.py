@@ -0,0 +1,526 @@
+import asyncio
+from datetime import datetime
+from datetime import timezone
+from time import perf_counter
+from typing import Any
+from typing import AsyncGenerator
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+import simplejson
+from simplejson import JSONDecodeError
+
+from pytezos.logging import logger
+from pytezos.rpc.node import DEFAULT_POOL_MAXSIZE
+from pytezos.rpc.node import DEFAULT_TIMEOUT
+from pytezos.rpc.node import RpcError
+from pytezos.rpc.node import RpcMultiNode
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.node import _urljoin
+from pytezos.rpc.query import RpcQuery
+from pytezos.rpc.shell import MAX_BLOCK_TIMEOUT
+from pytezos.rpc.shell import ConfirmationTracker
+from pytezos.rpc.stream import JsonStreamDecoder
+from pytezos.rpc.tracing import RpcTrace
+from pytezos.rpc.tracing import RpcTracer
+from pytezos.rpc.tracing import get_path_template
+
+
+class AioExtraFallback:
+    def __getattr__(self, item):
+        raise ImportError("Please, install aiohttp package (`pip install nobi-pytezos[aio]`) to use async RPC client")
+
+
+try:
+    import aiohttp  # type: ignore
+except ImportError:
+    aiohttp = AioExtraFallback()  # type: ignore
+
+
+def _prepare_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Drop empty values and stringify the rest (aiohttp does not accept None and bool query values)."""
+    res = {}
+    for key, value in (params or {}).items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = 'true' if value else 'false'
+        res[key] = str(value)
+    return res
+
+
+class AsyncRpcNode:
+    """Asynchronous request proxy for a single Tezos node (requires aiohttp).
+
+    Keeps a pooled client session, so that many concurrent requests (e.g. `asyncio.gather` fan-out)
+    share a bounded number of connections. The session is created lazily inside the running event loop.
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        keep_alive: bool = True,
+        tracer: Optional[RpcTracer] = None,
+    ) -> None:
+        """
+        :param uri: node address (or list of addresses, only the first one is used)
+        :param headers: extra headers sent with every request
+        :param pool_maxsize: max number of simultaneous connections to the node
+        :param keep_alive: reuse connections between requests (set False to close them after each request)
+        :param tracer: request hooks and latency histograms
+        """
+        if not uri:
+            raise RuntimeError()
+        if not isinstance(uri, list):
+            uri = [uri]
+        self.uri = uri
+        self.headers = headers or {}
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.tracer = tracer
+        self._session: Optional['aiohttp.ClientSession'] = None
+
+    @classmethod
+    def from_node(cls, node: RpcNode) -> 'AsyncRpcNode':
+        """Create async proxy with the same address and settings as a synchronous one.
+
+        :raises NotImplementedError: node is an :class:`RpcMultiNode` (async client talks to a single node)
+        """
+        if isinstance(node, RpcMultiNode):
+            raise NotImplementedError(
+                'Async client does not support multiple nodes, pass an explicit `AsyncShellQuery` instead'
+            )
+        return cls(
+            uri=node.uri,
+            headers=node.headers,
+            pool_maxsize=node.pool_maxsize,
+            keep_alive=node.keep_alive,
+            tracer=node.tracer,
+        )
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nNode address',
+            self.uri[0],
+        ]
+        return '\n'.join(res)
+
+    async def __aenter__(self) -> 'AsyncRpcNode':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> 'aiohttp.ClientSession':
+        """Pooled client session (created on first access, must be called from a coroutine)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize,
+                limit_per_host=self.pool_maxsize,
+                force_close=not self.keep_alive,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self) -> None:
+        """Close all pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def request(self, method: str, path: str, **kwargs) -> str:
+        """Perform HTTP request to node.
+
+        :param method: one of GET/POST/PUT/DELETE
+        :param path: path to endpoint
+        :param kwargs: `params`, `json`, and `timeout` arguments
+        :raises RpcError: node has returned an error
+        :returns: response body
+        """
+        if self.tracer is None:
+            return self._check_response(path, *await self._send(method, path, **kwargs))
+
+        self.tracer.on_request(method, path, kwargs)
+        status: Optional[int] = None
+        size: Optional[int] = None
+        error: Optional[Exception] = None
+        started_at = perf_counter()
+        try:
+            status, content_type, text = await self._send(method, path, **kwargs)
+            size = len(text)
+            return self._check_response(path, status, content_type, text)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.tracer.on_response(
+                RpcTrace(
+                    node=self.uri[0],
+                    method=method,
+                    path=path,
+                    template=get_path_template(path),
+                    status=status,
+                    size=size,
+                    latency=perf_counter() - started_at,
+                    error=error,
+                )
+            )
+
+    async def _send(self, method: str, path: str, **kwargs) -> Tuple[int, str, str]:
+        logger.debug('>>>>> %s %s', method, path)
+        async with self.session.request(
+            method=method,
+            url=_urljoin(self.uri[0], path),
+            headers={'content-type': 'application/json', 'user-agent': 'PyTezos', **self.headers},
+            params=_prepare_params(kwargs.get('params')),
+            json=kwargs.get('json'),
+            timeout=aiohttp.ClientTimeout(total=kwargs.get('timeout') or DEFAULT_TIMEOUT),
+        ) as res:
+            return res.status, res.content_type, await res.text()
+
+    @staticmethod
+    def _check_response(path: str, status: int, content_type: str, text: str) -> str:
+        if status == 401:
+            logger.debug('<<<<< %s\n%s', status, text)
+            raise RpcError(f'Unauthorized: {path}')
+        if status == 404:
+            logger.debug('<<<<< %s\n%s', status, text)
+            raise RpcError(f'Not found: {path}')
+        if status != 200:
+            logger.debug('<<<<< %s\n%s', status, text)
+            raise RpcError.from_text(text, content_type)
+
+        logger.debug('<<<<< %s (%d bytes)', status, len(text))
+        return text
+
+    async def stream(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        unwrap: bool = False,
+    ) -> AsyncGenerator[Any, None]:
+        """Iterate over chunks of a streamed (`/monitor`) response.
+
+        :param path: path to endpoint
+        :param params: query arguments
+        :param unwrap: yield elements of the top-level array rather than the array itself
+        :returns: async generator of decoded JSON chunks
+        """
+        async with self.session.get(
+            url=_urljoin(self.uri[0], path),
+            headers={'user-agent': 'PyTezos', **self.headers},
+            params=_prepare_params(params),
+            timeout=aiohttp.ClientTimeout(total=None),
+        ) as res:
+            if res.status != 200:
+                raise RpcError.from_text(await res.text(), res.content_type)
+            decoder = JsonStreamDecoder(unwrap=unwrap)
+            async for data in res.content.iter_any():
+                for chunk in decoder.feed(data):
+                    yield chunk
+            for chunk in decoder.close():
+                yield chunk
+
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
+        return simplejson.loads(await self.request('GET', path, params=params, timeout=timeout))
+
+    async def post(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json=None,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        text = await self.request('POST', path, params=params, json=json, timeout=timeout)
+        try:
+            return simplejson.loads(text)
+        except JSONDecodeError:
+            return text
+
+    async def delete(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
+        return simplejson.loads(await self.request('DELETE', path, params=params, timeout=timeout))
+
+    async def put(self, path: str, params: Optional[Dict[str, Any]] = None, timeout: Optional[int] = None) -> Any:
+        return simplejson.loads(await self.request('PUT', path, params=params, timeout=timeout))
+
+
+class AsyncRpcQuery(RpcQuery):
+    """Asynchronous twin of :class:`pytezos.rpc.query.RpcQuery`: same path building, awaitable calls.
+
+    >>> await shell.blocks[123].operations[3]()
+    """
+
+    __extensions__ = {}  # type: ignore
+
+    def _spawn_query(self, wild_path, params):
+        child_class = self.__extensions__.get(wild_path, AsyncRpcQuery)
+        return child_class(
+            path=wild_path,
+            node=self.node,
+            params=params,
+        )
+
+    async def __call__(self, **params):
+        return await self.node.get(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
+    async def post(self, json=None, params=None):
+        return await self.node.post(
+            path=self.path,
+            params=params,
+            json=json,
+            timeout=self._timeout,
+        )
+
+    async def put(self, params=None):
+        return await self.node.put(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
+    async def delete(self, params=None):
+        return await self.node.delete(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
+    def iter(self, **params):
+        """Stream the response, decoding elements of the top-level array as they arrive.
+
+        :returns: async generator of array elements
+        """
+        return self.node.stream(path=self.path, params=params, unwrap=True)
+
+    async def _get(self, params=None):
+        return await self.node.get(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
+    async def _post(self, json=None, params=None):
+        return await self.node.post(
+            path=self.path,
+            params=params,
+            json=json,
+            timeout=self._timeout,
+        )
+
+    async def _put(self, params=None):
+        return await self.node.put(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
+    async def _delete(self, params=None):
+        return await self.node.delete(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
+
+class AsyncShellQuery(AsyncRpcQuery, path=''):
+    """Asynchronous entry point for the node RPC (requires aiohttp).
+
+    >>> async with AsyncRpcNode('https://rpc.tzkt.io/mainnet') as node:
+    ...     shell = AsyncShellQuery(node)
+    ...     headers = await asyncio.gather(*(shell.blocks[level].header() for level in range(100, 200)))
+    """
+
+    @property
+    def blocks(self) -> AsyncRpcQuery:
+        """Shortcut for `chains.main.blocks`"""
+        return self.chains.main.blocks
+
+    @property
+    def head(self) -> AsyncRpcQuery:
+        """Shortcut for `blocks.head`"""
+        return self.blocks.head
+
+    @property
+    def contracts(self) -> AsyncRpcQuery:
+        """Shortcut for `head.context.contracts`"""
+        return self.head.context.contracts
+
+    @property
+    def mempool(self) -> AsyncRpcQuery:
+        """Shortcut for `chains.main.mempool`"""
+        return self.chains.main.mempool
+
+    async def pending_operation_hashes(self) -> List[str]:
+        """Get hashes of all operations in the node's mempool."""
+        operations_dict = await self.mempool.pending_operations()
+        hashes = []
+        for operations in operations_dict.values():
+            for operation in operations:
+                hashes.append(operation['hash'] if isinstance(operation, dict) else operation[0])
+        return hashes
+
+    async def wait_blocks(
+        self,
+        current_block_hash: str,
+        max_blocks: int = 1,
+        yield_current=False,
+        time_between_blocks: Optional[int] = None,
+        block_timeout: Optional[int] = None,
+    ) -> AsyncGenerator[str, None]:
+        """Iterates over future blocks (waits and yields block hash), handles reorgs
+
+        :param current_block_hash: hash of the current block (head)
+        :param max_blocks: number of blocks to iterate (not including the current one)
+        :param yield_current: yield current block hash at the very beginning
+        :param time_between_blocks: override protocol constant
+        :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :return: block hashes
+        """
+        if time_between_blocks is None:
+            constants = await self.blocks[current_block_hash].context.constants()
+            time_between_blocks = int(constants.get('minimal_block_delay', 0))
+
+        if block_timeout is None:
+            block_timeout = MAX_BLOCK_TIMEOUT
+
+        if yield_current:
+            yield current_block_hash
+
+        current_header = await self.blocks[current_block_hash].header()
+        max_level = current_header['level'] + max_blocks
+
+        while current_header['level'] < max_level:
+            logger.info('Current level: %d (max %d)', current_header['level'], max_level)
+            prev_block_dt = datetime.strptime(current_header['timestamp'], '%Y-%m-%dT%H:%M:%SZ').replace(
+                tzinfo=timezone.utc
+            )
+            elapsed_sec = (datetime.now(timezone.utc) - prev_block_dt).seconds
+            sleep_sec = 1 if elapsed_sec > time_between_blocks else (time_between_blocks - elapsed_sec + 1)
+
+            logger.info('Sleep %d seconds until block %s is superseded', sleep_sec, current_block_hash)
+            await asyncio.sleep(sleep_sec)
+
+            next_block_hash: Optional[str] = None
+
+            for delay in range(block_timeout):
+                next_block_hash = await self.head.hash()
+                if current_block_hash == next_block_hash:
+                    await asyncio.sleep(1)
+                else:
+                    logger.info('Found new block %s (%d sec delay)', next_block_hash, delay)
+                    break
+
+            if current_block_hash != next_block_hash:
+                assert next_block_hash
+                yield next_block_hash
+                current_block_hash = next_block_hash
+                current_header = await self.blocks[current_block_hash].header()
+            else:
+                raise TimeoutError('Reached timeout (%d sec) while waiting for the next block', block_timeout)
+
+    async def wait_operations(
+        self,
+        opg_hashes: List[str],
+        ttl: int,
+        min_confirmations: int,
+        current_block_hash: Optional[str] = None,
+        time_between_blocks: Optional[int] = None,
+        block_timeout: Optional[int] = None,
+    ) -> List[dict]:
+        """Wait for one or many operations gain enough confirmations
+
+        :param opg_hashes: list of operation hashes
+        :param ttl: max time-to-live value (in mempool)
+        :param min_confirmations: minimum number of blocks after inclusion to wait for
+        :param current_block_hash: current block hash (head)
+        :param time_between_blocks: override protocol constant
+        :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :return: list of operation contents with metadata
+        """
+        tracker = ConfirmationTracker(opg_hashes, min_confirmations)
+        operations = []
+        block_hash = current_block_hash
+
+        if block_hash is None:
+            block_hash = await self.head.hash()
+
+        async for block_hash in self.wait_blocks(  # noqa: B020
+            current_block_hash=block_hash,
+            max_blocks=ttl,
+            yield_current=True,
+            time_between_blocks=time_between_blocks,
+            block_timeout=block_timeout,
+        ):
+            if len(tracker.pending) > 0:
+                tracker.update_mempool(set(await self.pending_operation_hashes()))
+
+            found = tracker.find_included(block_hash, await self.blocks[block_hash].operation_hashes())
+            operations.extend(await asyncio.gather(*(self.blocks[block_hash].operations[i][j]() for i, j in found)))
+            tracker.confirm()
+
+            if tracker.all_included:
+                break
+
+        if not tracker.all_included:
+            raise TimeoutError(tracker.not_included_message())
+
+        async for _ in self.wait_blocks(
+            block_hash,
+            max_blocks=min_confirmations - 1,
+            time_between_blocks=time_between_blocks,
+        ):
+            tracker.confirm()
+
+        return operations
+
+
+class AsyncOperationInjectionQuery(AsyncRpcQuery, path='/injection/operation'):
+    async def post(self, operation, _async=False, chain=None):  # type: ignore
+        """Inject an operation in node and broadcast it.
+
+        :param operation: Hex-encoded operation data or bytes
+        :param _async: By default, the RPC will wait for the operation to be (pre-)validated before answering,
+            set True if you don't want to.
+        :param chain: Optionally you can specify the chain
+        :returns: ID of the operation
+        """
+        if isinstance(operation, bytes):
+            operation = operation.hex()
+
+        return await super().post(
+            params={
+                'async': _async,
+                'chain': chain,
+            },
+            json=operation,
+        )
+
+
+class AsyncMonitorQuery(
+    AsyncRpcQuery,
+    path=[
+        '/monitor/active_chains',
+        '/monitor/bootstrapped',
+        '/monitor/commit_hash',
+        '/monitor/heads/{}',
+        '/monitor/protocols',
+        '/monitor/valid_blocks',
+    ],
+):
+    def __call__(self, **params):  # type: ignore
+        """Subscribe to the stream.
+
+        :returns: async generator of decoded chunks
+        """
+        return self.node.stream(path=self.path, params=params)
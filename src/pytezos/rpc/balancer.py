@@ -0,0 +1,107 @@
+from collections import deque
+from threading import Lock
+from time import monotonic
+from typing import Any
+from typing import Dict
+from typing import Optional
+
+DEFAULT_EWMA_ALPHA = 0.3
+DEFAULT_LATENCY_WINDOW = 100
+DEFAULT_MAX_FAILURES = 3
+DEFAULT_EJECT_TIMEOUT = 30
+
+
+class NodeStats:
+    """Health and latency bookkeeping for a single upstream of :class:`pytezos.rpc.node.RpcMultiNode`."""
+
+    def __init__(
+        self,
+        uri: str,
+        ewma_alpha: float = DEFAULT_EWMA_ALPHA,
+        window: int = DEFAULT_LATENCY_WINDOW,
+    ) -> None:
+        """
+        :param uri: node address
+        :param ewma_alpha: weight of the latest sample in the latency moving average
+        :param window: number of recent latency samples kept for percentile estimation
+        """
+        self.uri = uri
+        self.ewma_alpha = ewma_alpha
+        self.latency: Optional[float] = None
+        self.latencies: deque = deque(maxlen=window)
+        self.head_level: Optional[int] = None
+        self.lagging = False
+        self.requests = 0
+        self.errors = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.in_flight = 0
+        self._lock = Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def on_start(self) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+
+    def on_success(self, latency: float) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.consecutive_failures = 0
+            self.ejected_until = 0.0
+            self.latencies.append(latency)
+            if self.latency is None:
+                self.latency = latency
+            else:
+                self.latency = self.ewma_alpha * latency + (1 - self.ewma_alpha) * self.latency
+
+    def on_failure(
+        self, max_failures: int = DEFAULT_MAX_FAILURES, eject_timeout: float = DEFAULT_EJECT_TIMEOUT
+    ) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.errors += 1
+            self.consecutive_failures += 1
+            if self.consecutive_failures >= max_failures:
+                self.ejected_until = monotonic() + eject_timeout
+
+    def is_ejected(self, now: Optional[float] = None) -> bool:
+        return self.ejected_until > (monotonic() if now is None else now)
+
+    def is_healthy(self, now: Optional[float] = None) -> bool:
+        return not self.lagging and not self.is_ejected(now)
+
+    def score(self) -> float:
+        """Expected latency of the next request, nodes without samples are preferred to get measured."""
+        return (self.latency or 0.0) * (1 + self.in_flight)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Latency percentile over the recent samples window.
+
+        :param q: percentile in range [0, 100]
+        """
+        samples = sorted(self.latencies)
+        if not samples:
+            return None
+        return samples[min(len(samples) - 1, int(q / 100 * len(samples)))]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'uri': self.uri,
+            'latency': self.latency,
+            'p95': self.percentile(95),
+            'head_level': self.head_level,
+            'lagging': self.lagging,
+            'ejected': self.is_ejected(),
+            'requests': self.requests,
+            'errors': self.errors,
+            'in_flight': self.in_flight,
+        }
@@ -0,0 +1,185 @@
+import os
+import re
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from threading import get_ident
+from time import monotonic
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from pytezos.crypto.encoding import is_bh
+
+DEFAULT_CACHE_SIZE = 4096
+DEFAULT_FINALITY_DEPTH = 2
+DEFAULT_FINALITY_TTL = 10
+
+block_path_re = re.compile(r'^/?chains/(?P<chain>[^/]+)/blocks/(?P<block>[^/?]+)(/|$)')
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+def make_cache_key(path: str, params: Optional[Dict[str, Any]] = None) -> CacheKey:
+    """Normalize request path and query arguments (empty ones are dropped as requests does)."""
+    items = tuple(sorted((k, str(v)) for k, v in (params or {}).items() if v is not None))
+    return path.strip('/'), items
+
+
+def is_immutable_block_id(block_id: str) -> bool:
+    """Check if block ID points to a fixed block regardless of the current head (hash or hash~offset)."""
+    block_hash = block_id.split('~')[0]
+    return len(block_hash) == 51 and is_bh(block_hash)
+
+
+class RpcCache:
+    """Opt-in cache of immutable RPC responses: LRU in memory plus optional on-disk store.
+
+    Only GET responses addressed by an explicit block hash, or by a level that is already final,
+    are stored. Responses are kept as raw bytes and decoded on every hit, so callers can safely mutate them.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_SIZE,
+        path: Optional[str] = None,
+        finality_depth: int = DEFAULT_FINALITY_DEPTH,
+        finality_ttl: float = DEFAULT_FINALITY_TTL,
+    ) -> None:
+        """
+        :param maxsize: max number of responses kept in memory
+        :param path: directory for the persistent store (disabled by default)
+        :param finality_depth: number of blocks after which a level is considered final (2 for Tenderbake)
+        :param finality_ttl: how long (in seconds) the last known finalized level is trusted before refreshing
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self.finality_depth = finality_depth
+        self.finality_ttl = finality_ttl
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self._items: 'OrderedDict[CacheKey, bytes]' = OrderedDict()
+        self._lock = Lock()
+        self._finalized_level: Optional[int] = None
+        self._finalized_at = 0.0
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    def __repr__(self) -> str:
+        res = [
+            super().__repr__(),
+            '\nStats',
+            *(f'{k}\t{v}' for k, v in self.stats().items()),
+        ]
+        return '\n'.join(res)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and current size."""
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_hits': self.disk_hits,
+            'hit_ratio': self.hits / total if total else 0.0,
+            'size': len(self._items),
+            'maxsize': self.maxsize,
+        }
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (on-disk store is left intact)."""
+        with self._lock:
+            self._items.clear()
+            self.hits = self.misses = self.disk_hits = 0
+
+    def is_immutable(self, path: str, get_head_level: Callable[[], int]) -> bool:
+        """Check if response for the given path never changes.
+
+        :param path: request path
+        :param get_head_level: callback returning current head level, called only when the path is level-addressed
+            and the last known finalized level is outdated
+        """
+        match = block_path_re.match(path)
+        if match is None:
+            return False
+        block_id = match.group('block')
+        if block_id.isdigit():
+            if match.group('chain') != 'main':
+                return False
+            return int(block_id) <= self.get_finalized_level(get_head_level)
+        return is_immutable_block_id(block_id)
+
+    def get_finalized_level(self, get_head_level: Callable[[], int]) -> int:
+        """Get last finalized level, refreshing it at most once per `finality_ttl` seconds."""
+        now = monotonic()
+        if self._finalized_level is None or now - self._finalized_at > self.finality_ttl:
+            self._finalized_level = get_head_level() - self.finality_depth
+            self._finalized_at = now
+        return self._finalized_level
+
+    def get(self, key: CacheKey) -> Optional[bytes]:
+        """Get raw response from cache, updates hit/miss counters."""
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+                return value
+
+        if self.path is not None:
+            value = self._load(key)
+            if value is not None:
+                with self._lock:
+                    self.hits += 1
+                    self.disk_hits += 1
+                    self._store(key, value)
+                return value
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key: CacheKey, value: bytes) -> None:
+        """Save raw response."""
+        with self._lock:
+            self._store(key, value)
+        if self.path is not None:
+            self._dump(key, value)
+
+    def _store(self, key: CacheKey, value: bytes) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def _get_filename(self, key: CacheKey) -> str:
+        assert self.path is not None
+        return os.path.join(self.path, sha256(repr(key).encode()).hexdigest())
+
+    def _load(self, key: CacheKey) -> Optional[bytes]:
+        try:
+            with open(self._get_filename(key), 'rb') as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _dump(self, key: CacheKey, value: bytes) -> None:
+        filename = self._get_filename(key)
+        tmp_filename = f'{filename}.{os.getpid()}.{get_ident()}.tmp'
+        with open(tmp_filename, 'wb') as f:
+            f.write(value)
+        os.replace(tmp_filename, filename)
@@ -1,16 +1,45 @@
-import json
+import logging
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from pprint import pformat
+from threading import Lock
+from time import monotonic
+from time import perf_counter
 from typing import Any
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Union
 
 import requests
+import requests.adapters
 import requests.exceptions
+import simplejson as json
 from simplejson import JSONDecodeError
 
 from pytezos.logging import logger
+from pytezos.rpc.balancer import DEFAULT_EJECT_TIMEOUT
+from pytezos.rpc.balancer import DEFAULT_MAX_FAILURES
+from pytezos.rpc.balancer import NodeStats
+from pytezos.rpc.cache import CacheKey
+from pytezos.rpc.cache import RpcCache
+from pytezos.rpc.cache import make_cache_key
+from pytezos.rpc.stream import DEFAULT_CHUNK_SIZE
+from pytezos.rpc.stream import iter_json
+from pytezos.rpc.tracing import RpcTrace
+from pytezos.rpc.tracing import RpcTracer
+from pytezos.rpc.tracing import get_path_template
+
+DEFAULT_TIMEOUT = 60
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_MAX_RETRIES = 2
+DEFAULT_MAX_HEAD_LAG = 2
+DEFAULT_HEALTH_CHECK_INTERVAL = 30
+HEALTH_CHECK_TIMEOUT = 5
 
 
 def _urljoin(*args: str) -> str:
@@ -56,31 +85,74 @@ class RpcError(Exception):
     @classmethod
     def from_response(cls, res: requests.Response) -> 'RpcError':
         """Create RpcError from requests Response."""
-        if res.headers.get('content-type') == 'application/json':
+        return cls.from_text(res.text, res.headers.get('content-type'))
+
+    @classmethod
+    def from_text(cls, text: str, content_type: Optional[str] = None) -> 'RpcError':
+        """Create RpcError from raw response body."""
+        if content_type == 'application/json':
             try:
-                errors = res.json()
+                errors = json.loads(text)
             except JSONDecodeError:
                 # sometimes rpc returns invalid json
-                return RpcError(res.text)
+                return RpcError(text)
             assert isinstance(errors, list)
             return cls.from_errors(errors)
         else:
-            return RpcError(res.text)
+            return RpcError(text)
 
     def __str__(self) -> str:
         return pformat(self.args)
 
 
 class RpcNode:
-    """Request proxy for a single Tezos node."""
+    """Request proxy for a single Tezos node.
 
-    def __init__(self, uri: Union[str, List[str]], headers: Optional[Dict[str, str]] = None) -> None:
+    Keeps a pooled HTTP session, so that consecutive requests reuse TCP/TLS connections.
+    The session is created lazily and is safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        cache: Optional[RpcCache] = None,
+        tracer: Optional[RpcTracer] = None,
+        coalesce: bool = True,
+    ) -> None:
+        """
+        :param uri: node address (or list of addresses, only the first one is used)
+        :param headers: extra headers sent with every request
+        :param pool_connections: number of per-host connection pools to cache
+        :param pool_maxsize: max number of connections kept open to a single host
+        :param pool_block: block when there are no free connections instead of opening a new (non-pooled) one
+        :param keep_alive: reuse connections between requests (set False to close them after each request)
+        :param cache: cache for responses of immutable (block hash or finalized level addressed) GET requests
+        :param tracer: request hooks and latency histograms
+        :param coalesce: share a single in-flight request between concurrent identical GET requests
+        """
         if not uri:
             raise RuntimeError()
         if not isinstance(uri, list):
             uri = [uri]
         self.uri = uri
         self.headers = headers or {}
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.cache = cache
+        self.tracer = tracer
+        self.coalesce = coalesce
+        self.coalesced = 0
+        self._session: Optional[requests.Session] = None
+        self._session_lock = Lock()
+        self._in_flight: Dict[CacheKey, Future] = {}
+        self._in_flight_lock = Lock()
 
     def __repr__(self) -> str:
         res = [
@@ -90,6 +162,56 @@ class RpcNode:
         ]
         return '\n'.join(res)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_session'] = None
+        state['_in_flight'] = {}
+        del state['_session_lock']
+        del state['_in_flight_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._session_lock = Lock()
+        self._in_flight_lock = Lock()
+
+    def __deepcopy__(self, memodict):
+        # NOTE: node is a connection handle, copies (e.g. REPL context backups) should share the same pool
+        return self
+
+    def __enter__(self) -> 'RpcNode':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session (created on first access)."""
+        if self._session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        with self._session_lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
     def request(self, method: str, path: str, **kwargs) -> requests.Response:
         """Perform HTTP request to node.
 
@@ -99,25 +221,66 @@ class RpcNode:
         :raises RpcError: node has returned an error
         :returns: node response
         """
-        logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
-        res = requests.request(
+        if self.tracer is None:
+            return self._check_response(path, self._send(method, path, **kwargs), kwargs.get('stream', False))
+
+        self.tracer.on_request(method, path, kwargs)
+        stream = kwargs.get('stream', False)
+        res: Optional[requests.Response] = None
+        error: Optional[Exception] = None
+        started_at = perf_counter()
+        try:
+            res = self._send(method, path, **kwargs)
+            return self._check_response(path, res, stream)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            self.tracer.on_response(
+                RpcTrace(
+                    node=self.uri[0],
+                    method=method,
+                    path=path,
+                    template=get_path_template(path),
+                    status=res.status_code if res is not None else None,
+                    size=len(res.content) if res is not None and not stream else None,
+                    latency=perf_counter() - started_at,
+                    error=error,
+                )
+            )
+
+    def _send(self, method: str, path: str, **kwargs) -> requests.Response:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('>>>>> %s %s\n%s', method, path, json.dumps(kwargs, indent=4))
+        headers = {'content-type': 'application/json', 'user-agent': 'PyTezos', **self.headers}
+        if not self.keep_alive:
+            headers['connection'] = 'close'
+        return self.session.request(
             method=method,
             url=_urljoin(self.uri[0], path),
-            headers={'content-type': 'application/json', 'user-agent': 'PyTezos', **self.headers},
-            timeout=kwargs.pop('timeout', None) or 60,
+            headers=headers,
+            timeout=kwargs.pop('timeout', None) or DEFAULT_TIMEOUT,
             **kwargs,
         )
+
+    @staticmethod
+    def _check_response(path: str, res: requests.Response, stream: bool = False) -> requests.Response:
+        debug = logger.isEnabledFor(logging.DEBUG)
         if res.status_code == 401:
-            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
+            if debug:
+                logger.debug('<<<<< %s\n%s', res.status_code, res.text)
             raise RpcError(f'Unauthorized: {path}')
         if res.status_code == 404:
-            logger.debug('<<<<< %s\n%s', res.status_code, res.text)
+            if debug:
+                logger.debug('<<<<< %s\n%s', res.status_code, res.text)
             raise RpcError(f'Not found: {path}')
         if res.status_code != 200:
-            logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
+            if debug:
+                logger.debug('<<<<< %s\n%s', res.status_code, pformat(res.text, indent=4))
             raise RpcError.from_response(res)
 
-        logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(res.json(), indent=4))
+        if debug and not stream:
+            logger.debug('<<<<< %s\n%s', res.status_code, json.dumps(res.json(), indent=4))
         return res
 
     def get(
@@ -126,6 +289,17 @@ class RpcNode:
         params: Optional[Dict[str, Any]] = None,
         timeout: Optional[int] = None,
     ) -> requests.Response:
+        if self.cache is not None and self.cache.is_immutable(path, self._get_head_level):
+            key = make_cache_key(path, params)
+            content = self.cache.get(key)
+            if content is None:
+                content = self._fetch(key, path, params, timeout)
+                self.cache.put(key, content)
+            return json.loads(content)
+
+        if self.coalesce:
+            return json.loads(self._fetch(make_cache_key(path, params), path, params, timeout))
+
         return self.request(
             'GET',
             path,
@@ -133,6 +307,58 @@ class RpcNode:
             timeout=timeout,
         ).json()
 
+    def iter(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        timeout: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[Any]:
+        """Stream GET response decoding elements of the top-level array one by one (bypasses cache).
+
+        :param path: path to endpoint
+        :param params: query arguments
+        :param timeout: request timeout
+        :param chunk_size: size of raw chunks read from the socket
+        :returns: iterator of decoded elements (or the single decoded value if the response is not an array)
+        """
+        res = self.request('GET', path, params=params, timeout=timeout, stream=True)
+        try:
+            yield from iter_json(res.iter_content(chunk_size=chunk_size))
+        finally:
+            res.close()
+
+    def _fetch(self, key: CacheKey, path: str, params: Optional[Dict[str, Any]], timeout: Optional[int]) -> bytes:
+        """Get raw response body, concurrent identical requests share the one already in flight."""
+        if not self.coalesce:
+            return self.request('GET', path, params=params, timeout=timeout).content
+
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if future is None:
+                future = self._in_flight[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            content = self.request('GET', path, params=params, timeout=timeout).content
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(content)
+            return content
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+    def _get_head_level(self) -> int:
+        return int(self.request('GET', 'chains/main/blocks/head/header/shell').json()['level'])
+
     def post(
         self,
         path: str,
@@ -180,12 +406,58 @@ class RpcNode:
 
 
 class RpcMultiNode(RpcNode):
-    """Request proxy for multiple nodes chosen for each request in round-robin order."""
+    """Request proxy for multiple nodes with latency-aware, health-checked load balancing.
 
-    def __init__(self, uri: Union[str, List[str]]) -> None:
-        super().__init__(uri)
-        self.nodes = list(map(RpcNode, self.uri))
+    Every upstream node keeps its own connection pool. Requests go to the healthy node with the lowest
+    expected latency (EWMA weighted by in-flight requests), nodes failing several times in a row are ejected
+    for a while, and nodes behind the best known head are avoided. Idempotent GET requests are retried
+    on another node in case of connection errors and can optionally be hedged.
+    """
+
+    def __init__(
+        self,
+        uri: Union[str, List[str]],
+        headers: Optional[Dict[str, str]] = None,
+        cache: Optional[RpcCache] = None,
+        tracer: Optional[RpcTracer] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_failures: int = DEFAULT_MAX_FAILURES,
+        eject_timeout: float = DEFAULT_EJECT_TIMEOUT,
+        max_head_lag: int = DEFAULT_MAX_HEAD_LAG,
+        health_check_interval: Optional[float] = DEFAULT_HEALTH_CHECK_INTERVAL,
+        hedge_percentile: Optional[float] = None,
+        **pool_kwargs,
+    ) -> None:
+        """
+        :param uri: list of node addresses
+        :param headers: extra headers sent with every request
+        :param cache: response cache shared by all upstream nodes
+        :param tracer: request hooks and latency histograms shared by all upstream nodes
+        :param max_retries: number of other nodes to try if GET request fails with a connection error
+        :param max_failures: number of consecutive failures after which node is ejected
+        :param eject_timeout: for how long (in seconds) failing node is ejected
+        :param max_head_lag: max number of blocks node can be behind the best known head
+        :param health_check_interval: how often (in seconds) to check nodes' head levels, None to disable
+        :param hedge_percentile: send duplicate GET request to another node if the first one takes longer than
+            given latency percentile of the chosen node (disabled by default)
+        :param pool_kwargs: connection pool settings passed to every :class:`RpcNode`
+        """
+        super().__init__(uri, headers, cache=cache, tracer=tracer, **pool_kwargs)
+        self.nodes = [RpcNode(node_uri, self.headers, tracer=tracer, **pool_kwargs) for node_uri in self.uri]
+        self.node_stats = [NodeStats(node_uri) for node_uri in self.uri]
+        self.max_retries = max_retries
+        self.max_failures = max_failures
+        self.eject_timeout = eject_timeout
+        self.max_head_lag = max_head_lag
+        self.health_check_interval = health_check_interval
+        self.hedge_percentile = hedge_percentile
+        self.retried = 0
+        self.hedged = 0
         self._next_i = 0
+        self._next_lock = Lock()
+        self._health_lock = Lock()
+        self._checked_at: Optional[float] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
 
     def __repr__(self) -> str:
         res = [
@@ -195,8 +467,159 @@ class RpcMultiNode(RpcNode):
         ]
         return '\n'.join(res)
 
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        super().__setstate__(state)
+        self._next_lock = Lock()
+        self._health_lock = Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = super().__getstate__()
+        del state['_next_lock']
+        del state['_health_lock']
+        state['_executor'] = None
+        return state
+
+    def close(self) -> None:
+        for node in self.nodes:
+            node.close()
+        with self._session_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Get per-node latency and health stats."""
+        return [node_stats.stats() for node_stats in self.node_stats]
+
+    def check_health(self) -> None:
+        """Fetch head level from every node and mark nodes behind the best known head as lagging."""
+
+        def get_level(i: int) -> Optional[int]:
+            try:
+                res = self._node_request(i, 'GET', 'chains/main/blocks/head/header/shell', timeout=HEALTH_CHECK_TIMEOUT)
+                return int(res.json()['level'])
+            except (RpcError, requests.exceptions.RequestException):
+                return None
+
+        levels = list(self._get_executor().map(get_level, range(len(self.nodes))))
+        best_level = max((level for level in levels if level is not None), default=None)
+        for node_stats, level in zip(self.node_stats, levels):
+            if level is not None:
+                node_stats.head_level = level
+                node_stats.lagging = best_level is not None and level < best_level - self.max_head_lag
+        self._checked_at = monotonic()
+
     def request(self, method: str, path: str, **kwargs) -> requests.Response:
-        assert self._next_i < len(self.nodes)
-        res = self.nodes[self._next_i].request(method, path, **kwargs)
-        self._next_i = (self._next_i + 1) % len(self.nodes)
+        self._maybe_check_health()
+        idempotent = method == 'GET' and not kwargs.get('stream')
+        attempts = 1 + (self.max_retries if idempotent else 0)
+        tried: List[int] = []
+        error: Optional[Exception] = None
+
+        for _ in range(attempts):
+            i = self._select_node(exclude=tried)
+            if i is None:
+                break
+            if tried:
+                self.retried += 1
+                logger.info('Retrying %s %s on %s', method, path, self.uri[i])
+            tried.append(i)
+            try:
+                if idempotent and self.hedge_percentile is not None:
+                    return self._hedged_request(i, tried, method, path, **kwargs)
+                return self._node_request(i, method, path, **kwargs)
+            except requests.exceptions.RequestException as e:
+                logger.info('Node %s failed: %s', self.uri[i], e)
+                error = e
+
+        assert error is not None
+        raise error
+
+    def _select_node(self, exclude: List[int]) -> Optional[int]:
+        now = monotonic()
+        candidates = [i for i in range(len(self.nodes)) if i not in exclude]
+        healthy = [i for i in candidates if self.node_stats[i].is_healthy(now)]
+        alive = [i for i in candidates if not self.node_stats[i].is_ejected(now)]
+        candidates = healthy or alive or candidates
+        if not candidates:
+            return None
+
+        with self._next_lock:
+            start = self._next_i
+            self._next_i = (self._next_i + 1) % len(self.nodes)
+        # NOTE: equal scores (e.g. no samples yet) are resolved in round-robin order
+        return min(candidates, key=lambda i: (self.node_stats[i].score(), (i - start) % len(self.nodes)))
+
+    def _node_request(self, i: int, method: str, path: str, **kwargs) -> requests.Response:
+        node_stats = self.node_stats[i]
+        node_stats.on_start()
+        started_at = perf_counter()
+        try:
+            res = self.nodes[i].request(method, path, **kwargs)
+        except requests.exceptions.RequestException:
+            node_stats.on_failure(self.max_failures, self.eject_timeout)
+            raise
+        except RpcError:
+            # NOTE: node is alive and responded with an error
+            node_stats.on_success(perf_counter() - started_at)
+            raise
+        node_stats.on_success(perf_counter() - started_at)
         return res
+
+    def _hedged_request(self, i: int, tried: List[int], method: str, path: str, **kwargs) -> requests.Response:
+        assert self.hedge_percentile is not None
+        delay = self.node_stats[i].percentile(self.hedge_percentile)
+        if delay is None:
+            return self._node_request(i, method, path, **kwargs)
+
+        executor = self._get_executor()
+        primary = executor.submit(self._node_request, i, method, path, **kwargs)
+        done, _ = wait([primary], timeout=delay)
+        if done:
+            return primary.result()
+
+        j = self._select_node(exclude=tried)
+        if j is None:
+            return primary.result()
+        tried.append(j)
+        self.hedged += 1
+        logger.info('Hedging %s %s to %s after %.3f sec', method, path, self.uri[j], delay)
+
+        pending = {primary, executor.submit(self._node_request, j, method, path, **kwargs)}
+        error: Optional[BaseException] = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                error = future.exception()
+                if error is None:
+                    return future.result()
+        assert error is not None
+        raise error
+
+    def _maybe_check_health(self) -> None:
+        if self.health_check_interval is None or len(self.nodes) < 2:
+            return
+        if self._checked_at is not None and monotonic() - self._checked_at < self.health_check_interval:
+            return
+        if not self._health_lock.acquire(blocking=False):
+            return
+        # NOTE: probes run in background, requests are routed using the stats collected so far
+        try:
+            self._get_executor().submit(self._check_health_in_background)
+        except RuntimeError:  # executor has been shut down
+            self._health_lock.release()
+
+    def _check_health_in_background(self) -> None:
+        try:
+            self.check_health()
+        except Exception as e:
+            logger.info('Health check failed: %s', e)
+        finally:
+            self._health_lock.release()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            with self._session_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=len(self.nodes) * self.pool_maxsize)
+        return self._executor
@@ -103,6 +103,14 @@ class RpcQuery(metaclass=InlineDocstring):
             params=params,
         )
 
+    def iter(self, **params):
+        """Stream the response, decoding elements of the top-level array as they arrive."""
+        return self.node.iter(
+            path=self.path,
+            params=params,
+            timeout=self._timeout,
+        )
+
     def _getitem(self, item):
         return self._spawn_query(wild_path=self._wild_path + '/{}', params=self._params + [item])
 
@@ -1,6 +1,14 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any
 from typing import Callable
+from typing import Deque
+from typing import Dict
 from typing import Generator
+from typing import Iterable
+from typing import List
+from typing import Optional
 from typing import Tuple
 
 from pytezos.crypto.encoding import is_bh
@@ -9,6 +17,64 @@ from pytezos.logging import logger
 from pytezos.rpc.node import RpcError
 from pytezos.rpc.query import RpcQuery
 
+DEFAULT_CONCURRENCY = 8
+
+
+def prefetch(
+    func: Callable,
+    items: Iterable,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    buffer_size: Optional[int] = None,
+) -> Generator:
+    """Lazily map function over items in a thread pool, keeping several calls in flight.
+
+    Results are yielded in the order of items, at most `buffer_size` of them are held in memory.
+
+    :param func: function to call for every item (e.g. RPC request)
+    :param items: iterable of arguments, consumed lazily
+    :param concurrency: max number of calls running at the same time
+    :param buffer_size: max number of results fetched ahead (two times concurrency by default)
+    """
+    buffer_size = buffer_size or concurrency * 2
+    items = iter(items)
+    pending: Deque = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for item in islice(items, buffer_size):
+            pending.append(executor.submit(func, item))
+        while pending:
+            result = pending.popleft().result()
+            for item in islice(items, 1):
+                pending.append(executor.submit(func, item))
+            yield result
+    finally:
+        # NOTE: do not wait for results nobody needs if the consumer has stopped early
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+def memoize(get: Callable) -> Callable:
+    """Wrap level getter so that every level is requested at most once within a search."""
+    if hasattr(get, 'probed'):
+        return get
+    probed: Dict[int, Any] = {}
+
+    def memoized(level: int) -> Any:
+        if level not in probed:
+            probed[level] = get(level)
+        return probed[level]
+
+    memoized.probed = probed  # type: ignore
+    return memoized
+
+
+def probe_levels(get: Callable, levels: List[int], concurrency: int = DEFAULT_CONCURRENCY) -> List[Any]:
+    """Get values for several levels at once (preserving order)."""
+    if len(levels) == 1 or concurrency == 1:
+        return list(map(get, levels))
+    return list(prefetch(get, levels, concurrency=concurrency, buffer_size=len(levels)))
+
 
 def find_state_change_intervals(
     head: int,
@@ -16,16 +82,20 @@ def find_state_change_intervals(
     get: Callable,
     equals: Callable,
     step=60,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> Generator:
-    succ_value = get(head)
-    logger.debug('%s at head %s' % succ_value, head)
+    levels = range(head, last, -step)
+    if not levels:
+        return
+    values = prefetch(memoize(get), levels, concurrency=concurrency)
+    succ_value = next(values)
+    logger.debug('%s at head %s', succ_value, head)
 
-    for level in range(head - step, last, -step):
-        value = get(level)
-        logger.debug('%s at level %s' % value, level)
+    for level, value in zip(levels[1:], values):
+        logger.debug('%s at level %s', value, level)
 
         if not equals(value, succ_value):
-            logger.debug('%s -> %s at (%s, {level + step})' % value, succ_value, level)
+            logger.debug('%s -> %s at (%s, %s)', value, succ_value, level, level + step)
             yield level + step, succ_value, level, value
             succ_value = value
 
@@ -36,21 +106,34 @@ def find_state_change(
     get: Callable,
     equals: Callable,
     pred_value: Any,
+    arity: int = 2,
+    concurrency: Optional[int] = None,
 ) -> (int, Any):  # type: ignore
-    def bisect(start: int, end: int):
-        if end == start + 1:
-            return end, get(end)
-
-        level = (end + start) // 2
-        value = get(level)
-        logger.debug('%s at level %s' % value, level)
-
-        if equals(value, pred_value):
-            return bisect(level, end)
-        else:
-            return bisect(start, level)
+    """Find the first level in (last, head] where value differs from `pred_value`.
+
+    Each round probes `arity - 1` levels concurrently, narrowing the interval `arity` times.
+
+    :param arity: number of sub-intervals per round (2 is a regular binary search)
+    :param concurrency: max number of probes in flight (arity - 1 by default)
+    """
+    if arity < 2:
+        raise ValueError(f'Arity must be at least 2, got {arity}')
+    get = memoize(get)
+    concurrency = concurrency or max(1, arity - 1)
+    start, end = last, head
+
+    while end > start + 1:
+        levels = sorted({start + (end - start) * i // arity for i in range(1, arity)} - {start, end})
+        values = probe_levels(get, levels, concurrency)
+        for level, value in zip(levels, values):
+            logger.debug('%s at level %s', value, level)
+            if equals(value, pred_value):
+                start = level
+            else:
+                end = level
+                break
 
-    return bisect(last, head)
+    return end, get(end)
 
 
 def walk_state_change_interval(
@@ -60,12 +143,16 @@ def walk_state_change_interval(
     equals: Callable,
     head_value: Any,
     last_value: Any,
+    arity: int = 2,
+    concurrency: Optional[int] = None,
 ) -> Generator:
     level = last
     value = last_value
     while not equals(value, head_value):
-        level, value = find_state_change(head, level, get, equals, pred_value=value)
-        logger.debug('%s -> %s at %s' % last_value, value, level)
+        level, value = find_state_change(
+            head, level, get, equals, pred_value=value, arity=arity, concurrency=concurrency
+        )
+        logger.debug('%s -> %s at %s', last_value, value, level)
         yield level, value
 
 
@@ -75,8 +162,20 @@ def find_state_changes(
     get: Callable,
     equals: Callable,
     step=60,
+    arity: int = 2,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> Generator:
-    state_change_intervals = find_state_change_intervals(head, last, get, equals, step)
+    """Find all levels in (last, head] where value changes.
+
+    Probed levels are memoized, the coarse scan (every `step` levels) runs concurrently,
+    and the intervals are refined with `arity`-ary bisection.
+
+    :param step: coarse scan step
+    :param arity: number of sub-intervals per bisection round (2 is a regular binary search)
+    :param concurrency: max number of requests in flight
+    """
+    get = memoize(get)
+    state_change_intervals = find_state_change_intervals(head, last, get, equals, step, concurrency=concurrency)
     for int_head, int_head_value, int_tail, int_last_value in state_change_intervals:
         yield from walk_state_change_interval(
             int_head,
@@ -85,6 +184,8 @@ def find_state_changes(
             equals,
             head_value=int_head_value,
             last_value=int_last_value,
+            arity=arity,
+            concurrency=min(concurrency, max(1, arity - 1)),
         )
 
 
@@ -129,6 +230,40 @@ class BlockSliceQuery(RpcQuery):
 
         return super().__call__(length=min(header['level'], length), head=head)
 
+    def __iter__(self) -> Generator:
+        """Iterate over blocks in range (see `iter_blocks`)."""
+        return self.iter_blocks()
+
+    def iter_blocks(
+        self,
+        selector: Optional[str] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        buffer_size: Optional[int] = None,
+        reverse: bool = False,
+        **params,
+    ) -> Generator:
+        """Iterate over blocks (or their sub-resources) in level order, fetching several of them at once.
+
+        :param selector: relative path of the block sub-resource, e.g. `header`, `metadata`, `operations`,
+            `operations/3`, full block by default
+        :param concurrency: max number of requests in flight
+        :param buffer_size: max number of fetched blocks held in memory (two times concurrency by default)
+        :param reverse: iterate from the last block to the first one
+        :param params: query arguments
+        :returns: Generator (lazy)
+        """
+        start, stop = self.get_range()
+        levels = range(stop, start - 1, -1) if reverse else range(start, stop + 1)
+        parts = selector.strip('/').split('/') if selector else []
+
+        def fetch(level):
+            query = self._getitem(level)
+            for part in parts:
+                query = query[int(part)] if part.isdigit() else getattr(query, part)
+            return query(**params)
+
+        return prefetch(fetch, levels, concurrency=concurrency, buffer_size=buffer_size)
+
     def get_range(self):
         """Get block level range."""
 
@@ -145,10 +280,11 @@ class BlockSliceQuery(RpcQuery):
 
         return get_level(self._start), get_level(self._stop)
 
-    def find_proposal_injection(self, proposal_id):
+    def find_proposal_injection(self, proposal_id, arity: int = 2):
         """Find proposal injection.
 
         :param proposal_id: Proposal hash (base58)
+        :param arity: number of sub-intervals per bisection round (2 is a regular binary search)
         """
         last, head = self.get_range()
         level, _ = find_state_change(
@@ -157,15 +293,18 @@ class BlockSliceQuery(RpcQuery):
             get=lambda x: self._getitem(x).votes.proposals[proposal_id](),
             equals=lambda x, y: x == y,
             pred_value=0,
+            arity=arity,
         )
         votes = self._getitem(level).operations.find_votes(proposal_id)
         assert len(votes) == 1
         return votes
 
-    def find_upvotes(self, proposal_id) -> Generator:
+    def find_upvotes(self, proposal_id, concurrency: int = DEFAULT_CONCURRENCY, arity: int = 2) -> Generator:
         """Find upvoting operations for the given proposal.
 
         :param proposal_id: Proposal hash (base58)
+        :param concurrency: max number of blocks fetched at once
+        :param arity: number of sub-intervals per bisection round (2 is a regular binary search)
         :returns: Generator (lazy)
         """
         last, head = self.get_range()
@@ -174,13 +313,22 @@ class BlockSliceQuery(RpcQuery):
             last=last,
             get=lambda x: self._getitem(x).votes.proposals[proposal_id](),
             equals=lambda x, y: x == y,
+            arity=arity,
+            concurrency=concurrency,
+        )
+        upvotes = prefetch(
+            lambda x: self._getitem(x[0]).operations.find_upvotes(proposal_id),
+            state_changes,
+            concurrency=concurrency,
         )
-        for level, _ in state_changes:
-            yield from self._getitem(level).operations.find_upvotes(proposal_id)
+        for operations in upvotes:
+            yield from operations
 
-    def find_ballots(self) -> Generator:
+    def find_ballots(self, concurrency: int = DEFAULT_CONCURRENCY, arity: int = 2) -> Generator:
         """Find ballot operations for the current period.
 
+        :param concurrency: max number of blocks fetched at once
+        :param arity: number of sub-intervals per bisection round (2 is a regular binary search)
         :returns: Generator (lazy)
         """
         last, head = self.get_range()
@@ -189,14 +337,22 @@ class BlockSliceQuery(RpcQuery):
             last=last,
             get=lambda x: self._getitem(x).votes.ballots(),
             equals=lambda x, y: x == y,
+            arity=arity,
+            concurrency=concurrency,
+        )
+        ballots = prefetch(
+            lambda x: self._getitem(x[0]).operations.find_ballots(),
+            state_changes,
+            concurrency=concurrency,
         )
-        for level, _ in state_changes:
-            yield from self._getitem(level).operations.find_ballots()
+        for operations in ballots:
+            yield from operations
 
-    def find_origination(self, contract_id):
+    def find_origination(self, contract_id, arity: int = 2):
         """Find contract origination.
 
         :param contract_id: Contract ID (KT-address)
+        :param arity: number of sub-intervals per bisection round (2 is a regular binary search)
         """
 
         def get_counter(x):
@@ -211,13 +367,15 @@ class BlockSliceQuery(RpcQuery):
             get=get_counter,
             equals=lambda x, y: x == y,
             pred_value=None,
+            arity=arity,
         )
         return self._getitem(level).operations.find_origination(contract_id)
 
-    def find_operation(self, operation_group_hash) -> dict:
+    def find_operation(self, operation_group_hash, concurrency: int = DEFAULT_CONCURRENCY) -> dict:
         """Find operation by hash.
 
         :param operation_group_hash: base58
+        :param concurrency: max number of blocks scanned at once
         :raises: StopIteration if not found
         """
         last, head = self.get_range()
@@ -226,12 +384,17 @@ class BlockSliceQuery(RpcQuery):
         else:
             levels = range(last, head + 1, 1)
 
-        for block_level in levels:
+        operation_hashes = prefetch(
+            lambda x: self._getitem(x).operation_hashes(),
+            levels,
+            concurrency=concurrency,
+        )
+        for block_level, validation_passes in zip(levels, operation_hashes):
             logger.debug(f'Looking for operation %s in block %s...' % (operation_group_hash, block_level))
-            try:
-                return self._getitem(block_level).operations[operation_group_hash]()
-            except StopIteration:
-                continue
+            for i, validation_pass in enumerate(validation_passes):
+                for j, og_hash in enumerate(validation_pass):
+                    if og_hash == operation_group_hash:
+                        return self._getitem(block_level).operations[i][j]()
 
         raise StopIteration(operation_group_hash)
 
@@ -3,15 +3,18 @@ from datetime import datetime
 from datetime import timezone
 from functools import cached_property
 from functools import lru_cache
+from time import monotonic
 from time import sleep
 from typing import Any
 from typing import Dict
 from typing import Generator
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Set
+from typing import Tuple
 
 import requests
-import simplejson as json
 from deprecation import deprecated  # type: ignore
 
 from pytezos.crypto.encoding import base58_decode
@@ -23,14 +26,75 @@ from pytezos.rpc.protocol import BlocksQuery
 from pytezos.rpc.query import RpcQuery
 from pytezos.rpc.search import CyclesQuery
 from pytezos.rpc.search import VotingPeriodsQuery
+from pytezos.rpc.stream import iter_json
 
 MAX_BLOCK_TIMEOUT = 86400
+DEFAULT_RECONNECT_DELAY = 1
 
 
 def make_operation_result(**kwargs):
     return {'metadata': {'operation_result': kwargs}}
 
 
+class ConfirmationTracker:
+    """Inclusion and confirmation bookkeeping for `wait_operations` (shared by sync and async shells)."""
+
+    def __init__(self, opg_hashes: List[str], min_confirmations: int) -> None:
+        self.opg_hashes = opg_hashes
+        self.min_confirmations = min_confirmations
+        self.pending = set(opg_hashes)
+        self.confirmations: Dict[str, int] = {}
+
+    @property
+    def all_included(self) -> bool:
+        return len(self.confirmations) == len(self.opg_hashes)
+
+    def not_included_message(self) -> str:
+        return 'Only %d of %d operations were included, stopping' % (len(self.confirmations), len(self.opg_hashes))
+
+    def update_mempool(self, mempool: Set[str]) -> None:
+        """Stop tracking operations which have left the mempool.
+
+        :param mempool: hashes of operations currently in the node's mempool
+        """
+        for opg_hash in self.opg_hashes:
+            if opg_hash in self.pending:
+                if opg_hash in mempool:
+                    logger.info('Operation %s is still in mempool', opg_hash)
+                else:
+                    logger.info('Operation %s has left mempool', opg_hash)
+                    self.pending.remove(opg_hash)
+
+    def find_included(self, block_hash: str, operation_hashes: List[List[str]]) -> List[Tuple[int, int]]:
+        """Mark operations included to the block.
+
+        :param block_hash: block hash
+        :param operation_hashes: operation hashes of the block (grouped by validation pass)
+        :returns: list of (validation pass, index) positions of newly included operations
+        """
+        found = []
+        for i, vp in enumerate(operation_hashes):
+            for j, opg_hash in enumerate(vp):
+                if opg_hash in self.opg_hashes and opg_hash not in self.confirmations:
+                    logger.info('Operation %s has been included to block %s', opg_hash, block_hash)
+                    # can be still in the particular node's mempool (not yet removed)
+                    self.pending.discard(opg_hash)
+                    self.confirmations[opg_hash] = 0  # initialize
+                    found.append((i, j))
+        return found
+
+    def confirm(self) -> None:
+        """Count one more confirmation for every included operation."""
+        for opg_hash in self.confirmations:
+            self.confirmations[opg_hash] += 1
+            logger.info(
+                'Operation %s has %d/%d confirmations',
+                opg_hash,
+                self.confirmations[opg_hash],
+                self.min_confirmations,
+            )
+
+
 class ShellQuery(RpcQuery, path=''):
     @property
     def blocks(self) -> BlocksQuery:
@@ -144,6 +208,7 @@ class ShellQuery(RpcQuery, path=''):
         current_block_hash: Optional[str] = None,
         time_between_blocks: Optional[int] = None,
         block_timeout: Optional[int] = None,
+        monitor: bool = False,
     ) -> List[dict]:
         """Wait for one or many operations gain enough confirmations
 
@@ -153,11 +218,19 @@ class ShellQuery(RpcQuery, path=''):
         :param current_block_hash: current block hash (head)
         :param time_between_blocks: override protocol constant
         :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param monitor: follow `/monitor/heads` and mempool streams instead of polling the node every block
         :return: list of operation contents with metadata
         """
+        if monitor:
+            return self.monitor_operations(
+                opg_hashes=opg_hashes,
+                ttl=ttl,
+                min_confirmations=min_confirmations,
+                current_block_hash=current_block_hash,
+                block_timeout=block_timeout,
+            )
 
-        confirmations = {}
-        pending = set(opg_hashes)
+        tracker = ConfirmationTracker(opg_hashes, min_confirmations)
         operations = []
         block_hash = current_block_hash
 
@@ -171,50 +244,103 @@ class ShellQuery(RpcQuery, path=''):
             time_between_blocks=time_between_blocks,
             block_timeout=block_timeout,
         ):
-            if len(pending) > 0:
-                mempool = set(map(lambda x: x['hash'], self.mempool.pending_operations.flatten()))
-                for opg_hash in opg_hashes:
-                    if opg_hash in pending:
-                        if opg_hash in mempool:
-                            logger.info('Operation %s is still in mempool', opg_hash)
-                        else:
-                            logger.info('Operation %s has left mempool', opg_hash)
-                            pending.remove(opg_hash)
-
-            included = self.blocks[block_hash].operation_hashes()
-            for i, vp in enumerate(included):
-                for j, opg_hash in enumerate(vp):
-                    if opg_hash in opg_hashes and opg_hash not in confirmations:
-                        logger.info('Operation %s has been included to block %s', opg_hash, block_hash)
-                        if opg_hash in pending:  # can be still in the particular node's mempool (not yet removed)
-                            pending.remove(opg_hash)
-                        confirmations[opg_hash] = 0  # initialize
-                        operations.append(self.blocks[block_hash].operations[i][j]())
-
-            for opg_hash in confirmations:
-                confirmations[opg_hash] += 1
-                logger.info(
-                    'Operation %s has %d/%d confirmations', opg_hash, confirmations[opg_hash], min_confirmations
-                )
+            if len(tracker.pending) > 0:
+                tracker.update_mempool(set(map(lambda x: x['hash'], self.mempool.pending_operations.flatten())))
+
+            found = tracker.find_included(block_hash, self.blocks[block_hash].operation_hashes())
+            operations.extend(self.blocks[block_hash].operations[i][j]() for i, j in found)
+            tracker.confirm()
 
-            if len(operations) == len(opg_hashes):
+            if tracker.all_included:
                 break
 
-        if len(operations) < len(opg_hashes):
-            raise StopIteration('Only %d of %d operations were included, stopping' % (len(operations), len(opg_hashes)))
+        if not tracker.all_included:
+            raise StopIteration(tracker.not_included_message())
 
         for _ in self.wait_blocks(
             block_hash,
             max_blocks=min_confirmations - 1,
             time_between_blocks=time_between_blocks,
         ):
-            for opg_hash in opg_hashes:
-                confirmations[opg_hash] += 1
+            tracker.confirm()
+
+        return operations
+
+    def monitor_operations(
+        self,
+        opg_hashes: List[str],
+        ttl: int,
+        min_confirmations: int,
+        current_block_hash: Optional[str] = None,
+        block_timeout: Optional[int] = None,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+    ) -> List[dict]:
+        """Wait for one or many operations gain enough confirmations, driven by the streaming monitor RPCs.
+
+        New heads are received from `/monitor/heads/main`, the stream is reopened if interrupted.
+        Operation contents are fetched only for blocks that actually include one of the pending hashes.
+
+        :param opg_hashes: list of operation hashes
+        :param ttl: max time-to-live value (in mempool)
+        :param min_confirmations: minimum number of blocks after inclusion to wait for
+        :param current_block_hash: current block hash (head)
+        :param block_timeout: set block timeout (by default Pytezos will wait for a long time)
+        :param reconnect_delay: delay (in seconds) before reopening an interrupted stream
+        :return: list of operation contents with metadata
+        """
+        pending = set(opg_hashes)
+        included: Dict[str, int] = {}
+        operations: Dict[str, dict] = {}
+
+        def check_block(block_id, level: int) -> None:
+            block = self.blocks[block_id]
+            for i, vp in enumerate(block.operation_hashes()):
+                for j, opg_hash in enumerate(vp):
+                    if opg_hash in pending:
+                        logger.info('Operation %s has been included to block %s', opg_hash, block_id)
+                        pending.remove(opg_hash)
+                        included[opg_hash] = level
+                        operations[opg_hash] = block.operations[i][j]()
+
+        def is_confirmed(level: int) -> bool:
+            for opg_hash, inclusion_level in included.items():
                 logger.info(
-                    'Operation %s has %d/%d confirmations', opg_hash, confirmations[opg_hash], min_confirmations
+                    'Operation %s has %d/%d confirmations', opg_hash, level - inclusion_level + 1, min_confirmations
                 )
+            if pending:
+                return False
+            return all(level - inclusion_level + 1 >= min_confirmations for inclusion_level in included.values())
+
+        header = self.blocks[current_block_hash or 'head'].header()
+        start_level = last_level = header['level']
+        check_block(header['hash'], last_level)
+        if is_confirmed(last_level):
+            return list(operations.values())
+
+        heads = self.monitor.heads.main.watch(
+            reconnect_delay=reconnect_delay,
+            idle_timeout=block_timeout or MAX_BLOCK_TIMEOUT,
+        )
+        try:
+            for head in heads:
+                level = head['level']
+                if level <= last_level:
+                    continue  # repeated head after reconnect or a reorg at the same level
+                logger.info('Current level: %d (max %d)', level, start_level + ttl)
+                for missed_level in range(last_level + 1, level):
+                    check_block(missed_level, missed_level)
+                check_block(head['hash'], level)
+                last_level = level
+                if is_confirmed(level):
+                    break
+                if pending and level >= start_level + ttl:
+                    raise StopIteration(
+                        'Only %d of %d operations were included, stopping' % (len(included), len(opg_hashes))
+                    )
+        finally:
+            heads.close()
 
-        return operations
+        return list(operations.values())
 
     @deprecated(deprecated_in='3.2.2', removed_in='4.0.0', details=f'Use wait_blocks() instead')
     def wait_next_block(
@@ -474,11 +600,13 @@ class ProtocolInjectionQuery(RpcQuery, path='/injection/protocol'):
 
 class ResponseGenerator:
     def __init__(self, res: requests.Response):
-        self._lines = res.iter_lines()
+        self._res = res
 
     def __iter__(self):
-        for line in self._lines:
-            yield json.loads(line.decode())
+        try:
+            yield from iter_json(self._res.iter_content(chunk_size=None), unwrap=False)
+        finally:
+            self._res.close()
 
 
 class MonitorQuery(
@@ -490,6 +618,7 @@ class MonitorQuery(
         '/monitor/heads/{}',
         '/monitor/protocols',
         '/monitor/valid_blocks',
+        '/chains/{}/mempool/monitor_operations',
     ],
 ):
     def __call__(self, *args, **kwargs):
@@ -502,6 +631,36 @@ class MonitorQuery(
             )
         )
 
+    def watch(
+        self,
+        reconnect_delay: float = DEFAULT_RECONNECT_DELAY,
+        idle_timeout: Optional[float] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        """Iterate over stream chunks endlessly, reopening the stream once it is closed or broken.
+
+        :param reconnect_delay: delay (in seconds) before reopening the stream
+        :param idle_timeout: raise TimeoutError if no chunks were received for that long (in seconds)
+        """
+        last_chunk_at = monotonic()
+        while True:
+            try:
+                res = self.node.request(
+                    method='GET',
+                    path=self.path,
+                    params=kwargs,
+                    stream=True,
+                    timeout=idle_timeout,
+                )
+                for chunk in ResponseGenerator(res):
+                    last_chunk_at = monotonic()
+                    yield chunk
+            except requests.exceptions.RequestException as e:
+                logger.info('Stream %s interrupted: %s', self.path, e)
+            if idle_timeout is not None and monotonic() - last_chunk_at >= idle_timeout:
+                raise TimeoutError('Reached timeout (%d sec) while waiting for %s' % (idle_timeout, self.path))
+            sleep(reconnect_delay)
+
     def __repr__(self):
         res = [
             super().__repr__(),
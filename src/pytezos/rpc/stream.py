@@ -0,0 +1,196 @@
+import codecs
+import re
+from typing import Any
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+import simplejson as json
+from simplejson import JSONDecodeError
+
+DEFAULT_CHUNK_SIZE = 65536
+
+structural_re = re.compile(r'[\[\]{},"]')
+string_re = re.compile(r'["\\]')
+non_space_re = re.compile(r'\S')
+delimiters = frozenset(' \t\n\r,]')
+
+
+class JsonStreamDecoder:
+    """Incremental JSON decoder with memory bounded by the size of a single item.
+
+    In `unwrap` mode elements of the top-level array are decoded one by one as soon as they are complete
+    (a top-level value of any other type is decoded as a whole). Otherwise the stream is treated as a sequence
+    of concatenated JSON values, as sent by `/monitor` endpoints.
+
+    Items fully contained in the buffer are decoded in one go, only items spanning several chunks are scanned
+    for their boundaries.
+
+    >>> decoder = JsonStreamDecoder()
+    >>> decoder.feed(b'[{"a": 1}, [2')
+    [{'a': 1}]
+    >>> decoder.feed(b', 3]]')
+    [[2, 3]]
+    """
+
+    def __init__(self, unwrap: bool = True) -> None:
+        """
+        :param unwrap: yield elements of the top-level array rather than the array itself
+        """
+        self.unwrap = unwrap
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._decoder = json.JSONDecoder()
+        self._buffer = ''
+        self._start = 0  # beginning of the current item
+        self._pos = 0  # scan position
+        self._depth = 0
+        self._base: Optional[int] = None  # nesting depth of the decoded items
+        self._in_string = False
+        self._finished = False
+
+    def feed(self, data: bytes) -> List[Any]:
+        """Consume next chunk of the stream.
+
+        :param data: raw bytes
+        :returns: list of items completed by this chunk
+        """
+        self._buffer += self._utf8.decode(data)
+        items: List[Any] = []
+        try:
+            self._scan(items)
+        finally:
+            self._buffer = self._buffer[self._start :]
+            self._pos -= self._start
+            self._start = 0
+        return items
+
+    def close(self) -> List[Any]:
+        """Signal end of the stream.
+
+        :returns: list of the remaining items
+        """
+        items = self.feed(self._utf8.decode(b'', final=True).encode())
+        if self._in_string or self._depth != 0:
+            raise ValueError('Unexpected end of JSON stream')
+        self._pop_scalars(items, len(self._buffer))
+        self._buffer = ''
+        return items
+
+    def _scan(self, items: List[Any]) -> None:
+        buffer = self._buffer
+        size = len(buffer)
+
+        while True:
+            if self._finished:
+                if buffer[self._pos :].strip():
+                    raise ValueError('Extra data after the top-level array')
+                self._start = self._pos = size
+                return
+
+            if self._base is None:
+                match = non_space_re.search(buffer, self._pos)
+                if match is None:
+                    self._start = self._pos = size
+                    return
+                if self.unwrap and match.group() == '[':
+                    self._base = self._depth = 1
+                    self._start = self._pos = match.end()
+                else:
+                    self._base = 0
+                    self._start = self._pos = match.start()
+
+            if self._in_string:
+                match = string_re.search(buffer, self._pos)
+                if match is None:
+                    self._pos = size
+                    return
+                if match.group() == '\\':
+                    if match.end() == size:
+                        self._pos = match.start()  # escaped char is in the next chunk
+                        return
+                    self._pos = match.end() + 1
+                    continue
+                self._in_string = False
+                self._pos = match.end()
+                if self._depth == 0:
+                    self._pop(items, self._pos)
+                continue
+
+            if self._depth == self._base and self._pos == self._start:
+                match = non_space_re.search(buffer, self._pos)
+                if match is None:
+                    self._start = self._pos = size
+                    return
+                if self._base == 1 and match.group() in ',]':
+                    if match.group() == ']':
+                        self._depth = 0
+                        self._finished = True
+                    self._start = self._pos = match.end()
+                    continue
+                self._start = self._pos = match.start()
+                try:
+                    item, end = self._decoder.raw_decode(buffer, self._start)
+                except JSONDecodeError:
+                    pass  # incomplete item, fall back to scanning
+                else:
+                    # a number or literal is complete only if followed by a delimiter (it might continue in the
+                    # next chunk, e.g. `1.` + `5`), strings, arrays and objects are self-delimited
+                    if buffer[end - 1] in '"]}' or (end < size and buffer[end] in delimiters):
+                        items.append(item)
+                        self._start = self._pos = end
+                        continue
+
+            match = structural_re.search(buffer, self._pos)
+            if match is None:
+                self._pos = size
+                return
+            char = match.group()
+            self._pos = match.end()
+
+            if char == '"':
+                if self._depth == 0:
+                    self._pop_scalars(items, match.start())
+                self._in_string = True
+            elif char in '[{':
+                if self._depth == 0:
+                    self._pop_scalars(items, match.start())
+                self._depth += 1
+            elif char in ']}':
+                self._depth -= 1
+                if self._depth == 0 and self._base == 0:
+                    self._pop(items, self._pos)
+                elif self._depth < self._base:
+                    self._pop_element(items, match.start())
+                    self._start = self._pos
+                    self._finished = True
+            elif self._depth == self._base == 1:
+                self._pop_element(items, match.start())
+                self._start = self._pos
+
+    def _pop(self, items: List[Any], end: int) -> None:
+        items.append(json.loads(self._buffer[self._start : end]))
+        self._start = end
+
+    def _pop_element(self, items: List[Any], end: int) -> None:
+        data = self._buffer[self._start : end]
+        if data.strip():
+            items.append(json.loads(data))
+        self._start = end
+
+    def _pop_scalars(self, items: List[Any], end: int) -> None:
+        """Decode whitespace separated top-level scalars (numbers, booleans, nulls)."""
+        items.extend(json.loads(value) for value in self._buffer[self._start : end].split())
+        self._start = end
+
+
+def iter_json(chunks: Iterable[bytes], unwrap: bool = True) -> Iterator[Any]:
+    """Decode stream of raw chunks item by item.
+
+    :param chunks: iterable of raw bytes
+    :param unwrap: yield elements of the top-level array rather than the array itself
+    """
+    decoder = JsonStreamDecoder(unwrap=unwrap)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
@@ -0,0 +1,142 @@
+import re
+from bisect import bisect_left
+from threading import Lock
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from attr import dataclass
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+dynamic_segment_re = re.compile(r'^(\d+|[A-Za-z0-9]{36,}(~\d+)?|(head|genesis)(~\d+)?|main|test)$')
+
+
+def get_path_template(path: str) -> str:
+    """Replace request specific path segments (levels, hashes, addresses, chain IDs) with `{}`.
+
+    >>> get_path_template('chains/main/blocks/123/operations')
+    '/chains/{}/blocks/{}/operations'
+    """
+    segments = path.strip('/').split('/')
+    return '/' + '/'.join('{}' if dynamic_segment_re.match(x) else x for x in segments)
+
+
+@dataclass(kw_only=True, frozen=True)
+class RpcTrace:
+    """Summary of a finished RPC request"""
+
+    node: str
+    method: str
+    path: str
+    template: str
+    status: Optional[int]
+    size: Optional[int]
+    latency: float
+    error: Optional[Exception] = None
+
+
+class LatencyHistogram:
+    """Cumulative latency histogram with fixed bucket bounds (in seconds)."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, latency: float) -> None:
+        self.counts[bisect_left(self.buckets, latency)] += 1
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def percentile(self, q: float) -> float:
+        """Estimate latency percentile (upper bound of the bucket containing it).
+
+        :param q: percentile in range [0, 100]
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q / 100 * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                return self.buckets[i] if i < len(self.buckets) else self.max
+        return self.max
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+
+class RpcTracer:
+    """Pluggable RPC tracing: pre/post request hooks and latency histograms per path template.
+
+    >>> tracer = RpcTracer()
+    >>> tracer.add_post_hook(lambda trace: print(trace.template, trace.latency))
+    >>> node = RpcNode('https://rpc.tzkt.io/mainnet', tracer=tracer)
+    """
+
+    def __init__(self, histograms: bool = True, buckets=DEFAULT_BUCKETS) -> None:
+        """
+        :param histograms: collect latency histograms per path template
+        :param buckets: histogram bucket bounds (in seconds)
+        """
+        self.pre_hooks: List[Callable[[str, str, Dict[str, Any]], None]] = []
+        self.post_hooks: List[Callable[[RpcTrace], None]] = []
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.buckets = buckets
+        self._collect_histograms = histograms
+        self._lock = Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = Lock()
+
+    def add_pre_hook(self, hook: Callable[[str, str, Dict[str, Any]], None]) -> None:
+        """Register callback invoked before each request with method, path, and request arguments."""
+        self.pre_hooks.append(hook)
+
+    def add_post_hook(self, hook: Callable[[RpcTrace], None]) -> None:
+        """Register callback invoked after each request (including failed ones) with :class:`RpcTrace`."""
+        self.post_hooks.append(hook)
+
+    def on_request(self, method: str, path: str, kwargs: Dict[str, Any]) -> None:
+        for hook in self.pre_hooks:
+            hook(method, path, kwargs)
+
+    def on_response(self, trace: RpcTrace) -> None:
+        if self._collect_histograms:
+            with self._lock:
+                histogram = self.histograms.get(trace.template)
+                if histogram is None:
+                    histogram = self.histograms[trace.template] = LatencyHistogram(self.buckets)
+                histogram.observe(trace.latency)
+        for hook in self.post_hooks:
+            hook(trace)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get latency stats per path template."""
+        with self._lock:
+            return {template: histogram.stats() for template, histogram in self.histograms.items()}
+
+    def reset(self) -> None:
+        """Drop collected histograms."""
+        with self._lock:
+            self.histograms.clear()
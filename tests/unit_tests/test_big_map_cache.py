@@ -0,0 +1,147 @@
+import re
+from unittest import TestCase
+from unittest.mock import patch
+
+from pytezos.context.cache import BigMapCache
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.repl import Interpreter
+from pytezos.michelson.types import MichelsonType
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from tests.unit_tests.test_rpc.test_node import make_response
+
+block_hash = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+big_map_re = re.compile(r'/context/big_maps/(\d+)/(\w+)$')
+values = {
+    forge_script_expr(MichelsonType.match({'prim': 'nat'})(1).pack(legacy=True)): b'{"int": "10"}',
+    forge_script_expr(MichelsonType.match({'prim': 'nat'})(2).pack(legacy=True)): b'{"int": "20"}',
+}
+
+script = michelson_to_micheline('''
+    parameter nat ;
+    storage (pair (big_map nat nat) nat) ;
+    code { UNPAIR ; DIP { CAR ; DUP } ; GET ; IF_NONE { PUSH nat 0 } {} ; SWAP ; PAIR ; NIL operation ; PAIR }
+    ''')
+
+
+def respond(method, url, **kwargs):
+    if url.endswith('/blocks/head/hash'):
+        return make_response(f'"{block_hash}"'.encode())
+    match = big_map_re.search(url)
+    assert match, url
+    if match.group(2) == 'unavailable':
+        return make_response(b'[{"kind": "temporary", "id": "failure"}]', status_code=500)
+    return make_response(values.get(match.group(2), b''), status_code=200 if match.group(2) in values else 404)
+
+
+def get_urls(request_mock, pattern):
+    return [c.kwargs['url'] for c in request_mock.call_args_list if pattern in c.kwargs['url']]
+
+
+class TestBigMapCache(TestCase):
+    def test_lru_eviction(self):
+        cache = BigMapCache(maxsize=2)
+        cache.put((block_hash, 1, 'a'), {'int': '1'})
+        cache.put((block_hash, 1, 'b'), None)
+        self.assertEqual((True, {'int': '1'}), cache.get((block_hash, 1, 'a')))
+        cache.put((block_hash, 1, 'c'), {'int': '3'})
+        self.assertEqual((False, None), cache.get((block_hash, 1, 'b')))
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 2}, {k: cache.stats()[k] for k in ('hits', 'misses', 'size')})
+
+    def test_negative_disabled(self):
+        cache = BigMapCache(negative=False)
+        cache.put((block_hash, 1, 'a'), None)
+        self.assertEqual(0, len(cache))
+
+    @patch('requests.Session.request', side_effect=respond)
+    def test_run_code(self, request_mock):
+        cache = BigMapCache()
+        kwargs = {
+            'storage': {'prim': 'Pair', 'args': [{'int': '7'}, {'int': '0'}]},
+            'script': script,
+            'shell': ShellQuery(RpcNode('http://localhost:8732')),
+            'big_map_cache': cache,
+        }
+        results = [
+            Interpreter.run_code(parameter={'int': str(key)}, **kwargs)[1]['args'][1]['int']
+            for key in [1, 2, 3, 1, 2, 3]
+        ]
+        self.assertEqual(['10', '20', '0'] * 2, results)
+        self.assertEqual(3, len(get_urls(request_mock, '/big_maps/')))
+        self.assertEqual(4, request_mock.call_count)  # head is resolved once, the rest are cache hits
+        self.assertEqual({'hits': 3, 'misses': 3}, {k: cache.stats()[k] for k in ('hits', 'misses')})
+
+    @patch('requests.Session.request', side_effect=respond)
+    def test_uncached(self, request_mock):
+        context = ExecutionContext(shell=ShellQuery(RpcNode('http://localhost:8732')))
+        context.register_big_map(7)
+        for _ in range(2):
+            self.assertIsNone(context.get_big_map_value(7, 'unavailable'))
+        self.assertEqual(2, len(get_urls(request_mock, '/big_maps/')))
+        self.assertEqual([], get_urls(request_mock, '/hash'))
+
+    @patch('requests.Session.request', side_effect=respond)
+    def test_errors_not_cached(self, request_mock):
+        cache = BigMapCache()
+        context = ExecutionContext(shell=ShellQuery(RpcNode('http://localhost:8732')), big_map_cache=cache)
+        context.register_big_map(7)
+        for _ in range(2):
+            self.assertIsNone(context.get_big_map_value(7, 'unavailable'))
+        self.assertEqual(2, len(get_urls(request_mock, '/big_maps/')))
+        self.assertEqual(0, len(cache))
+
+    @patch('requests.Session.request', side_effect=respond)
+    def test_prefetch(self, request_mock):
+        cache = BigMapCache()
+        context = ExecutionContext(
+            shell=ShellQuery(RpcNode('http://localhost:8732')),
+            block_id=block_hash,
+            big_map_cache=cache,
+        )
+        big_map = MichelsonType.match({'prim': 'big_map', 'args': [{'prim': 'nat'}, {'prim': 'nat'}]})
+        value = big_map.from_micheline_value({'int': '7'})
+        value.attach_context(context)
+        self.assertEqual(3, value.prefetch([1, 2, 3, 2]))
+        self.assertEqual(0, value.prefetch([1, 2, 3]))
+        self.assertEqual(3, len(get_urls(request_mock, '/big_maps/')))
+        self.assertEqual(20, value[2].to_python_object())
+        self.assertIsNone(value[3])
+        self.assertEqual(3, len(get_urls(request_mock, '/big_maps/')))
+
+    @patch('requests.Session.request')
+    def test_head_moves(self, request_mock):
+        heads = ['BLockGenesisGenesisGenesisGenesisGenesis1db77eJNeJ9', block_hash]
+
+        def respond_at_head(method, url, **kwargs):
+            if url.endswith('/blocks/head/hash'):
+                return make_response(f'"{heads[0]}"'.encode())
+            return make_response(b'{"int": "%d"}' % len(heads))
+
+        request_mock.side_effect = respond_at_head
+        cache = BigMapCache(head_ttl=0)
+        context = ExecutionContext(shell=ShellQuery(RpcNode('http://localhost:8732')), big_map_cache=cache)
+        context.register_big_map(7)
+        key_hash = next(iter(values))
+        self.assertEqual({'int': '2'}, context.get_big_map_value(7, key_hash))
+        heads.pop(0)
+        # NOTE: lookups are bound to the block the context was pinned to until the storage is fetched again
+        self.assertEqual({'int': '2'}, context.get_big_map_value(7, key_hash))
+        self.assertEqual(2, request_mock.call_count)
+        self.assertEqual(block_hash, context.get_storage_block_id())
+        self.assertEqual({'int': '1'}, context.get_big_map_value(7, key_hash))
+        urls = get_urls(request_mock, '/big_maps/')
+        self.assertEqual(2, len(urls))
+        self.assertIn(f'/blocks/{block_hash}/', urls[1])
+
+    @patch('requests.Session.request', side_effect=respond)
+    def test_head_resolved_once_per_ttl(self, request_mock):
+        cache = BigMapCache()
+        for _ in range(3):
+            context = ExecutionContext(shell=ShellQuery(RpcNode('http://localhost:8732')), big_map_cache=cache)
+            self.assertEqual(block_hash, context.get_storage_block_id())
+        self.assertEqual(1, request_mock.call_count)
+        cache.head_ttl = 0
+        self.assertEqual(block_hash, context.get_storage_block_id())
+        self.assertEqual(2, request_mock.call_count)
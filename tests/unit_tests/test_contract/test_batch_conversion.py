@@ -0,0 +1,76 @@
+import json
+from glob import glob
+from os.path import basename
+from os.path import dirname
+from os.path import join
+from unittest import TestCase
+
+from pytezos import ContractInterface
+
+contract_tests_dir = join(dirname(dirname(dirname(__file__))), 'contract_tests')
+
+
+def load_operations():
+    for script_path in sorted(glob(join(contract_tests_dir, '*', '__script__.json'))):
+        with open(script_path) as f:
+            script = json.load(f)
+        for path in sorted(glob(join(dirname(script_path), '*.json'))):
+            if not basename(path).startswith('__'):
+                with open(path) as f:
+                    yield script, json.load(f)
+
+
+class TestBatchConversion(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.operations = list(load_operations())
+
+    def test_storage(self):
+        for script, operation in self.operations:
+            storage = ContractInterface.from_micheline(script['code']).storage
+            values = [script['storage'], operation['storage'], operation['storage']]
+            expected = [storage.decode(value) for value in values]
+            self.assertEqual(expected, storage.decode_many(values))
+            self.assertEqual(expected, storage.decode_many(iter(values)))
+
+            py_objs = [storage.decode(value) for value in values]
+            for mode in ['readable', 'optimized']:
+                expected = [storage.encode(py_obj, mode=mode) for py_obj in py_objs]
+                self.assertEqual(expected, storage.encode_many(py_objs, mode=mode))
+
+    def test_parameters(self):
+        for script, operation in self.operations:
+            contract = ContractInterface.from_micheline(script['code'])
+            entrypoint = operation['parameters']['entrypoint']
+            values = [operation['parameters']['value']] * 3
+            expected = [contract.parameter.decode(value, entrypoint=entrypoint) for value in values]
+            self.assertEqual(expected, contract.parameter.decode_many(values, entrypoint=entrypoint))
+
+            if entrypoint in contract.entrypoints:
+                proxy = getattr(contract, entrypoint)
+                py_objs = [next(iter(py_obj.values())) for py_obj in expected]
+                expected = [proxy.encode(py_obj) for py_obj in py_objs]
+                self.assertEqual(expected, proxy.encode_many(py_objs))
+
+    def test_process_pool(self):
+        script, operation = self.operations[0]
+        storage = ContractInterface.from_micheline(script['code']).storage
+        values = [script['storage'], operation['storage']] * 3
+        expected = [storage.decode(value) for value in values]
+        self.assertEqual(expected, storage.decode_many(values, processes=2))
+        self.assertEqual(storage.encode_many(expected), storage.encode_many(expected, processes=2))
+
+    def test_process_pool_parameters(self):
+        script, operation = self.operations[0]
+        contract = ContractInterface.from_micheline(script['code'])
+        entrypoint = operation['parameters']['entrypoint']
+        values = [operation['parameters']['value']] * 6
+        expected = [contract.parameter.decode(value, entrypoint=entrypoint) for value in values]
+        self.assertEqual(expected, contract.parameter.decode_many(values, entrypoint=entrypoint, processes=2))
+
+    def test_invalid_arguments(self):
+        script, _ = self.operations[0]
+        contract = ContractInterface.from_micheline(script['code'])
+        proxy = getattr(contract, next(iter(contract.entrypoints)))
+        with self.assertRaises(ValueError):
+            proxy.encode_many([object()])
@@ -0,0 +1,40 @@
+from os.path import dirname
+from os.path import join
+from unittest import TestCase
+
+from pytezos import ContractInterface
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.program import program_cache
+
+
+def load_script(name: str) -> dict:
+    with open(join(dirname(__file__), 'contracts', name)) as f:
+        return {'code': michelson_to_micheline(f.read()), 'storage': {'int': '0'}}
+
+
+class TestProgramCache(TestCase):
+    def test_same_code_shares_program(self):
+        script = load_script('macro_counter.tz')
+        first = ContractInterface.from_context(ExecutionContext(script=script))
+        hits = program_cache.hits
+        second = ContractInterface.from_context(ExecutionContext(script=load_script('macro_counter.tz')))
+
+        self.assertEqual(hits + 1, program_cache.hits)
+        self.assertIs(first.program, second.program)
+        self.assertIs(type(first), type(second))
+        self.assertIsNot(first.increaseCounterBy, second.increaseCounterBy)
+        self.assertEqual(first.entrypoints, second.entrypoints)
+        self.assertEqual(5, second.increaseCounterBy(5).interpret(storage=0).storage)
+
+    def test_different_code(self):
+        counter = MichelsonProgram.load(ExecutionContext(script=load_script('macro_counter.tz')), with_code=True)
+        concat = MichelsonProgram.load(ExecutionContext(script=load_script('default_entrypoint.tz')), with_code=True)
+        self.assertIsNot(counter, concat)
+
+    def test_with_code_flag(self):
+        context = ExecutionContext(script=load_script('macro_counter.tz'))
+        program = MichelsonProgram.load(context)
+        self.assertIsNot(program, MichelsonProgram.load(context, with_code=True))
+        self.assertIs(program, MichelsonProgram.load(context))
@@ -0,0 +1,86 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from parameterized import parameterized  # type: ignore
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.compiler import compile_code
+from pytezos.michelson.compiler import compilers
+from pytezos.michelson.instructions import AddInstruction
+from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.program import MichelsonProgram
+from pytezos.michelson.repl import Interpreter
+from pytezos.michelson.stack import MichelsonStack
+
+sum_script = '''
+parameter nat ;
+storage nat ;
+code { CAR ; PUSH nat 0 ; SWAP ; DUP ; PUSH nat 0 ; COMPARE ; LT ;
+       LOOP { DUP ; DIP { ADD } ; PUSH nat 1 ; SWAP ; SUB ; ABS ; DUP ; PUSH nat 0 ; COMPARE ; LT } ;
+       DROP ; NIL operation ; PAIR }
+'''
+
+
+class TestCompiler(TestCase):
+    def run_both(self, code: str, parameter: str, storage: str):
+        script = michelson_to_micheline(f'parameter {parameter[0]} ; storage {storage[0]} ; code {code}')
+        kwargs = {
+            'parameter': michelson_to_micheline(parameter[1]),
+            'storage': michelson_to_micheline(storage[1]),
+            'script': script,
+        }
+        expected = Interpreter.run_code(**kwargs)
+        actual = Interpreter.run_code(**kwargs, compiled=True)
+        return expected, actual
+
+    def test_loop(self):
+        expected, actual = self.run_both(sum_script.split('code')[1], ('nat', '100'), ('nat', '0'))
+        self.assertIsNone(actual[4])
+        self.assertEqual({'int': '5050'}, actual[1])
+        self.assertEqual(expected[:4], actual[:4])
+
+    @parameterized.expand(
+        [
+            ('{ CAR ; IF_LEFT { IF { FAILWITH } { DROP ; UNIT ; NIL operation ; PAIR } } { FAILWITH } }',),
+            ('{ CAR ; IF_LEFT { DROP ; PUSH (list nat) { 1 ; 2 } ; ITER { PUSH nat 0 ; FAILWITH } } { FAILWITH } }',),
+            ('{ CAR ; IF_LEFT { DIP 0 { DROP ; PUSH nat 1 ; FAILWITH } } { FAILWITH } }',),
+            ('{ CAR ; IF_LEFT { DROP ; DROP } { FAILWITH } }',),
+        ]
+    )
+    def test_errors(self, code):
+        expected, actual = self.run_both(code, ('(or bool nat)', '(Left True)'), ('unit', 'Unit'))
+        self.assertIsNotNone(expected[4])
+        self.assertEqual(expected[4].args, actual[4].args)
+        self.assertEqual(expected[3], actual[3])
+
+    def test_lazy_push_error(self):
+        code = '{ CDR ; PUSH bool False ; IF { PUSH nat -1 ; DROP } { } ; NIL operation ; PAIR }'
+        expected, actual = self.run_both(code, ('unit', 'Unit'), ('unit', 'Unit'))
+        self.assertIsNone(actual[4])
+        self.assertEqual(expected[:4], actual[:4])
+
+    def test_fallback(self):
+        self.assertEqual(AddInstruction.execute, compile_code(AddInstruction))
+
+    def test_compiler_bug_propagates(self):
+        def broken(cls):
+            raise TypeError('bug')
+
+        with patch.dict(compilers, {AddInstruction: broken}), self.assertRaises(TypeError):
+            compile_code(AddInstruction)
+
+    def test_sequence(self):
+        seq = Micheline.match(michelson_to_micheline('{ PUSH nat 1 ; DUP ; ADD }'))
+        stack, stdout = MichelsonStack(), []  # type: ignore
+        compile_code(seq)(stack, stdout, ExecutionContext())
+        self.assertEqual(['PUSH / _ => 1', 'DUP / 1 => 1 : 1', 'ADD / 1 : 1 => 2'], stdout)
+        self.assertEqual(2, int(stack.peek()))  # type: ignore
+
+    def test_cached_per_program(self):
+        script = {'code': michelson_to_micheline(sum_script), 'storage': {'int': '0'}}
+        program = MichelsonProgram.load(ExecutionContext(script=script), with_code=True)
+        compiled = program.compile()
+        same_program = MichelsonProgram.load(ExecutionContext(script=dict(script)), with_code=True)
+        self.assertIs(program, same_program)
+        self.assertIs(compiled, same_program.compile())
@@ -0,0 +1,202 @@
+import json
+from glob import glob
+from os.path import dirname
+from os.path import join
+from unittest import TestCase
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from parameterized import parameterized  # type: ignore
+
+from pytezos.michelson.converter import FROM_PYTHON_ATTR
+from pytezos.michelson.converter import TO_PYTHON_ATTR
+from pytezos.michelson.converter import TypeMismatch
+from pytezos.michelson.converter import compile_decoder
+from pytezos.michelson.converter import compile_encoder
+from pytezos.michelson.converter import compile_from_python
+from pytezos.michelson.converter import compile_to_python
+from pytezos.michelson.converter import decode_many
+from pytezos.michelson.converter import encode_many
+from pytezos.michelson.converter import get_from_python
+from pytezos.michelson.converter import get_to_python
+from pytezos.michelson.converter import to_python_compilers
+from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.micheline import get_script_section
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types import PairType
+
+address = 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'
+
+contract_tests_dir = join(dirname(dirname(dirname(__file__))), 'contract_tests')
+
+
+def match(type_expr: str):
+    return MichelsonType.match(michelson_to_micheline(type_expr))
+
+
+class TestConverter(TestCase):
+    @parameterized.expand(
+        [
+            ('pair (address %owner) (nat %balance)', {'owner': address, 'balance': 7}),
+            ('pair address nat string', (address, 7, 'x')),
+            (
+                'pair (pair %a nat nat) (pair %b (nat %c) (nat %d)) (int %e)',
+                {'a': (1, 2), 'b': {'c': 3, 'd': 4}, 'e': -5},
+            ),
+            ('pair (nat %x) nat', {'x': 1, 'nat_1': 2}),
+            ('pair (nat %x) (nat %x)', {'x': 1, 'nat_1': 2}),
+            ('or (unit %on) (or (unit %off) (unit %idle))', 'idle'),
+            (
+                'or (nat %left) (or (string %mid) (pair %right nat (bytes %data)))',
+                {'right': {'nat_0': 1, 'data': b'\x00'}},
+            ),
+            ('or nat string', {'string_1': 'x'}),
+            ('list (pair (nat %a) (option %b timestamp))', [{'a': 1, 'b': None}, {'a': 2, 'b': 1700000000}]),
+            ('set (pair nat (or (nat %x) (unit %y)))', [(1, ('y', None)), (1, ('x', 2)), (0, ('x', 5))]),
+            ('map (pair (nat %k1) (address %k2)) (map string bytes)', {(1, address): {'a': b'\x01', 'b': b''}}),
+            ('option (pair (key_hash %kh) (mutez %amount))', {'kh': address, 'amount': 10}),
+            ('option (or (nat %a) (nat %b))', None),
+            ('big_map nat (pair (nat %a) (nat %b))', {1: {'a': 2, 'b': 3}}),
+            ('big_map nat (pair (nat %a) (nat %b))', 42),
+            ('pair (bool %flag) (bytes %raw) (lambda %f unit unit)', {'flag': True, 'raw': b'\x05\x00\x01', 'f': '{}'}),
+        ]
+    )
+    def test_same_as_methods(self, type_expr, py_obj):
+        ty = match(type_expr)
+        value = ty.from_python_object(py_obj)
+        self.assertEqual(value, compile_from_python(ty)(py_obj))
+
+        for try_unpack in [False, True]:
+            for lazy_diff in [False, True, None]:
+                try:
+                    expected = value.to_python_object(try_unpack=try_unpack, lazy_diff=lazy_diff)
+                except MichelsonRuntimeError:
+                    continue
+                self.assertEqual(expected, compile_to_python(ty, try_unpack, lazy_diff)(value))
+
+        for mode in ['readable', 'optimized', 'legacy_optimized']:
+            val_expr = value.to_micheline_value(mode=mode, lazy_diff=None)
+            self.assertEqual(val_expr, compile_encoder(ty, mode=mode, lazy_diff=None)(py_obj))
+            self.assertEqual(
+                ty.from_micheline_value(val_expr).to_python_object(lazy_diff=None),
+                compile_decoder(ty, lazy_diff=None)(val_expr),
+            )
+
+    def test_contract_storages(self):
+        for filename in sorted(glob(join(contract_tests_dir, '*', '__script__.json'))):
+            with open(filename) as f:
+                script = json.load(f)
+            ty = MichelsonType.match(get_script_section(script, name='storage')['args'][0])
+            value = ty.from_micheline_value(script['storage'])
+            expected = value.to_python_object(lazy_diff=None)
+            self.assertEqual(expected, get_to_python(ty, lazy_diff=None)(value), filename)
+            py_obj = value.to_python_object(lazy_diff=True)
+            self.assertEqual(ty.from_python_object(py_obj), get_from_python(ty)(py_obj), filename)
+
+    def test_cached_per_type(self):
+        ty = match('pair (address %owner) (nat %balance)')
+        self.assertIs(get_to_python(ty), get_to_python(match('pair (address %owner) (nat %balance)')))
+        self.assertIsNot(get_to_python(ty), get_to_python(ty, comparable=True))
+        self.assertIs(get_from_python(ty), get_from_python(ty))
+        self.assertNotIn('_to_python_converters', vars(ty.__base__))
+
+    def test_overridden_methods_not_compiled(self):
+        ty = match('big_map nat nat')
+        self.assertIs(ty.from_python_object.__func__, get_from_python(ty).__func__)
+
+    def test_unexpected_value_type(self):
+        ty = match('pair (nat %a) (nat %b)')
+        value = match('pair (nat %x) (nat %y)').from_python_object((1, 2))
+        value = ty((value.items[0], value.items[1]))
+        with self.assertRaises(TypeMismatch):
+            get_to_python(ty)(value)
+        self.assertEqual(value.to_python_object(), compile_to_python(ty)(value))
+
+    @parameterized.expand(
+        [
+            ('pair (nat %a) (nat %b)', {'a': 1}),
+            ('pair (nat %a) (nat %b)', {'a': 1, 'b': 2, 'c': 3}),
+            ('pair nat nat', (1, 2, 3)),
+            ('pair nat nat', {'nat_0': 1, 'nat_1': 2}),
+            ('or (nat %a) (nat %b)', {'c': 1}),
+            ('or (nat %a) (nat %b)', 'a'),
+            ('or (nat %a) (nat %b)', ([1], 2)),
+            ('set nat', [1, 1]),
+            ('set (pair nat nat)', [[1, 2]]),
+            ('list nat', (1, 2)),
+            ('map nat nat', [(1, 2)]),
+            ('option nat', 'x'),
+        ]
+    )
+    def test_same_errors(self, type_expr, py_obj):
+        ty = match(type_expr)
+        with self.assertRaises(Exception) as expected:
+            ty.from_python_object(py_obj)
+        with self.assertRaises(type(expected.exception)) as actual:
+            compile_from_python(ty)(py_obj)
+        self.assertEqual(expected.exception.args, actual.exception.args)
+
+    @parameterized.expand(
+        [
+            ('map unit nat', '{ Elt Unit 1 }'),
+            ('map (option (or unit int)) nat', '{ Elt (Some (Left Unit)) 1 }'),
+            ('list (map (pair unit nat) nat)', '{ { Elt (Pair Unit 1) 1 } }'),
+        ]
+    )
+    def test_same_to_python_errors(self, type_expr, val_expr):
+        ty = match(type_expr)
+        value = ty.from_micheline_value(michelson_to_micheline(val_expr))
+        with self.assertRaises(MichelsonRuntimeError) as expected:
+            value.to_python_object()
+        with self.assertRaises(MichelsonRuntimeError) as actual:
+            compile_to_python(ty)(value)
+        self.assertEqual(expected.exception.args, actual.exception.args)
+
+    def test_converter_bug_propagates(self):
+        ty = match('pair (nat %bug_a) (nat %bug_b)')
+        value = ty.from_python_object((1, 2))
+        broken = Mock(side_effect=ZeroDivisionError)
+        converters = {(False, False, False): broken}
+        with patch.object(ty, TO_PYTHON_ATTR, converters, create=True), self.assertRaises(ZeroDivisionError):
+            compile_to_python(ty)(value)
+        with patch.object(ty, FROM_PYTHON_ATTR, broken, create=True), self.assertRaises(ZeroDivisionError):
+            compile_from_python(ty)((1, 2))
+        with patch.dict(to_python_compilers, {PairType: broken}), self.assertRaises(ZeroDivisionError):
+            get_to_python(ty, try_unpack=True)
+
+    def test_decode_many(self):
+        ty = match('big_map address (pair (nat %balance) (map %allowances address nat))')
+        val_expr = [{'prim': 'Elt', 'args': [{'string': address}, {'prim': 'Pair', 'args': [{'int': '1'}, []]}]}]
+        val_exprs = [{'int': '7'}, val_expr, []]
+        for lazy_diff in [False, True, None]:
+            expected = []
+            for expr in val_exprs:
+                try:
+                    expected.append(ty.from_micheline_value(expr).to_python_object(lazy_diff=lazy_diff))
+                except MichelsonRuntimeError:
+                    expected = None
+                    break
+            if expected is not None:
+                self.assertEqual(expected, ty.decode_many(val_exprs, lazy_diff=lazy_diff))
+                self.assertEqual(expected, decode_many(ty, iter(val_exprs), lazy_diff=lazy_diff))
+
+    def test_encode_many(self):
+        ty = match('pair (address %owner) (nat %balance)')
+        py_objs = [{'owner': address, 'balance': i} for i in range(5)]
+        for mode in ['readable', 'optimized']:
+            expected = [ty.from_python_object(py_obj).to_micheline_value(mode=mode) for py_obj in py_objs]
+            self.assertEqual(expected, ty.encode_many(py_objs, mode=mode))
+            self.assertEqual(expected, encode_many(ty, (py_obj for py_obj in py_objs), mode=mode))
+
+    def test_batch_process_pool(self):
+        ty = match('pair (address %owner) (nat %balance)')
+        py_objs = [{'owner': address, 'balance': i} for i in range(10)]
+        val_exprs = encode_many(ty, py_objs, processes=2, chunk_size=3)
+        self.assertEqual(encode_many(ty, py_objs), val_exprs)
+        self.assertEqual(py_objs, decode_many(ty, iter(val_exprs), processes=2, chunk_size=3))
+        with self.assertRaises(MichelsonRuntimeError) as expected:
+            ty.from_micheline_value({'int': '1'})
+        with self.assertRaises(MichelsonRuntimeError) as actual:
+            decode_many(ty, [*val_exprs, {'int': '1'}], processes=2, chunk_size=3)
+        self.assertEqual(expected.exception.args, actual.exception.args)
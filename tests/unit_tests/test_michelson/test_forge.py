@@ -0,0 +1,75 @@
+import json
+from glob import glob
+from os.path import dirname
+from os.path import join
+from unittest import TestCase
+
+from parameterized import parameterized  # type: ignore
+
+from pytezos.michelson.forge import forge_micheline
+from pytezos.michelson.forge import unforge_micheline
+
+contract_tests_dir = join(dirname(dirname(dirname(__file__))), 'contract_tests')
+
+
+class TestMichelineForging(TestCase):
+    @parameterized.expand(
+        [
+            ({'int': '-42'}, '006a'),
+            ({'string': 'abc'}, '0100000003616263'),
+            ({'bytes': 'cafe'}, '0a00000002cafe'),
+            ([], '0200000000'),
+            ({'prim': 'UNIT'}, '034f'),
+            ({'prim': 'DUP', 'annots': ['@a']}, '0421000000024061'),
+            ({'prim': 'Pair', 'args': [{'int': '1'}, {'int': '2'}]}, '070700010002'),
+            (
+                {'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'nat'}], 'annots': [':p']},
+                '086503620362000000023a70',
+            ),
+            (
+                {'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'nat'}, {'prim': 'nat'}]},
+                '09650000000603620362036200000000',
+            ),
+            ({'prim': 'Pair', 'args': [], 'annots': []}, '0307'),
+        ]
+    )
+    def test_forge_known(self, expr, expected):
+        self.assertEqual(expected, forge_micheline(expr).hex())
+
+    def test_contract_scripts(self):
+        for filename in sorted(glob(join(contract_tests_dir, '*', '__script__.json'))):
+            with open(filename) as f:
+                script = json.load(f)
+            for expr in script['code'], script['storage']:
+                with self.subTest(filename=filename):
+                    data = forge_micheline(expr)
+                    self.assertEqual(expr, unforge_micheline(data))
+                    self.assertEqual(data, forge_micheline(unforge_micheline(bytearray(data))))
+
+    def test_deep_nesting(self):
+        expr = {'int': '0'}
+        for i in range(10000):
+            expr = {'prim': 'Pair', 'args': [{'int': str(i)}, [expr]]}
+        data = forge_micheline(expr)
+        self.assertEqual(data, forge_micheline(unforge_micheline(data)))
+
+    def test_empty_seq_args(self):
+        data = bytes.fromhex('09650000000000000000')
+        self.assertEqual({'prim': 'pair', 'args': []}, unforge_micheline(data))
+
+    @parameterized.expand(
+        [
+            ('0200000005000100', 'not enough bytes to parse array body'),
+            ('00010000', 'have not reach EOS'),
+            ('02000000020100000000', 'out of sequence boundaries'),
+            ('0b', 'unkonwn tag'),
+        ]
+    )
+    def test_unforge_malformed(self, data, message):
+        with self.assertRaises(AssertionError) as ctx:
+            unforge_micheline(bytes.fromhex(data))
+        self.assertIn(message, str(ctx.exception))
+
+    def test_forge_malformed(self):
+        with self.assertRaises(AssertionError):
+            forge_micheline({'prim': 'Pair', 'args': [None]})
@@ -0,0 +1,51 @@
+from unittest import TestCase
+
+from parameterized import parameterized  # type: ignore
+
+from pytezos.michelson.forge import forge_script_expr
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types.big_map import forge_key
+from pytezos.michelson.types.big_map import get_key_forger
+
+addresses = [
+    'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb',
+    'tz2LXbRhJdbHCsG5S6BydPLFg3YFTaGmG69S',
+    'tz3agP9LGe2cXmKQyYn6T68BHKjjktDbbSWX',
+    'KT1BEqzn5Wx8uJrZNvuS9DVHmLvG9td3fDLi',
+    'KT1BEqzn5Wx8uJrZNvuS9DVHmLvG9td3fDLi%transfer',
+]
+
+
+class TestKeyHash(TestCase):
+    @parameterized.expand(
+        [
+            ('nat', [0, 1, 63, 64, 2**70]),
+            ('int', [0, -1, -64, 64, -(2**70)]),
+            ('mutez', [0, 1000000]),
+            ('timestamp', [0, 1700000000]),
+            ('string', ['', 'abc', 'multi\nline string']),
+            ('bytes', [b'', b'\x00\xff', bytes(range(256))]),
+            ('address', addresses),
+            ('pair address nat', [(address, i) for i, address in enumerate(addresses)]),
+            ('pair nat address string', [(i, address, 'x') for i, address in enumerate(addresses)]),
+            ('pair (pair address nat) bytes', [(address, 42, b'\x01') for address in addresses]),
+            ('pair address bool', [(address, True) for address in addresses]),
+            ('key_hash', ['tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb']),
+        ]
+    )
+    def test_hash_keys(self, key_type, keys):
+        big_map = MichelsonType.match(michelson_to_micheline(f'big_map ({key_type}) unit'))
+        expected = [forge_script_expr(big_map.make_key(key).pack(legacy=True)) for key in keys]
+        self.assertEqual(expected, big_map.hash_keys(keys))
+        self.assertEqual(expected, [big_map.hash_key(big_map.make_key(key)) for key in keys])
+
+    def test_key_forgers(self):
+        self.assertIs(forge_key, get_key_forger(MichelsonType.match(michelson_to_micheline('pair address bool'))))
+        self.assertIsNot(forge_key, get_key_forger(MichelsonType.match(michelson_to_micheline('pair address nat'))))
+
+    def test_same_key_forged_once(self):
+        big_map = MichelsonType.match(michelson_to_micheline('big_map nat unit'))
+        key = big_map.make_key(7)
+        self.assertEqual(3, len(big_map.hash_keys([key, key, 7])))
+        self.assertEqual(1, len(set(big_map.hash_keys([key, key, 7]))))
@@ -0,0 +1,105 @@
+from copy import copy
+from unittest import TestCase
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.contract.data import ContractData
+from pytezos.contract.result import ContractCallResult
+from pytezos.michelson.lazy_diff import LazyDiffIndex
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types.big_map import BigMapType
+
+storage_ty = MichelsonType.match(
+    {
+        'prim': 'pair',
+        'args': [
+            {'prim': 'big_map', 'args': [{'prim': 'string'}, {'prim': 'nat'}], 'annots': ['%ledger']},
+            {'prim': 'big_map', 'args': [{'prim': 'nat'}, {'prim': 'bytes'}], 'annots': ['%metadata']},
+        ],
+    }
+)
+storage_expr = {'prim': 'Pair', 'args': [{'int': '1'}, {'int': '2'}]}
+
+
+def make_update(key: str, value):
+    update = {'key': {'string': key}, 'key_hash': BigMapType.hash_key(MichelsonType.match({'prim': 'string'})(key))}
+    if value is not None:
+        update['value'] = {'int': str(value)}
+    return update
+
+
+lazy_diff = [
+    {'kind': 'sapling_state', 'id': '1', 'diff': {'action': 'update', 'updates': {}}},
+    {'kind': 'big_map', 'id': '3', 'diff': {'action': 'update', 'updates': []}},
+    {
+        'kind': 'big_map',
+        'id': '1',
+        'diff': {
+            'action': 'update',
+            'updates': [make_update('b', 2), make_update('a', 1), make_update('c', None)],
+        },
+    },
+]
+
+
+class TestLazyDiff(TestCase):
+    def test_index(self):
+        index = LazyDiffIndex(lazy_diff)
+        self.assertEqual(lazy_diff, index)
+        self.assertIs(lazy_diff[2], index.find('big_map', 1))
+        self.assertIs(lazy_diff[0], index.find('sapling_state', '1'))
+        self.assertIsNone(index.find('big_map', 2))
+        self.assertIs(index, LazyDiffIndex.wrap(index))
+
+    def test_merge_decodes_lazily(self):
+        storage = storage_ty.from_micheline_value(storage_expr).merge_lazy_diff(LazyDiffIndex(lazy_diff))
+        ledger = storage.items[0]
+        self.assertIsNotNone(ledger.lazy_updates)
+
+        data = ContractData(ExecutionContext(), storage)
+        self.assertEqual(2, data['ledger']['b']())
+        self.assertIsNone(ledger['c'])
+        self.assertIsNotNone(ledger.lazy_updates)
+        self.assertIsNotNone(copy(ledger).lazy_updates)
+
+        self.assertIs(ledger['b'], ledger['b'])  # decoded once
+        value = ledger['b']
+
+        self.assertEqual({'a': 1, 'b': 2, 'c': None}, ledger.to_python_object(lazy_diff=True))
+        self.assertIsNone(ledger.lazy_updates)
+        self.assertIs(value, ledger.items[1][1])
+        self.assertEqual(['a', 'b'], [key.value for key, _ in ledger.items])
+
+    def test_call_result_decodes_lazily(self):
+        code = [
+            {'prim': 'parameter', 'args': [{'prim': 'unit'}]},
+            {'prim': 'storage', 'args': [storage_ty.as_micheline_expr()]},
+            {'prim': 'code', 'args': [[{'prim': 'FAILWITH'}]]},
+        ]
+        res = ContractCallResult.from_run_code(
+            {'storage': storage_expr, 'lazy_storage_diff': lazy_diff, 'operations': []},
+            parameters={'entrypoint': 'default', 'value': {'prim': 'Unit'}},
+            context=ExecutionContext(script={'code': code}),
+        )
+        ledger = res.storage_value.items[0]
+        self.assertIsNotNone(ledger.lazy_updates)
+        self.assertEqual(1, ContractData(ExecutionContext(), res.storage_value)['ledger']['a']())
+        self.assertIsNotNone(ledger.lazy_updates)
+        self.assertEqual({'ledger': {'a': 1, 'b': 2, 'c': None}, 'metadata': {}}, res.storage)
+        self.assertIn('.storage', repr(res))
+
+    def test_merge_plain_list(self):
+        storage = storage_ty.from_micheline_value(storage_expr)
+        for diff in [lazy_diff, LazyDiffIndex(lazy_diff)]:
+            self.assertEqual(
+                {'ledger': {'a': 1, 'b': 2, 'c': None}, 'metadata': {}},
+                storage.merge_lazy_diff(diff).to_python_object(lazy_diff=True),
+            )
+
+    def test_aggregate_round_trip(self):
+        storage = storage_ty.from_micheline_value(storage_expr).merge_lazy_diff(lazy_diff)
+        res = []
+        storage.aggregate_lazy_diff(res)
+        self.assertEqual(
+            [make_update('a', 1), make_update('b', 2), make_update('c', None)],
+            res[0]['diff']['updates'],
+        )
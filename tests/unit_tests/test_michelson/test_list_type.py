@@ -0,0 +1,47 @@
+from copy import deepcopy
+from unittest import TestCase
+
+from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types import NatType
+
+list_type = MichelsonType.match({'prim': 'list', 'args': [{'prim': 'nat'}]})
+
+
+class TestListType(TestCase):
+    def test_prepend_and_split(self):
+        src = list_type.from_python_object([3, 4])
+        lst = src.prepend(NatType(2)).prepend(NatType(1))
+        self.assertEqual([1, 2, 3, 4], lst.to_python_object())
+        self.assertEqual([{'int': '1'}, {'int': '2'}, {'int': '3'}, {'int': '4'}], lst.to_micheline_value())
+        self.assertEqual(4, len(lst))
+        self.assertEqual([1, 2, 3, 4], [int(lst[i]) for i in range(4)])
+        self.assertEqual(4, int(lst[-1]))
+
+        items = []
+        while len(lst) > 0:
+            head, lst = lst.split_head()
+            items.append(int(head))
+        self.assertEqual([1, 2, 3, 4], items)
+        self.assertEqual([3, 4], src.to_python_object())  # shared tail is intact
+
+    def test_versions_share_tail(self):
+        tail = list_type.from_python_object([2, 3])
+        a, b = tail.prepend(NatType(0)), tail.prepend(NatType(1))
+        self.assertEqual([0, 2, 3], a.to_python_object())
+        self.assertEqual([1, 2, 3], b.to_python_object())
+        self.assertNotEqual(a, b)
+        self.assertEqual(a.split_head()[1], b.split_head()[1])
+        self.assertEqual(tail, a.split_head()[1])
+
+    def test_long_list_deepcopy(self):
+        lst = list_type.from_python_object([])
+        for i in range(10000):
+            lst = lst.prepend(NatType(i))
+        res = deepcopy(lst)
+        self.assertEqual(lst, res)
+        self.assertEqual(lst.to_python_object(), res.to_python_object())
+
+    def test_split_empty(self):
+        with self.assertRaises(MichelsonRuntimeError):
+            list_type.from_python_object([]).split_head()
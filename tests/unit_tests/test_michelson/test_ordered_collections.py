@@ -0,0 +1,89 @@
+from random import Random
+from unittest import TestCase
+from unittest.mock import MagicMock
+
+from pytezos.michelson.micheline import MichelsonRuntimeError
+from pytezos.michelson.types import IntType
+from pytezos.michelson.types import MichelsonType
+from pytezos.michelson.types import NatType
+from pytezos.michelson.types import PairType
+from pytezos.michelson.types import StringType
+
+map_type = MichelsonType.match({'prim': 'map', 'args': [{'prim': 'int'}, {'prim': 'string'}]})
+set_type = MichelsonType.match({'prim': 'set', 'args': [{'prim': 'int'}]})
+pair_map_type = MichelsonType.match(
+    {'prim': 'map', 'args': [{'prim': 'pair', 'args': [{'prim': 'nat'}, {'prim': 'nat'}]}, {'prim': 'int'}]}
+)
+big_map_type = MichelsonType.match({'prim': 'big_map', 'args': [{'prim': 'int'}, {'prim': 'int'}]})
+
+
+class TestOrderedCollections(TestCase):
+    def test_map_random_updates(self):
+        rnd = Random(42)
+        model: dict = {}
+        src = map_type.from_python_object({})
+        for _ in range(500):
+            key = rnd.randint(-50, 50)
+            val = rnd.choice([None, str(rnd.randint(0, 100))])
+            prev, dst = src.update(IntType(key), None if val is None else StringType(val))
+            self.assertEqual(model.get(key), None if prev is None else str(prev))
+            self.assertEqual(model, src.to_python_object())  # previous version is intact
+            if val is None:
+                model.pop(key, None)
+            else:
+                model[key] = val
+            src = dst
+            self.assertEqual(model, src.to_python_object())
+            self.assertEqual(sorted(model), list(src.to_python_object()))
+            self.assertEqual(key in model, src.contains(IntType(key)))
+
+    def test_set_random_updates(self):
+        rnd = Random(42)
+        model: set = set()
+        src = set_type.from_python_object([])
+        for _ in range(500):
+            item = rnd.randint(-50, 50)
+            before = sorted(model)
+            if rnd.random() < 0.5:
+                dst = src.add(IntType(item))
+                model.add(item)
+            else:
+                dst = src.remove(IntType(item))
+                model.discard(item)
+            self.assertEqual(before, src.to_python_object())  # previous version is intact
+            src = dst
+            self.assertEqual(sorted(model), src.to_python_object())
+            self.assertEqual(item in model, src.contains(IntType(item)))
+
+    def test_pair_keys_ordering(self):
+        keys = [(2, 0), (1, 5), (1, 2), (0, 9)]
+        src = pair_map_type.from_python_object(dict.fromkeys(keys, 0))
+        self.assertEqual(sorted(keys), list(src.to_python_object()))
+        key = PairType.from_comb([NatType(1), NatType(5)])
+        self.assertEqual(0, int(src.get(key)))
+        self.assertFalse(key < key)
+
+    def test_check_constraints(self):
+        with self.assertRaisesRegex(MichelsonRuntimeError, 'unsorted'):
+            map_type.from_micheline_value([{'prim': 'Elt', 'args': [{'int': str(i)}, {'string': ''}]} for i in (2, 1)])
+        with self.assertRaisesRegex(MichelsonRuntimeError, 'duplicate'):
+            set_type.from_micheline_value([{'int': '1'}, {'int': '1'}])
+
+    def test_big_map_update_loaded_key(self):
+        context = MagicMock()
+        context.get_big_map_value.return_value = {'int': '7'}
+        src = big_map_type.from_micheline_value({'int': '1'})
+        src.context = context
+
+        prev, dst = src.update(IntType(1), IntType(8))
+        self.assertEqual(7, int(prev))
+        self.assertEqual(8, int(dst.get(IntType(1))))
+
+        prev, dst = dst.update(IntType(1), None)
+        self.assertEqual(8, int(prev))
+        self.assertIsNone(dst.get(IntType(1)))
+        self.assertEqual({1: None}, dst.to_python_object(lazy_diff=True))
+
+        prev, dst = dst.update(IntType(1), IntType(9))
+        self.assertIsNone(prev)
+        self.assertEqual({1: 9}, dst.to_python_object(lazy_diff=True))
@@ -1,8 +1,36 @@
+import json
+from glob import glob
+from os.path import dirname
+from os.path import join
 from unittest import TestCase
 
+from parameterized import parameterized  # type: ignore
+
+from pytezos.michelson.format import micheline_to_michelson
+from pytezos.michelson.parse import FastMichelsonParser
 from pytezos.michelson.parse import MichelsonParser
+from pytezos.michelson.parse import MichelsonParserError
+from pytezos.michelson.parse import michelson_to_micheline
 from pytezos.michelson.types import TimestampType
 
+unit_tests_dir = dirname(dirname(__file__))
+contract_tests_dir = join(dirname(unit_tests_dir), 'contract_tests')
+
+
+def assert_same_tree(test: TestCase, expected, actual):
+    # Sequence vs list matters for the consumers, plain equality does not tell them apart
+    test.assertIs(type(expected), type(actual))
+    if isinstance(expected, list):
+        test.assertEqual(len(expected), len(actual))
+        for a, b in zip(expected, actual):
+            assert_same_tree(test, a, b)
+    elif isinstance(expected, dict):
+        test.assertEqual(list(expected), list(actual))
+        for key in expected:
+            assert_same_tree(test, expected[key], actual[key])
+    else:
+        test.assertEqual(expected, actual)
+
 
 class TestParsing(TestCase):
     def test_wrapped_expr(self):
@@ -16,3 +44,98 @@ class TestParsing(TestCase):
     def test_timestamp_with_millis(self):
         res = TimestampType.from_micheline_value({'string': '2021-01-06T14:57:27.821Z'})
         self.assertEqual(1609945047, int(res))
+
+
+class TestFastParsing(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = MichelsonParser()
+        cls.fast_parser = FastMichelsonParser()
+
+    def test_contract_scripts(self):
+        filenames = sorted(glob(join(contract_tests_dir, '*', '__script__.json')))
+        self.assertTrue(filenames)
+        for filename in filenames:
+            with open(filename) as f:
+                source = micheline_to_michelson(json.load(f)['code'])
+            with self.subTest(filename=filename):
+                assert_same_tree(self, self.parser.parse(source), self.fast_parser.parse(source))
+
+    def test_michelson_scripts(self):
+        filenames = sorted(glob(join(unit_tests_dir, '**', '*.tz'), recursive=True))
+        self.assertTrue(filenames)
+        for filename in filenames:
+            with open(filename) as f:
+                source = f.read()
+            with self.subTest(filename=filename):
+                try:
+                    expected = self.parser.parse(source)
+                except MichelsonParserError as e:  # deprecated instructions
+                    with self.assertRaises(MichelsonParserError) as ctx:
+                        self.fast_parser.parse(source)
+                    self.assertEqual((e.pos, e.message), (ctx.exception.pos, ctx.exception.message))
+                else:
+                    assert_same_tree(self, expected, self.fast_parser.parse(source))
+
+    @parameterized.expand(
+        [
+            ('',),
+            ('(Pair 1 2)',),
+            ('Pair 0x "a\\"b" -1',),
+            ('{}',),
+            ('{ {} ; ; { DUP } ; }',),
+            ('parameter (or (nat %a) (unit :u %b)); storage unit; code { CDR ; NIL operation ; PAIR }',),
+            ('{ Elt "a" { 1 ; 2 } ; Elt "b" {} }',),
+            ('UNPAIR @left',),
+            ('{ DIIIP { DROP } ; CADAR ; IF_SOME {} { FAIL } ; ASSERT_CMPEQ ; SET_CAR %x }',),
+            ('/* comment */ { DROP # comment\n ; UNIT }',),
+            ('LAMBDA (pair nat nat) nat { UNPAIR ; ADD }',),
+        ]
+    )
+    def test_expressions(self, source):
+        assert_same_tree(self, self.parser.parse(source), self.fast_parser.parse(source))
+
+    @parameterized.expand(
+        [
+            ('{ DUP ; } }', 10),
+            ('Pair 1 2 ; )', 11),
+            ('{ DUP @a } %b', 11),
+            ('PUSH nat (1 2)', 10),
+            ('PAIR ( )', 7),
+            ('{ DUP ; ! }', 8),
+            ('{ DUP ; FOO }', 8),
+        ]
+    )
+    def test_error_position(self, source, pos):
+        with self.assertRaises(MichelsonParserError) as expected:
+            self.parser.parse(source)
+        with self.assertRaises(MichelsonParserError) as actual:
+            self.fast_parser.parse(source)
+        self.assertEqual(pos, expected.exception.pos)
+        self.assertEqual(pos, actual.exception.pos)
+
+    def test_line_number(self):
+        with self.assertRaises(MichelsonParserError) as ctx:
+            self.fast_parser.parse('{ DUP ;\n  DROP ;\n  } }')
+        self.assertEqual(3, ctx.exception.line)
+        self.assertEqual(21, ctx.exception.pos)
+
+    def test_unexpected_end(self):
+        with self.assertRaises(MichelsonParserError) as ctx:
+            self.fast_parser.parse('{ DUP ; DROP')
+        self.assertEqual(12, ctx.exception.pos)
+
+    def test_deep_nesting(self):
+        depth = 5000
+        res = self.fast_parser.parse('{' * depth + '}' * depth)
+        for _ in range(depth - 1):
+            res = res[0]
+        self.assertEqual([], res)
+
+    def test_extra_primitives(self):
+        res = FastMichelsonParser(extra_primitives=['FOO']).parse('FOO @x 1')
+        self.assertEqual({'prim': 'FOO', 'annots': ['@x'], 'args': [{'int': '1'}]}, res)
+
+    def test_michelson_to_micheline_flag(self):
+        source = 'parameter unit; storage unit; code { CDR ; NIL operation ; PAIR }'
+        assert_same_tree(self, michelson_to_micheline(source), michelson_to_micheline(source, fast=True))
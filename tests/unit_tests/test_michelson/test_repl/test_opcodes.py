@@ -1103,21 +1103,25 @@ class OpcodesTestCase(TestCase):
         with open(join(dirname(__file__), 'opcodes', filename)) as f:
             script = f.read()
 
-        _, storage, lazy_diff, stdout, error = Interpreter.run_code(
-            parameter=michelson_to_micheline(parameter),
-            storage=michelson_to_micheline(storage),
-            script=michelson_to_micheline(script),
-            balance=BALANCE,
-            chain_id=CHAIN_ID,
-            total_voting_power=TOTAL_VOTING_POWER,
-            voting_power={KEY_HASH: VOTING_POWER},
-            min_block_time=MIN_BLOCK_TIME,
-        )
+        kwargs = {
+            'parameter': michelson_to_micheline(parameter),
+            'storage': michelson_to_micheline(storage),
+            'script': michelson_to_micheline(script),
+            'balance': BALANCE,
+            'chain_id': CHAIN_ID,
+            'total_voting_power': TOTAL_VOTING_POWER,
+            'voting_power': {KEY_HASH: VOTING_POWER},
+            'min_block_time': MIN_BLOCK_TIME,
+        }
+        _, storage, lazy_diff, stdout, error = Interpreter.run_code(**kwargs)
         if error:
             print('\n'.join(stdout))
             raise error
         self.assertEqual(michelson_to_micheline(result), storage)
 
+        _, compiled_storage, compiled_lazy_diff, compiled_stdout, _ = Interpreter.run_code(**kwargs, compiled=True)
+        self.assertEqual((storage, lazy_diff, stdout), (compiled_storage, compiled_lazy_diff, compiled_stdout))
+
     @parameterized.expand(
         [
             # Test building Fr element from nat.
@@ -1538,10 +1542,15 @@ class OpcodesTestCase(TestCase):
         with open(join(dirname(__file__), 'opcodes', filename)) as f:
             script = f.read()
 
-        _, _, _, _, error = Interpreter.run_code(
-            parameter=michelson_to_micheline(parameter),
-            storage=michelson_to_micheline(storage),
-            script=michelson_to_micheline(script),
-        )
+        kwargs = {
+            'parameter': michelson_to_micheline(parameter),
+            'storage': michelson_to_micheline(storage),
+            'script': michelson_to_micheline(script),
+        }
+        _, _, _, stdout, error = Interpreter.run_code(**kwargs)
         self.assertIsInstance(error, MichelsonRuntimeError)
         self.assertEqual(error.args[-1], error_msg)
+
+        _, _, _, compiled_stdout, compiled_error = Interpreter.run_code(**kwargs, compiled=True)
+        self.assertEqual(error.args, compiled_error.args)
+        self.assertEqual(stdout, compiled_stdout)
@@ -55,6 +55,40 @@ class InterpreterTest(TestCase):
         )
         self.assertEqual([PairType((IntType(2), IntType(1)))], interpreter.stack.items)
 
+    def test_execute_rollback_context(self) -> None:
+        # Arrange
+        interpreter = Interpreter()
+        interpreter.execute("EMPTY_BIG_MAP string nat")
+        big_map = interpreter.stack.peek()
+        context = interpreter.context
+        tmp_big_map_index = context.tmp_big_map_index
+
+        # Act
+        result = interpreter.execute("EMPTY_BIG_MAP string nat; PATCH BALANCE 200; PAIR; PAIR")
+
+        # Assert
+        self.assertIsInstance(result.error, MichelsonRuntimeError)
+        self.assertIs(context, interpreter.context)
+        self.assertIs(context, big_map.context)
+        self.assertEqual(tmp_big_map_index, context.tmp_big_map_index)
+        self.assertIsNone(context.balance)
+        self.assertEqual([big_map], interpreter.stack.items)
+
+    def test_dup_shares_value(self) -> None:
+        # Arrange
+        interpreter = Interpreter()
+        interpreter.execute("PUSH (list (pair nat string)) {Pair 1 \"a\"; Pair 2 \"b\"}")
+        value = interpreter.stack.peek()
+
+        # Act
+        result = interpreter.execute("DUP")
+
+        # Assert
+        self.assertEqual(None, result.error)
+        self.assertEqual([value, value], interpreter.stack.items)
+        self.assertIsNot(interpreter.stack.items[0], interpreter.stack.items[1])
+        self.assertIs(interpreter.stack.items[0].items[0], interpreter.stack.items[1].items[0])
+
     def test_execute_contract(self) -> None:
         # Arrange
         interpreter = Interpreter()
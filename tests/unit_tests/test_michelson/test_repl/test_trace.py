@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from parameterized import parameterized  # type: ignore
+
+from pytezos.context.impl import ExecutionContext
+from pytezos.michelson.instructions.base import format_stdout
+from pytezos.michelson.instructions.base import tracing
+from pytezos.michelson.parse import michelson_to_micheline
+from pytezos.michelson.repl import Interpreter
+from pytezos.michelson.types import NatType
+
+script = michelson_to_micheline('''
+    parameter nat ;
+    storage nat ;
+    code { UNPAIR ; DUP ; PUSH nat 10 ; COMPARE ; LT ; IF { FAILWITH } { ADD ; NIL operation ; PAIR } } ;
+    view "add" nat nat { UNPAIR ; ADD }
+    ''')
+
+
+class TestTracing(TestCase):
+    @parameterized.expand([(False,), (True,)])
+    def test_run_code(self, compiled):
+        kwargs = {'parameter': {'int': '3'}, 'storage': {'int': '5'}, 'script': script, 'compiled': compiled}
+        _, storage, _, stdout, error = Interpreter.run_code(**kwargs)
+        self.assertIsNone(error)
+        self.assertEqual('END %default / ([] * 8) => _', stdout[-1])
+
+        _, no_trace_storage, _, no_trace_stdout, error = Interpreter.run_code(**kwargs, trace=False)
+        self.assertIsNone(error)
+        self.assertEqual(storage, no_trace_storage)
+        self.assertEqual([], no_trace_stdout)
+
+    @parameterized.expand([(False,), (True,)])
+    def test_run_code_error(self, compiled):
+        kwargs = {'parameter': {'int': '11'}, 'storage': {'int': '5'}, 'script': script, 'compiled': compiled}
+        _, _, _, stdout, error = Interpreter.run_code(**kwargs)
+        _, _, _, no_trace_stdout, no_trace_error = Interpreter.run_code(**kwargs, trace=False)
+        self.assertEqual(error.args, no_trace_error.args)
+        self.assertEqual(['FAILWITH: 11'], no_trace_stdout)
+        self.assertEqual(stdout[-1], no_trace_stdout[-1])
+
+    def test_run_view(self):
+        context = ExecutionContext(script={'code': script, 'storage': {'int': '5'}})
+        res, stdout, error = Interpreter.run_view('add', {'int': '3'}, {'int': '5'}, context, trace=False)
+        self.assertIsNone(error)
+        self.assertEqual(8, res)
+        self.assertEqual([], stdout)
+
+    def test_tracing(self):
+        with tracing(False):
+            self.assertEqual('', format_stdout('PUSH', [], [NatType(1)]))
+            with tracing(True):
+                self.assertEqual('PUSH / _ => 1', format_stdout('PUSH', [], [NatType(1)]))
+        self.assertEqual('PUSH / _ => 1', format_stdout('PUSH', [], [NatType(1)]))
+
+    def test_repl_trace(self):
+        result = Interpreter().execute('PUSH nat 1')
+        self.assertEqual(['PUSH / _ => 1'], result.stdout)
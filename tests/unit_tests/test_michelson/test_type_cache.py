@@ -0,0 +1,58 @@
+from copy import deepcopy
+from unittest import TestCase
+
+from pytezos.michelson.micheline import TypeCache
+from pytezos.michelson.micheline import type_cache
+from pytezos.michelson.types.base import MichelsonType
+from pytezos.michelson.types.map import MapType
+
+storage_expr = {
+    'prim': 'pair',
+    'args': [
+        {'prim': 'big_map', 'args': [{'prim': 'address'}, {'prim': 'nat'}], 'annots': ['%ledger']},
+        {'prim': 'map', 'args': [{'prim': 'string'}, {'prim': 'bytes'}], 'annots': ['%metadata']},
+    ],
+}
+
+
+class TestTypeCache(TestCase):
+    def setUp(self) -> None:
+        self.maxsize = type_cache.maxsize
+
+    def tearDown(self) -> None:
+        type_cache.resize(self.maxsize)
+
+    def test_identical_expressions(self):
+        storage_type = MichelsonType.match(storage_expr)
+        self.assertIs(storage_type, MichelsonType.match(deepcopy(storage_expr)))
+        self.assertIs(storage_type.args[1], MichelsonType.match(storage_expr['args'][1]))
+        self.assertTrue(issubclass(storage_type.args[1], MapType))
+        self.assertEqual(storage_expr, storage_type.as_micheline_expr())
+
+    def test_annotations_and_literals(self):
+        nat = MichelsonType.match({'prim': 'nat'})
+        self.assertIsNot(nat, MichelsonType.match({'prim': 'nat', 'annots': ['%amount']}))
+        self.assertIsNot(nat, MichelsonType.match({'prim': 'int'}))
+        push = [{'prim': 'PUSH', 'args': [{'prim': 'nat'}, {'int': '1'}]}]
+        self.assertIs(MichelsonType.match(push), MichelsonType.match(deepcopy(push)))
+        self.assertIsNot(
+            MichelsonType.match({'int': '1'}),
+            MichelsonType.match({'string': '1'}),
+        )
+
+    def test_stats(self):
+        cache = TypeCache()
+        cache.intern(('a',), lambda: MapType)
+        cache.intern(('a',), lambda: MapType)
+        stats = cache.stats()
+        self.assertEqual(1, stats['hits'])
+        self.assertEqual(1, stats['misses'])
+        self.assertEqual(1, stats['size'])
+
+    def test_bounded(self):
+        type_cache.resize(2)
+        for prim in ('nat', 'int', 'string', 'bytes'):
+            MichelsonType.match({'prim': prim})
+        self.assertEqual(2, len(type_cache))
+        type_cache.resize(0)
+        self.assertIsNot(MichelsonType.match({'prim': 'nat'}), MichelsonType.match({'prim': 'nat'}))
@@ -0,0 +1,71 @@
+from copy import copy
+from copy import deepcopy
+from unittest import TestCase
+
+from parameterized import parameterized  # type: ignore
+
+from pytezos.michelson.micheline import Micheline
+from pytezos.michelson.stack import MichelsonStack
+from pytezos.michelson.types import IntType
+from pytezos.michelson.types.base import MichelsonType
+
+type_expr = {
+    'prim': 'pair',
+    'args': [
+        {'prim': 'big_map', 'args': [{'prim': 'string'}, {'prim': 'nat'}]},
+        {'prim': 'list', 'args': [{'prim': 'option', 'args': [{'prim': 'address'}]}]},
+        {'prim': 'or', 'args': [{'prim': 'unit', 'annots': ['%a']}, {'prim': 'bytes', 'annots': ['%b']}]},
+        {'prim': 'set', 'args': [{'prim': 'mutez'}]},
+    ],
+}
+val_expr = {
+    'prim': 'Pair',
+    'args': [
+        [{'prim': 'Elt', 'args': [{'string': 'a'}, {'int': '1'}]}],
+        [{'prim': 'Some', 'args': [{'string': 'tz1VSUr8wwNhLAzempoch5d6hLRiTh8Cjcjb'}]}, {'prim': 'None'}],
+        {'prim': 'Right', 'args': [{'bytes': '00'}]},
+        [{'int': '1'}, {'int': '2'}],
+    ],
+}
+
+
+def iter_values(value):
+    yield value
+    for attr in ['items', 'item']:
+        children = getattr(value, attr, None)
+        if isinstance(children, (list, tuple)):
+            for child in children:
+                for item in child if isinstance(child, tuple) else [child]:
+                    if isinstance(item, MichelsonType):
+                        yield from iter_values(item)
+        elif isinstance(children, MichelsonType):
+            yield from iter_values(children)
+
+
+class TestValueLayout(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.ty = MichelsonType.match(type_expr)
+        cls.value = cls.ty.from_micheline_value(val_expr)
+
+    def test_no_instance_dict(self):
+        values = list(iter_values(self.value))
+        self.assertGreater(len(values), 10)
+        for value in values:
+            self.assertFalse(hasattr(value, '__dict__'), type(value).__mro__)
+
+    def test_no_stack_dict(self):
+        self.assertFalse(hasattr(MichelsonStack(), '__dict__'))
+
+    def test_unknown_attribute(self):
+        with self.assertRaises(AttributeError):
+            IntType(1).foo = 1  # type: ignore
+
+    @parameterized.expand([(copy,), (deepcopy,)])
+    def test_copy(self, func):
+        res = func(self.value)
+        self.assertEqual(repr(self.value), repr(res))
+
+    def test_instruction_dict(self):
+        instr = Micheline.match({'prim': 'DUP'})(stack_items_added=1)
+        self.assertTrue(hasattr(instr, '__dict__'))
@@ -0,0 +1,110 @@
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+from unittest import TestCase
+from unittest import skipIf
+from unittest.mock import AsyncMock
+from unittest.mock import patch
+
+from pytezos.rpc.aio import AsyncRpcNode
+from pytezos.rpc.aio import AsyncShellQuery
+from pytezos.rpc.errors import MichelsonError
+from pytezos.rpc.node import RpcMultiNode
+
+try:
+    from aiohttp import web  # type: ignore
+except ImportError:
+    web = None
+
+
+@skipIf(web is None, 'aiohttp is not installed')
+class TestAsyncRpc(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        async def header(request):
+            return web.json_response({'level': int(request.match_info['block'])})
+
+        async def operation(request):
+            return web.json_response({'path': request.path, 'query': dict(request.query)})
+
+        async def operations(request):
+            return web.json_response([{'index': j} for j in range(3)])
+
+        async def operation_hashes(request):
+            return web.json_response([[], [], [], ['oo1']])
+
+        async def injection(request):
+            return web.json_response(f'op{await request.json()}{request.query["async"]}')
+
+        async def error(request):
+            return web.json_response([{'kind': 'temporary', 'id': 'proto.alpha.michelson_v1.bad_return'}], status=500)
+
+        app = web.Application()
+        app.router.add_get('/chains/main/blocks/{block}/header', header)
+        app.router.add_get('/chains/main/blocks/{block}/operations/{i}', operations)
+        app.router.add_get('/chains/main/blocks/{block}/operations/{i}/{j}', operation)
+        app.router.add_get('/chains/main/blocks/{block}/operation_hashes', operation_hashes)
+        app.router.add_post('/injection/operation', injection)
+        app.router.add_get('/chains/main/blocks/head/context/constants', error)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, '127.0.0.1', 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.node = AsyncRpcNode(f'http://127.0.0.1:{port}', pool_maxsize=4)
+        self.shell = AsyncShellQuery(self.node)
+
+    async def asyncTearDown(self):
+        await self.node.close()
+        await self.runner.cleanup()
+
+    async def test_path_building(self):
+        res = await self.shell.blocks[123].operations[3][0](metadata='always', debug=None)
+        self.assertEqual({'path': '/chains/main/blocks/123/operations/3/0', 'query': {'metadata': 'always'}}, res)
+
+    async def test_gather(self):
+        headers = await asyncio.gather(*(self.shell.blocks[level].header() for level in range(1, 33)))
+        self.assertEqual(list(range(1, 33)), [header['level'] for header in headers])
+
+    async def test_injection(self):
+        self.assertEqual('opdeadtrue', await self.shell.injection.operation.post(b'\xde\xad', _async=True))
+
+    async def test_error(self):
+        with self.assertRaises(MichelsonError):
+            await self.shell.head.context.constants()
+
+    async def test_iter(self):
+        items = [item async for item in self.shell.blocks[1].operations[3].iter()]
+        self.assertEqual([{'index': 0}, {'index': 1}, {'index': 2}], items)
+
+    async def test_private_helpers(self):
+        self.assertEqual({'level': 5}, await self.shell.blocks[5].header._get())
+        self.assertEqual('opbeeffalse', await self.shell.injection.operation._post('beef', params={'async': False}))
+
+    async def test_wait_operations_not_included(self):
+        async def wait_blocks(current_block_hash, max_blocks, **kwargs):
+            for level in range(max_blocks + 1):
+                yield f'B{level}'
+
+        pending_mock = AsyncMock(return_value=[])
+        with patch.object(self.shell, 'wait_blocks', wait_blocks), patch.object(
+            self.shell, 'pending_operation_hashes', pending_mock
+        ), self.assertRaises(TimeoutError):
+            await self.shell.wait_operations(['oo2'], ttl=2, min_confirmations=1, current_block_hash='B0')
+
+    async def test_wait_operations(self):
+        async def wait_blocks(current_block_hash, max_blocks, **kwargs):
+            for level in range(max_blocks + 1):
+                yield f'B{level}'
+
+        pending_mock = AsyncMock(return_value=['oo1'])
+        with patch.object(self.shell, 'wait_blocks', wait_blocks), patch.object(
+            self.shell, 'pending_operation_hashes', pending_mock
+        ):
+            operations = await self.shell.wait_operations(['oo1'], ttl=2, min_confirmations=1, current_block_hash='B0')
+        self.assertEqual([{'path': '/chains/main/blocks/B0/operations/3/0', 'query': {}}], operations)
+        pending_mock.assert_awaited_once()
+
+
+class TestAsyncRpcNode(TestCase):
+    def test_from_multi_node(self):
+        with self.assertRaises(NotImplementedError):
+            AsyncRpcNode.from_node(RpcMultiNode(['http://a:8732', 'http://b:8732']))
@@ -0,0 +1,104 @@
+from time import monotonic
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+
+from pytezos.rpc.node import RpcMultiNode
+from tests.unit_tests.test_rpc.test_node import make_response
+
+uris = ['http://a:8732', 'http://b:8732', 'http://c:8732']
+
+
+def wait_checked(node, timeout=5):
+    deadline = monotonic() + timeout
+    while any(x['head_level'] is None for x in node.stats()):
+        assert monotonic() < deadline, 'health check did not complete'
+        sleep(0.01)
+
+
+class FakeNetwork:
+    def __init__(self, levels=None, delays=None, down=(), probe_delay=0):
+        self.levels = levels or {}
+        self.delays = delays or {}
+        self.probe_delay = probe_delay
+        self.down = set(down)
+        self.calls = []
+
+    def __call__(self, method, url, **kwargs):
+        host = url.split('/')[2].split(':')[0]
+        self.calls.append((host, url.split(':8732/')[1]))
+        if host in self.down:
+            raise requests.exceptions.ConnectionError(host)
+        sleep(self.delays.get(host, 0))
+        if url.endswith('head/header/shell'):
+            sleep(self.probe_delay)
+            return make_response(b'{"level": %d}' % self.levels.get(host, 100))
+        return make_response(b'"%s"' % host.encode())
+
+
+class TestRpcMultiNode(TestCase):
+    def test_retry_and_eject(self):
+        network = FakeNetwork(down={'a'})
+        with patch('requests.Session.request', side_effect=network):
+            node = RpcMultiNode(uris, health_check_interval=None, max_failures=2)
+            results = [node.get('version') for _ in range(6)]
+
+        self.assertTrue(all(res in ('b', 'c') for res in results))
+        self.assertEqual(2, sum(1 for host, _ in network.calls if host == 'a'))
+        stats = node.stats()
+        self.assertTrue(stats[0]['ejected'])
+        self.assertEqual(2, stats[0]['errors'])
+        self.assertEqual(2, node.retried)
+
+    def test_post_is_not_retried(self):
+        network = FakeNetwork(down={'a', 'b', 'c'})
+        with patch('requests.Session.request', side_effect=network):
+            node = RpcMultiNode(uris, health_check_interval=None)
+            with self.assertRaises(requests.exceptions.ConnectionError):
+                node.post('injection/operation', json='00')
+        self.assertEqual(1, len(network.calls))
+
+    def test_lagging_node(self):
+        network = FakeNetwork(levels={'a': 100, 'b': 90, 'c': 99})
+        with patch('requests.Session.request', side_effect=network):
+            node = RpcMultiNode(uris, health_check_interval=60)
+            node.get('version')  # triggers the background health check
+            wait_checked(node)
+            results = {node.get('version') for _ in range(10)}
+
+        self.assertNotIn('b', results)
+        self.assertEqual([100, 90, 99], [x['head_level'] for x in node.stats()])
+        self.assertEqual([False, True, False], [x['lagging'] for x in node.stats()])
+
+    def test_health_check_does_not_block_requests(self):
+        network = FakeNetwork(levels={'a': 100, 'b': 90, 'c': 99}, probe_delay=0.5)
+        with patch('requests.Session.request', side_effect=network):
+            node = RpcMultiNode(uris, health_check_interval=60)
+            started = monotonic()
+            node.get('version')
+            self.assertLess(monotonic() - started, 0.4)
+            wait_checked(node)
+        self.assertEqual([False, True, False], [x['lagging'] for x in node.stats()])
+
+    def test_latency_aware(self):
+        network = FakeNetwork(delays={'a': 0.05})
+        with patch('requests.Session.request', side_effect=network):
+            node = RpcMultiNode(uris[:2], health_check_interval=None)
+            results = [node.get('version') for _ in range(10)]
+        self.assertGreater(results.count('b'), results.count('a'))
+
+    def test_hedging(self):
+        network = FakeNetwork()
+        with patch('requests.Session.request', side_effect=network):
+            node = RpcMultiNode(uris[:2], health_check_interval=None, hedge_percentile=50)
+            for _ in range(4):
+                node.get('version')
+            node.hedged = 0  # warm-up requests might be hedged on a busy machine
+            primary = min(range(2), key=lambda i: node.node_stats[i].score())
+            network.delays = {'a': 0.2, 'b': 0.2}
+            fast_host = 'ab'[1 - primary]
+            network.delays[fast_host] = 0
+            self.assertEqual(fast_host, node.get('version'))
+        self.assertEqual(1, node.hedged)
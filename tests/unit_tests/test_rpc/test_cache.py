@@ -0,0 +1,62 @@
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from pytezos.rpc.cache import RpcCache
+from pytezos.rpc.node import RpcNode
+from tests.unit_tests.test_rpc.test_node import make_response
+
+block_hash = 'BLockGenesisGenesisGenesisGenesisGenesisf79b5d1CoW2'
+
+
+def respond(method, url, **kwargs):
+    if url.endswith('head/header/shell'):
+        return make_response(b'{"level": 100}')
+    return make_response(b'{"url": "%s"}' % url.encode())
+
+
+class TestRpcCache(TestCase):
+    def test_immutable_paths(self):
+        cache = RpcCache()
+        head_level = lambda: 100  # noqa: E731
+        self.assertTrue(cache.is_immutable(f'/chains/main/blocks/{block_hash}/operations', head_level))
+        self.assertTrue(cache.is_immutable(f'chains/main/blocks/{block_hash}~2/header', head_level))
+        self.assertTrue(cache.is_immutable('/chains/main/blocks/98/header', head_level))
+        self.assertFalse(cache.is_immutable('/chains/main/blocks/99/header', head_level))
+        self.assertFalse(cache.is_immutable('/chains/test/blocks/1/header', head_level))
+        self.assertFalse(cache.is_immutable('/chains/main/blocks/head/header', head_level))
+        self.assertFalse(cache.is_immutable('/chains/main/blocks/head~10/header', head_level))
+        self.assertFalse(cache.is_immutable('/chains/main/mempool/pending_operations', head_level))
+
+    def test_lru_eviction(self):
+        cache = RpcCache(maxsize=2)
+        cache.put(('a', ()), b'1')
+        cache.put(('b', ()), b'2')
+        self.assertEqual(b'1', cache.get(('a', ())))
+        cache.put(('c', ()), b'3')
+        self.assertIsNone(cache.get(('b', ())))
+        self.assertEqual({'hits': 1, 'misses': 1, 'size': 2}, {k: cache.stats()[k] for k in ('hits', 'misses', 'size')})
+
+    @patch('requests.Session.request', side_effect=respond)
+    def test_node_cache(self, request_mock):
+        node = RpcNode('http://localhost:8732', cache=RpcCache())
+        for _ in range(3):
+            node.get(f'/chains/main/blocks/{block_hash}/header', params={'x': 1, 'y': None})
+            node.get('/chains/main/blocks/50/header')
+            node.get('/chains/main/blocks/head/header')
+        res = node.get('/chains/main/blocks/50/header')
+        res['url'] = 'mutated'
+        self.assertNotEqual('mutated', node.get('/chains/main/blocks/50/header')['url'])
+        # 2 cacheable misses, 1 finalized level lookup, 3 head requests
+        self.assertEqual(6, request_mock.call_count)
+        self.assertEqual(6, node.cache.hits)
+        self.assertEqual(2, node.cache.misses)
+
+    @patch('requests.Session.request', side_effect=respond)
+    def test_disk_store(self, request_mock):
+        with TemporaryDirectory() as path:
+            RpcNode('http://localhost:8732', cache=RpcCache(path=path)).get(f'/chains/main/blocks/{block_hash}')
+            node = RpcNode('http://localhost:8732', cache=RpcCache(path=path))
+            node.get(f'/chains/main/blocks/{block_hash}')
+        self.assertEqual(1, request_mock.call_count)
+        self.assertEqual(1, node.cache.disk_hits)
@@ -0,0 +1,95 @@
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from time import sleep
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import simplejson as json
+
+from pytezos.rpc.errors import RpcError
+from pytezos.rpc.node import RpcMultiNode
+from pytezos.rpc.node import RpcNode
+
+
+def make_response(data=b'{}', status_code=200):
+    res = MagicMock()
+    res.status_code = status_code
+    res.content = data
+    res.text = data.decode()
+    res.json.side_effect = lambda: json.loads(data)
+    return res
+
+
+class TestRpcNode(TestCase):
+    @patch('requests.Session.request')
+    def test_session_is_reused(self, request_mock):
+        request_mock.return_value = make_response(b'{"level": 1}')
+        node = RpcNode('http://localhost:8732', pool_maxsize=4)
+        session = node.session
+        self.assertEqual({'level': 1}, node.get('chains/main/blocks/head/header'))
+        self.assertEqual({'level': 1}, node.get('chains/main/blocks/head/header'))
+        self.assertIs(session, node.session)
+        self.assertEqual(2, request_mock.call_count)
+        self.assertEqual(4, session.get_adapter('http://localhost:8732')._pool_maxsize)
+
+    def test_session_is_created_once(self):
+        node = RpcNode('http://localhost:8732')
+        with ThreadPoolExecutor(8) as executor:
+            sessions = list(executor.map(lambda _: node.session, range(32)))
+        self.assertTrue(all(s is sessions[0] for s in sessions))
+
+    @patch('requests.Session.request')
+    def test_keep_alive_disabled(self, request_mock):
+        request_mock.return_value = make_response()
+        RpcNode('http://localhost:8732', keep_alive=False).get('version')
+        self.assertEqual('close', request_mock.call_args.kwargs['headers']['connection'])
+
+    def test_copy_and_pickle(self):
+        node = RpcMultiNode(['http://a:8732', 'http://b:8732'], pool_maxsize=2)
+        _ = node.nodes[0].session
+        self.assertIs(node, deepcopy(node))
+        restored = pickle.loads(pickle.dumps(node))
+        self.assertEqual(node.uri, restored.uri)
+        self.assertEqual(2, restored.nodes[1].pool_maxsize)
+        self.assertIsNone(restored.nodes[0]._session)
+
+    @patch('requests.Session.request')
+    def test_multi_node_pools(self, request_mock):
+        request_mock.return_value = make_response()
+        node = RpcMultiNode(['http://a:8732', 'http://b:8732'], health_check_interval=None)
+        for _ in range(4):
+            node.get('version')
+        urls = {call.kwargs['url'] for call in request_mock.call_args_list}
+        self.assertEqual({'http://a:8732/version', 'http://b:8732/version'}, urls)
+        self.assertIsNot(node.nodes[0].session, node.nodes[1].session)
+
+    @patch('requests.Session.request')
+    def test_coalescing(self, request_mock):
+        def respond(method, url, **kwargs):
+            sleep(0.2)
+            return make_response(b'{"minimal_block_delay": "15"}')
+
+        request_mock.side_effect = respond
+        node = RpcNode('http://localhost:8732')
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(lambda _: node.get('chains/main/blocks/head/context/constants'), range(8)))
+
+        self.assertEqual(1, request_mock.call_count)
+        self.assertEqual(7, node.coalesced)
+        self.assertTrue(all(res == results[0] and res is not results[0] for res in results[1:]))
+
+    @patch('requests.Session.request')
+    def test_coalescing_error(self, request_mock):
+        def respond(method, url, **kwargs):
+            sleep(0.2)
+            return make_response(b'Not found', status_code=404)
+
+        request_mock.side_effect = respond
+        node = RpcNode('http://localhost:8732')
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(node.get, 'chains/main/blocks/head/context/contracts/KT1') for _ in range(4)]
+        self.assertTrue(all(isinstance(future.exception(), RpcError) for future in futures))
+        self.assertEqual(1, request_mock.call_count)
+        self.assertEqual({}, node._in_flight)
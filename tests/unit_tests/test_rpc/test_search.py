@@ -0,0 +1,112 @@
+import re
+from threading import Lock
+from time import sleep
+from unittest import TestCase
+
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.search import find_state_change
+from pytezos.rpc.search import find_state_changes
+from pytezos.rpc.search import prefetch
+from pytezos.rpc.shell import ShellQuery
+
+
+class FakeNode(RpcNode):
+    """Chain of 100 blocks, operation `oo{level}` is included at every 10th level."""
+
+    def __init__(self):
+        super().__init__('http://localhost:8732')
+        self.paths = []
+        self.active = self.max_active = 0
+        self._lock = Lock()
+
+    def get(self, path, params=None, timeout=None):
+        with self._lock:
+            self.paths.append(path)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        sleep(0.01)
+        with self._lock:
+            self.active -= 1
+
+        level = re.match(r'/chains/main/blocks/(\w+)', path).group(1)
+        level = 100 if level == 'head' else int(level)
+        if path.endswith('/header'):
+            return {'level': level, 'hash': f'B{level}'}
+        if path.endswith('/operation_hashes'):
+            return [[], [], [], [f'oo{level}'] if level % 10 == 0 else []]
+        if re.search(r'/operations/3/0$', path):
+            return {'hash': f'oo{level}'}
+        raise NotImplementedError(path)
+
+
+class TestBlockSliceQuery(TestCase):
+    def test_prefetch_order(self):
+        res = list(prefetch(lambda x: sleep(0.001 * (x % 3)) or x * x, range(50), concurrency=4))
+        self.assertEqual([x * x for x in range(50)], res)
+
+    def test_prefetch_stops_early(self):
+        calls = []
+        results = prefetch(calls.append, range(1000), concurrency=2, buffer_size=4)
+        next(results)
+        results.close()
+        self.assertLessEqual(len(calls), 5)
+
+    def test_iter_blocks(self):
+        node = FakeNode()
+        headers = list(ShellQuery(node).blocks[10:40].iter_blocks('header', concurrency=4))
+        self.assertEqual(list(range(10, 41)), [header['level'] for header in headers])
+        self.assertGreater(node.max_active, 1)
+        self.assertLessEqual(node.max_active, 4)
+
+    def test_find_operation(self):
+        node = FakeNode()
+        res = ShellQuery(node).blocks[10:100].find_operation('oo30', concurrency=4)
+        self.assertEqual({'hash': 'oo30'}, res)
+        self.assertIn('/chains/main/blocks/30/operations/3/0', node.paths)
+        with self.assertRaises(StopIteration):
+            ShellQuery(node).blocks[11:19].find_operation('oo30')
+
+
+class TestStateChanges(TestCase):
+    change_levels = [57, 130, 131, 400, 401, 402, 999]
+
+    def get(self, level):
+        with self.lock:
+            self.calls.append(level)
+        return sum(1 for x in self.change_levels if x <= level)
+
+    def setUp(self):
+        self.calls = []
+        self.lock = Lock()
+
+    def test_find_state_changes(self):
+        for arity in (2, 3, 8):
+            with self.subTest(arity=arity):
+                self.calls.clear()
+                res = list(find_state_changes(head=1000, last=0, get=self.get, equals=lambda x, y: x == y, arity=arity))
+                self.assertEqual(self.change_levels, sorted(level for level, _ in res))
+                self.assertEqual(len(self.calls), len(set(self.calls)))
+
+    def test_find_state_changes_empty_range(self):
+        self.assertEqual([], list(find_state_changes(head=100, last=100, get=self.get, equals=lambda x, y: x == y)))
+        self.assertEqual([], self.calls)
+
+    def test_find_state_change_rounds(self):
+        rounds = {}
+        for arity in (2, 16):
+            self.calls.clear()
+            level, value = find_state_change(
+                head=4096, last=0, get=self.get, equals=lambda x, y: x == y, pred_value=0, arity=arity
+            )
+            self.assertEqual((57, 1), (level, value))
+            rounds[arity] = len(self.calls)
+        self.assertEqual(12, rounds[2])  # log2(4096) sequential probes
+        self.assertLessEqual(rounds[16], 3 * 15)  # log16(4096) rounds of 15 concurrent probes
+
+    def test_find_state_change_invalid_arity(self):
+        for arity in (0, 1):
+            with self.subTest(arity=arity), self.assertRaises(ValueError):
+                find_state_change(
+                    head=4096, last=0, get=self.get, equals=lambda x, y: x == y, pred_value=0, arity=arity
+                )
+        self.assertEqual([], self.calls)
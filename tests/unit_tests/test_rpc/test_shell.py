@@ -0,0 +1,104 @@
+import re
+from typing import List
+from unittest import TestCase
+from unittest.mock import patch
+
+import requests
+import simplejson as json
+
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ConfirmationTracker
+from pytezos.rpc.shell import ShellQuery
+
+
+class FakeStream:
+    def __init__(self, chunks: List, error: bool = False):
+        self.chunks = [json.dumps(chunk).encode() + b'\n' for chunk in chunks]
+        self.error = error
+        self.closed = False
+
+    def iter_content(self, chunk_size=None):
+        yield from self.chunks
+        if self.error:
+            raise requests.exceptions.ChunkedEncodingError('connection broken')
+
+    def close(self):
+        self.closed = True
+
+
+class FakeNode(RpcNode):
+    """Chain at level 100, operation `oo{level}` is included at every level."""
+
+    def __init__(self, head_streams: List[FakeStream]):
+        super().__init__('http://localhost:8732')
+        self.head_streams = head_streams
+        self.paths: List[str] = []
+
+    def get(self, path, params=None, timeout=None):
+        self.paths.append(path)
+        block_id = re.match(r'/chains/main/blocks/(\w+)', path).group(1)
+        level = 100 if block_id == 'head' else int(block_id.lstrip('B'))
+        if path.endswith('/header'):
+            return {'level': level, 'hash': f'B{level}'}
+        if path.endswith('/operation_hashes'):
+            return [[], [], [], [f'oo{level}', f'xx{level}']]
+        match = re.search(r'/operations/3/(\d+)$', path)
+        if match:
+            return {'hash': [f'oo{level}', f'xx{level}'][int(match.group(1))]}
+        raise NotImplementedError(path)
+
+    def request(self, method, path, **kwargs):
+        assert kwargs['stream']
+        if path == '/monitor/heads/main':
+            return self.head_streams.pop(0)
+        raise NotImplementedError(path)
+
+
+class TestMonitorOperations(TestCase):
+    @patch('pytezos.rpc.shell.sleep')
+    def test_monitor_operations(self, sleep_mock):
+        broken = FakeStream([{'level': 100, 'hash': 'B100'}, {'level': 101, 'hash': 'B101'}], error=True)
+        node = FakeNode(
+            head_streams=[
+                broken,
+                FakeStream([{'level': 101, 'hash': 'B101'}, {'level': 103, 'hash': 'B103'}]),
+                FakeStream([{'level': 104, 'hash': 'B104'}, {'level': 105, 'hash': 'B105'}]),
+            ]
+        )
+        operations = ShellQuery(node).wait_operations(
+            opg_hashes=['oo103', 'oo102'],
+            ttl=5,
+            min_confirmations=2,
+            monitor=True,
+        )
+        self.assertEqual([{'hash': 'oo102'}, {'hash': 'oo103'}], operations)
+        self.assertTrue(broken.closed)
+        self.assertEqual([], node.head_streams)
+        # missed level 102 is checked, contents are fetched only for matching operations
+        self.assertIn('/chains/main/blocks/102/operation_hashes', node.paths)
+        self.assertEqual(2, len([path for path in node.paths if '/operations/' in path]))
+
+    @patch('pytezos.rpc.shell.sleep')
+    def test_monitor_operations_ttl(self, sleep_mock):
+        node = FakeNode(head_streams=[FakeStream([{'level': 101, 'hash': 'B101'}, {'level': 102, 'hash': 'B102'}])])
+        with self.assertRaises(StopIteration):
+            ShellQuery(node).wait_operations(opg_hashes=['unknown'], ttl=2, min_confirmations=1, monitor=True)
+
+
+class TestConfirmationTracker(TestCase):
+    def test_bookkeeping(self):
+        tracker = ConfirmationTracker(['oo1', 'oo2', 'oo3'], min_confirmations=2)
+        tracker.update_mempool({'oo1', 'oo2'})
+        self.assertEqual({'oo1', 'oo2'}, tracker.pending)
+
+        self.assertEqual([(3, 1)], tracker.find_included('B1', [[], [], [], ['xx1', 'oo1']]))
+        tracker.confirm()
+        self.assertEqual({'oo2'}, tracker.pending)
+        self.assertFalse(tracker.all_included)
+        self.assertEqual('Only 1 of 3 operations were included, stopping', tracker.not_included_message())
+
+        # already included operations are not reported twice
+        self.assertEqual([(0, 0), (3, 0)], tracker.find_included('B2', [['oo3'], [], [], ['oo2', 'oo1']]))
+        tracker.confirm()
+        self.assertTrue(tracker.all_included)
+        self.assertEqual({'oo1': 2, 'oo2': 1, 'oo3': 1}, tracker.confirmations)
@@ -0,0 +1,81 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import simplejson as json
+from parameterized import parameterized  # type: ignore
+
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.shell import ShellQuery
+from pytezos.rpc.stream import JsonStreamDecoder
+from pytezos.rpc.stream import iter_json
+
+operations = [
+    [{'hash': 'oo1', 'contents': [{'kind': 'transaction', 'parameters': {'value': {'string': 'a\\"],{'}}}]}],
+    [],
+    [{'hash': 'oo2', 'contents': []}, {'hash': 'oo3', 'contents': [{'amount': '1'}]}],
+    [],
+]
+
+
+def split(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+class TestJsonStreamDecoder(TestCase):
+    @parameterized.expand([(1,), (2,), (5,), (64,), (4096,)])
+    def test_unwrap_array(self, size):
+        data = json.dumps(operations, indent=2).encode()
+        self.assertEqual(operations, list(iter_json(split(data, size))))
+
+    @parameterized.expand([(b'{"a": [1, 2]}', [{'a': [1, 2]}]), (b'"hash"', ['hash']), (b'42', [42]), (b'[]', [])])
+    def test_non_array(self, data, expected):
+        self.assertEqual(expected, list(iter_json(split(data, 1))))
+
+    @parameterized.expand([(1,), (3,), (4096,)])
+    def test_concatenated_values(self, size):
+        data = b'{"level": 1}\n{"level": 2}\n"BLockHash"\n[1, 2]\n7\n'
+        expected = [{'level': 1}, {'level': 2}, 'BLockHash', [1, 2], 7]
+        self.assertEqual(expected, list(iter_json(split(data, size), unwrap=False)))
+
+    @parameterized.expand(
+        [
+            ([b'[1.', b'5, 2]'], [1.5, 2]),
+            ([b'[1e', b'3, -', b'2]'], [1e3, -2]),
+            ([b'[2.5E', b'-2', b']'], [2.5e-2]),
+            ([b'[10', b'0 , 1]'], [100, 1]),
+        ]
+    )
+    def test_split_number(self, chunks, expected):
+        self.assertEqual(expected, list(iter_json(chunks)))
+
+    def test_split_number_concatenated(self):
+        self.assertEqual([1.5, {'a': 1}], list(iter_json([b'1.', b'5 {"a": 1}'], unwrap=False)))
+
+    def test_bounded_buffer(self):
+        decoder = JsonStreamDecoder()
+        decoder.feed(b'[')
+        for i in range(1000):
+            self.assertEqual([{'i': i}], decoder.feed(json.dumps({'i': i}).encode() + b','))
+            self.assertLess(len(decoder._buffer), 16)
+        self.assertEqual([{'i': 1000}], decoder.feed(b'{"i": 1000}]'))
+
+    @parameterized.expand([(b'[1, 2',), (b'{"a": "b',), (b'[1] 2',)])
+    def test_malformed(self, data):
+        with self.assertRaises(ValueError):
+            list(iter_json([data]))
+
+
+class TestRpcQueryIter(TestCase):
+    @patch('requests.Session.request')
+    def test_iter(self, request_mock):
+        res = MagicMock()
+        res.status_code = 200
+        res.iter_content.side_effect = lambda chunk_size: iter(split(json.dumps(operations).encode(), 7))
+        request_mock.return_value = res
+
+        shell = ShellQuery(RpcNode('http://localhost:8732'))
+        self.assertEqual(operations, list(shell.blocks[100].operations.iter()))
+        self.assertTrue(request_mock.call_args.kwargs['stream'])
+        self.assertTrue(request_mock.call_args.kwargs['url'].endswith('/chains/main/blocks/100/operations'))
+        res.close.assert_called_once()
@@ -0,0 +1,53 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from pytezos.logging import logger
+from pytezos.rpc.errors import RpcError
+from pytezos.rpc.node import RpcNode
+from pytezos.rpc.tracing import LatencyHistogram
+from pytezos.rpc.tracing import RpcTracer
+from pytezos.rpc.tracing import get_path_template
+from tests.unit_tests.test_rpc.test_node import make_response
+
+
+class TestRpcTracing(TestCase):
+    def test_path_template(self):
+        self.assertEqual('/chains/{}/blocks/{}/operations', get_path_template('chains/main/blocks/123/operations'))
+        self.assertEqual(
+            '/chains/{}/blocks/{}/context/contracts/{}/storage',
+            get_path_template(
+                '/chains/main/blocks/head~2/context/contracts/KT1HvY3n7BaRBZ3TQyGfRuqPixBpwzEMrdeE/storage'
+            ),
+        )
+        self.assertEqual('/monitor/heads/{}', get_path_template('monitor/heads/main'))
+
+    def test_histogram(self):
+        histogram = LatencyHistogram(buckets=(0.1, 1.0))
+        for latency in (0.05, 0.05, 0.5, 2.0):
+            histogram.observe(latency)
+        self.assertEqual(0.1, histogram.percentile(50))
+        self.assertEqual(1.0, histogram.percentile(75))
+        self.assertEqual(2.0, histogram.percentile(99))
+
+    @patch('simplejson.dumps')
+    @patch('requests.Session.request')
+    def test_hooks(self, request_mock, dumps_mock):
+        request_mock.side_effect = [make_response(b'{"level": 1}'), make_response(b'[]', status_code=500)]
+        self.addCleanup(logger.setLevel, logger.level)
+        logger.setLevel('INFO')  # other tests might have enabled debug logging
+        requests, traces = [], []
+        tracer = RpcTracer()
+        tracer.add_pre_hook(lambda method, path, kwargs: requests.append((method, path)))
+        tracer.add_post_hook(traces.append)
+        node = RpcNode('http://localhost:8732', tracer=tracer)
+
+        node.get('chains/main/blocks/10/header')
+        with self.assertRaises(RpcError):
+            node.get('chains/main/blocks/11/header')
+
+        self.assertEqual([('GET', 'chains/main/blocks/10/header'), ('GET', 'chains/main/blocks/11/header')], requests)
+        self.assertEqual([200, 500], [trace.status for trace in traces])
+        self.assertEqual(12, traces[0].size)
+        self.assertIsInstance(traces[1].error, RpcError)
+        self.assertEqual(2, tracer.stats()['/chains/{}/blocks/{}/header']['count'])
+        dumps_mock.assert_not_called()